@@ -8,6 +8,9 @@ Enthält die fünf Kern-Metriken (Core-5):
 - FD (Fractal Dimension)
 - PF (Power Flux)
 
+samt vektorisierter Engine für viele Reihen auf einmal (``metrics_batch``)
+und gleitenden Akkumulatoren für Live-Sessions (``metrics_stream``).
+
 Zusätzlich: Evidence Routing Kernel v0.1a (bewusst kleine, stabile Exports)
 sowie die nicht-ausführende Action-Gate-Schnittstelle v0.1.
 """
@@ -19,6 +22,7 @@ from .action_gate import (
     ResponsibilityClass,
     build_action_proposal,
 )
+from .batch_replay import BatchReplayReport, StreamReplaySummary, replay_streams
 from .bridge_view import (
     BridgeView,
     BridgeViewError,
@@ -48,17 +52,32 @@ from .evidence_routing import (
     Retraction,
     TransitionRequest,
     apply_approved_transition,
+    compute_collection_digests,
     compute_permitted_transitions,
     compute_state_digest,
     evaluate_transition_request,
+    iter_public_export_ndjson,
     load_claim_policy,
     normalize_claim_tag,
     record_human_decision,
     record_retraction,
     reduce_public_export,
     replay_events,
+    replay_jsonl,
 )
+from .incremental_export import IncrementalPublicExporter, PublicExportUpdate
 from .metrics import eci, fd, mi, pf, plv
+from .metrics_batch import eci_batch, fd_batch, higuchi_curve, mi_batch, pf_batch, plv_batch
+from .metrics_stream import StreamingECI, StreamingMI, StreamingPF, StreamingPLV
+from .mutual_info import ksg_mi, mutual_information, pairwise_mi
+from .replay_checkpoint import (
+    ReplayCheckpoint,
+    ResumedReplay,
+    create_replay_checkpoint,
+    replay_checkpoint_from_dict,
+    restore_replay_state,
+    resume_replay_jsonl,
+)
 
 __all__ = [
     # Core-5 Metriken
@@ -67,6 +86,22 @@ __all__ = [
     "mi",
     "fd",
     "pf",
+    # Core-5 vektorisiert — ein Ergebnis je Zeile eines (n_series, n_samples)-Arrays
+    "eci_batch",
+    "plv_batch",
+    "mi_batch",
+    "fd_batch",
+    "higuchi_curve",
+    "pf_batch",
+    # Core-5 gleitend — O(1) je Sample über die letzten N Samples
+    "StreamingECI",
+    "StreamingPLV",
+    "StreamingPF",
+    "StreamingMI",
+    # MI-Schätzer — Histogramm (sqrt/fd/knuth-Bins) und KSG, auch paarweise
+    "mutual_information",
+    "pairwise_mi",
+    "ksg_mi",
     # Evidence Routing Kernel v0.1a — Kernmodelle
     "MaterialRef",
     "ClaimCandidate",
@@ -89,8 +124,24 @@ __all__ = [
     "apply_approved_transition",
     "record_retraction",
     "replay_events",
+    "replay_jsonl",
     "reduce_public_export",
+    "iter_public_export_ndjson",
+    "IncrementalPublicExporter",
+    "PublicExportUpdate",
     "compute_state_digest",
+    "compute_collection_digests",
+    # Replay-Checkpoints — Snapshots gebunden an Policy und Ledger-Hash
+    "ReplayCheckpoint",
+    "ResumedReplay",
+    "create_replay_checkpoint",
+    "replay_checkpoint_from_dict",
+    "restore_replay_state",
+    "resume_replay_jsonl",
+    # Batch-Replay — unabhängige Streams über einen Prozess-Pool
+    "BatchReplayReport",
+    "StreamReplaySummary",
+    "replay_streams",
     # Action-Gate v0.1 — nicht ausführende Schnittstelle
     "ActionProposal",
     "ResponsibilityClass",
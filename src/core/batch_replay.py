@@ -0,0 +1,239 @@
+"""
+src/core/batch_replay.py
+
+Batch-Replay unabhängiger ERK-Eventstreams für den Evidence Routing Kernel v0.1a.
+
+Verteilt viele JSONL-Streams (z.B. Fixture-Korpora oder Tenant-Streams) auf
+einen Prozess-Pool. Alle Worker replayen gegen dieselbe, einmal geladene
+``ClaimPolicy``; das Ergebnis je Stream ist sein ``state_digest`` plus eine
+Zusammenfassung der quarantänisierten Events.
+
+Grenzen:
+- Reihenfolge und Inhalt des Reports hängen nur von Eingabeliste, Streams und
+  Policy ab, nicht von Worker-Zahl, Chunking oder Laufzeit (Invariante 10).
+- Replay bleibt fail-closed: Ablehnungen stehen im Report, nichts wird
+  repariert. Nicht lesbare Streams, Fehler beim Replay eines Streams und
+  Zeitüberschreitungen werden als eigener Status berichtet, nie still
+  ausgelassen; ein fehlerhafter Stream bricht den Batch nicht ab.
+- Streams werden nur gelesen.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import time
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .evidence_routing import ClaimPolicy, load_claim_policy, replay_jsonl
+
+ERK_BATCH_REPORT_SCHEMA_VERSION = "erk_batch_replay.v0.1"
+
+STREAM_OK = "OK"
+STREAM_ERROR = "ERROR"
+STREAM_TIMEOUT = "TIMEOUT"
+
+
+@dataclass(frozen=True)
+class StreamReplaySummary:
+    """Replay-Ergebnis eines einzelnen Streams (ohne Zustand, nur Digest)."""
+
+    stream: str
+    status: str
+    state_digest: str | None
+    claims: int
+    retags: int
+    rejected_events: int
+    rejection_reason_codes: dict[str, int]
+    warnings: int
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchReplayReport:
+    """Stabiler Gesamtreport; ``report_digest`` bindet Policy und alle Streams."""
+
+    report_schema_version: str
+    policy_version: str
+    policy_digest: str
+    streams: list[StreamReplaySummary]
+    totals: dict[str, int]
+    report_digest: str
+
+    @property
+    def ok(self) -> bool:
+        return all(summary.status == STREAM_OK for summary in self.streams)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+# Policy des Worker-Prozesses; einmal je Worker über den Pool-Initializer gesetzt.
+_WORKER_POLICY: ClaimPolicy | None = None
+
+
+def _init_worker(policy: ClaimPolicy) -> None:
+    global _WORKER_POLICY
+    _WORKER_POLICY = policy
+
+
+def _replay_chunk(streams: Sequence[str]) -> list[StreamReplaySummary]:
+    policy = _WORKER_POLICY if _WORKER_POLICY is not None else load_claim_policy()
+    return [_replay_one(stream, policy) for stream in streams]
+
+
+def _replay_one(stream: str, policy: ClaimPolicy) -> StreamReplaySummary:
+    try:
+        state = replay_jsonl(Path(stream), policy=policy)
+    except OSError as exc:
+        return _failed_summary(stream, STREAM_ERROR, f"{type(exc).__name__}: {exc.strerror or exc}")
+    except Exception as exc:  # noqa: BLE001 - Fehler eines Streams betreffen nur ihn
+        return _error_summary(stream, exc)
+    reason_codes: Counter[str] = Counter()
+    for entry in state.rejected_events:
+        reason_codes.update(entry.get("reason_codes", []))
+    return StreamReplaySummary(
+        stream=stream,
+        status=STREAM_OK,
+        state_digest=state.state_digest,
+        claims=len(state.claims),
+        retags=len(state.retag_history),
+        rejected_events=len(state.rejected_events),
+        rejection_reason_codes=dict(sorted(reason_codes.items())),
+        warnings=len(state.warnings),
+    )
+
+
+def _error_summary(stream: str, exc: BaseException) -> StreamReplaySummary:
+    return _failed_summary(stream, STREAM_ERROR, f"{type(exc).__name__}: {exc}")
+
+
+def _failed_summary(stream: str, status: str, error: str) -> StreamReplaySummary:
+    return StreamReplaySummary(
+        stream=stream,
+        status=status,
+        state_digest=None,
+        claims=0,
+        retags=0,
+        rejected_events=0,
+        rejection_reason_codes={},
+        warnings=0,
+        error=error,
+    )
+
+
+def replay_streams(
+    streams: Sequence[str | Path],
+    *,
+    policy: ClaimPolicy | None = None,
+    workers: int | None = None,
+    chunksize: int = 1,
+    timeout: float | None = None,
+) -> BatchReplayReport:
+    """Unabhängige JSONL-Streams replayen, bei Bedarf parallel.
+
+    ``workers`` ist die Zahl der Worker-Prozesse (None = CPU-Anzahl; 0 oder 1
+    replayt seriell im aufrufenden Prozess). ``chunksize`` Streams bilden eine
+    Aufgabe. ``timeout`` ist das Zeitbudget des gesamten Batches in Sekunden;
+    danach nicht fertige Streams erhalten den Status TIMEOUT und der Pool wird
+    beendet. Der Report listet die Streams in Eingabereihenfolge.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be >= 1, got {chunksize}")
+    if workers is not None and workers < 0:
+        raise ValueError(f"workers must be >= 0, got {workers}")
+    if policy is None:
+        policy = load_claim_policy()
+    names = [str(stream) for stream in streams]
+    chunks = [names[start : start + chunksize] for start in range(0, len(names), chunksize)]
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    workers = min(workers, len(chunks))
+    if workers <= 1:
+        summaries = _replay_serial(chunks, policy, timeout)
+    else:
+        summaries = _replay_parallel(chunks, policy, workers, timeout)
+    return _build_report(policy, summaries)
+
+
+def _replay_serial(
+    chunks: Sequence[Sequence[str]], policy: ClaimPolicy, timeout: float | None
+) -> list[StreamReplaySummary]:
+    deadline = None if timeout is None else time.monotonic() + timeout
+    summaries: list[StreamReplaySummary] = []
+    for chunk in chunks:
+        for stream in chunk:
+            if deadline is not None and time.monotonic() >= deadline:
+                summaries.append(_timeout_summary(stream, timeout))
+            else:
+                summaries.append(_replay_one(stream, policy))
+    return summaries
+
+
+def _replay_parallel(
+    chunks: Sequence[Sequence[str]], policy: ClaimPolicy, workers: int, timeout: float | None
+) -> list[StreamReplaySummary]:
+    deadline = None if timeout is None else time.monotonic() + timeout
+    summaries: list[StreamReplaySummary] = []
+    # spawn statt fork: Worker erben keine Locks/Threads des Aufrufers und
+    # verhalten sich auf allen Plattformen gleich.
+    pool = multiprocessing.get_context("spawn").Pool(
+        processes=workers, initializer=_init_worker, initargs=(policy,)
+    )
+    try:
+        pending = [pool.apply_async(_replay_chunk, (list(chunk),)) for chunk in chunks]
+        for chunk, result in zip(chunks, pending):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                summaries.extend(result.get(timeout=remaining))
+            except multiprocessing.TimeoutError:
+                summaries.extend(_timeout_summary(stream, timeout) for stream in chunk)
+            except Exception as exc:  # noqa: BLE001 - z.B. Ergebnis nicht übertragbar
+                # Wie seriell: der Chunk wird als ERROR berichtet, der Batch läuft weiter.
+                summaries.extend(_error_summary(stream, exc) for stream in chunk)
+        pool.close()
+    finally:
+        # Auch nach Timeout: hängende Worker werden beendet, nicht abgewartet.
+        pool.terminate()
+        pool.join()
+    return summaries
+
+
+def _timeout_summary(stream: str, timeout: float | None) -> StreamReplaySummary:
+    return _failed_summary(stream, STREAM_TIMEOUT, f"batch timeout of {timeout}s exceeded")
+
+
+def _build_report(policy: ClaimPolicy, summaries: list[StreamReplaySummary]) -> BatchReplayReport:
+    statuses = Counter(summary.status for summary in summaries)
+    totals = {
+        "streams": len(summaries),
+        "ok": statuses[STREAM_OK],
+        "error": statuses[STREAM_ERROR],
+        "timeout": statuses[STREAM_TIMEOUT],
+        "claims": sum(summary.claims for summary in summaries),
+        "retags": sum(summary.retags for summary in summaries),
+        "rejected_events": sum(summary.rejected_events for summary in summaries),
+        "warnings": sum(summary.warnings for summary in summaries),
+    }
+    body = {
+        "report_schema_version": ERK_BATCH_REPORT_SCHEMA_VERSION,
+        "policy_version": policy.version,
+        "policy_digest": policy.digest,
+        "streams": [asdict(summary) for summary in summaries],
+        "totals": totals,
+    }
+    serialized = json.dumps(body, sort_keys=True, separators=(",", ":"), allow_nan=False)
+    return BatchReplayReport(
+        report_schema_version=ERK_BATCH_REPORT_SCHEMA_VERSION,
+        policy_version=policy.version,
+        policy_digest=policy.digest,
+        streams=summaries,
+        totals=totals,
+        report_digest=hashlib.sha256(serialized.encode("utf-8")).hexdigest(),
+    )
@@ -1,14 +1,18 @@
 """
 src/core/eci.py
 Simple Ethical Consent Index (ECI) implementation with bootstrap and permutation helpers.
+Resampling is vectorised and seeded (numpy.random.Generator, one SeedSequence child
+per chunk), see resample_statistics.
 
 ECI = w1*likert_norm + w2*behavior_proxy + w3*physio_proxy_norm
 Weights must sum to 1 (function normalizes otherwise).
 """
 
 import json
+import multiprocessing
 import os
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, Union
 
 import numpy as np
 
@@ -58,34 +62,191 @@ def compute_eci(
     return clamp01(eci)
 
 
+# -----------------------
+# Vectorised bootstrap & permutation engine
+# -----------------------
+# Index-matrix cells drawn per chunk (int64 indices plus gathered values, ~64 MB);
+# bounds memory independently of the number of resamples.
+RESAMPLE_CHUNK_CELLS = 1 << 22
+
+SeedLike = Union[int, np.random.SeedSequence, None]
+
+# Values of the worker process; set once per worker via the pool initializer.
+_worker_values: Optional[np.ndarray] = None
+
+
+@dataclass(frozen=True)
+class ResampleSummary:
+    """Bootstrap CI of the mean and one-sided p-value against ``null_mean``, from one draw."""
+
+    mean: float
+    ci: tuple[float, float]
+    null_mean: float
+    p_value: float
+    n_resamples: int
+
+
+def _init_resample_worker(values: np.ndarray) -> None:
+    global _worker_values
+    _worker_values = values
+
+
+def _resample_chunk(
+    values: np.ndarray, rows: int, seed: np.random.SeedSequence, replace: bool, split: Optional[int]
+) -> np.ndarray:
+    """Statistic of ``rows`` resamples drawn as one ``(rows, n)`` index matrix."""
+    rng = np.random.default_rng(seed)
+    n = values.size
+    if replace:
+        index = rng.integers(0, n, size=(rows, n))
+    else:
+        index = rng.permuted(np.tile(np.arange(n), (rows, 1)), axis=1)
+    sample = values[index]
+    statistic: np.ndarray
+    if split is None:
+        statistic = sample.mean(axis=1)
+    else:
+        statistic = sample[:, :split].mean(axis=1) - sample[:, split:].mean(axis=1)
+    return statistic
+
+
+def _resample_worker_chunk(task: tuple) -> np.ndarray:
+    if _worker_values is None:
+        raise RuntimeError("resample worker was started without _init_resample_worker")
+    return _resample_chunk(_worker_values, *task)
+
+
+def resample_statistics(
+    values: list[float],
+    n_resamples: int,
+    *,
+    replace: bool = True,
+    split: Optional[int] = None,
+    seed: SeedLike = None,
+    workers: Optional[int] = 1,
+    chunk_cells: int = RESAMPLE_CHUNK_CELLS,
+) -> np.ndarray:
+    """
+    Draw ``n_resamples`` resamples of ``values`` and return one statistic per resample.
+
+    replace=True draws bootstrap samples, replace=False permutations. The statistic is
+    the resample mean, or with ``split`` the difference between the means of the first
+    ``split`` and the remaining positions (two-sample permutation test).
+
+    Resamples are drawn in chunks of at most ``chunk_cells`` index cells. Each chunk
+    gets its own child of ``SeedSequence(seed)``, so a fixed seed gives the same result
+    for any ``workers`` (None = CPU count; 0 or 1 = serial in this process).
+    """
+    if n_resamples < 1:
+        raise ValueError(f"n_resamples must be >= 1, got {n_resamples}")
+    if workers is not None and workers < 0:
+        raise ValueError(f"workers must be >= 0, got {workers}")
+    arr = np.asarray(values, dtype=np.float64).ravel()
+    n = arr.size
+    if split is not None and not 0 < split < n:
+        raise ValueError(f"split must lie strictly between 0 and {n}, got {split}")
+    if n == 0:
+        return np.full(n_resamples, np.nan)
+
+    rows_per_chunk = max(1, chunk_cells // n)
+    sizes = [
+        min(rows_per_chunk, n_resamples - start) for start in range(0, n_resamples, rows_per_chunk)
+    ]
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    tasks = [
+        (rows, child, replace, split) for rows, child in zip(sizes, seed_seq.spawn(len(sizes)))
+    ]
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    workers = min(workers, len(tasks))
+    statistics: np.ndarray
+    if workers <= 1:
+        statistics = np.concatenate([_resample_chunk(arr, *task) for task in tasks])
+    else:
+        with multiprocessing.get_context("spawn").Pool(
+            processes=workers, initializer=_init_resample_worker, initargs=(arr,)
+        ) as pool:
+            statistics = np.concatenate(pool.map(_resample_worker_chunk, tasks))
+    return statistics
+
+
+def resample_summary(
+    values: list[float],
+    null_mean: float,
+    n_resamples: int = 1000,
+    ci: float = 0.95,
+    *,
+    seed: SeedLike = None,
+    workers: Optional[int] = 1,
+) -> ResampleSummary:
+    """
+    Bootstrap CI of the mean of ``values`` and the one-sided p-value of
+    H0: mean == null_mean against H1: mean > null_mean, both reduced from the same
+    resample means.
+
+    The p-value is taken from the null-centred bootstrap: the values shifted by
+    ``null_mean - mean``, whose resample means are the drawn means shifted alike.
+    It is P(null-centred mean >= sample mean), with the usual +1 correction.
+    """
+    arr = np.asarray(values, dtype=np.float64).ravel()
+    means = resample_statistics(arr, n_resamples, seed=seed, workers=workers)
+    if arr.size == 0:
+        mean = lower = upper = 0.0
+        p = 1.0
+    else:
+        mean = float(arr.mean())
+        lower, upper = np.percentile(means, [(1 - ci) / 2 * 100, (1 + ci) / 2 * 100])
+        null_means = means + (null_mean - mean)
+        p = (np.count_nonzero(null_means >= mean) + 1) / (n_resamples + 1)
+    return ResampleSummary(
+        mean=mean,
+        ci=(float(lower), float(upper)),
+        null_mean=float(null_mean),
+        p_value=float(p),
+        n_resamples=n_resamples,
+    )
+
+
 # -----------------------
 # Simple bootstrap & permutation helpers for validation
 # -----------------------
 def bootstrap_ci(
-    values: list[float], n_bootstrap: int = 1000, ci: float = 0.95
+    values: list[float],
+    n_bootstrap: int = 1000,
+    ci: float = 0.95,
+    *,
+    seed: SeedLike = None,
+    workers: Optional[int] = 1,
 ) -> tuple[float, float]:
-    arr = np.array(values)
-    n = len(arr)
-    if n == 0:
+    if len(values) == 0:
         return (0.0, 0.0)
-    means = []
-    for _ in range(n_bootstrap):
-        sample = np.random.choice(arr, size=n, replace=True)
-        means.append(sample.mean())
-    lower = np.percentile(means, (1 - ci) / 2 * 100)
-    upper = np.percentile(means, (1 + ci) / 2 * 100)
+    means = resample_statistics(values, n_bootstrap, seed=seed, workers=workers)
+    lower, upper = np.percentile(means, [(1 - ci) / 2 * 100, (1 + ci) / 2 * 100])
     return float(lower), float(upper)
 
 
-def permutation_test(observed: float, samples: list[float], n_perm: int = 1000) -> float:
-    arr = np.array(samples)
-    count = 0
-    for _ in range(n_perm):
-        perm = np.random.permutation(arr)
-        if perm.mean() >= observed:
-            count += 1
-    p = (count + 1) / (n_perm + 1)
-    return float(p)
+def permutation_test(
+    observed: float,
+    samples: list[float],
+    n_perm: int = 1000,
+    *,
+    split: Optional[int] = None,
+    seed: SeedLike = None,
+    workers: Optional[int] = 1,
+) -> float:
+    """
+    One-sided permutation p-value (count + 1) / (n_perm + 1) of ``observed``.
+
+    Without ``split`` the statistic is the mean of the permuted samples, as before; a
+    permutation leaves that mean unchanged, so pass ``split`` (size of the first group)
+    and the observed difference of group means for a two-sample test.
+    """
+    stats = resample_statistics(
+        samples, n_perm, replace=False, split=split, seed=seed, workers=workers
+    )
+    count = np.count_nonzero(stats >= observed)
+    return float((count + 1) / (n_perm + 1))
 
 
 # -----------------------
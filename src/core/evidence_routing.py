@@ -19,16 +19,22 @@ automatische Claim-Promotion aus.
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import json
-from collections.abc import Mapping, Sequence
-from dataclasses import asdict, dataclass, field
+import operator
+import threading
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import asdict, dataclass, field, replace
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
+from .ledger import open_ledger_stream
+
 # ---------------------------------------------------------------------------
 # Schema- und Vokabular-Konstanten
 # ---------------------------------------------------------------------------
@@ -36,6 +42,12 @@ import yaml
 ERK_SCHEMA_VERSION = "erk.v0.1"
 ERK_EXPORT_SCHEMA_VERSION = "erk_public_export.v0.2"
 
+# State-Digest-Modi: "compat" = SHA-256 über den Gesamtzustand (Fixture-stabil),
+# "merkle" = Digest über die Digests der einzelnen Sammlungen.
+DIGEST_MODE_COMPAT = "compat"
+DIGEST_MODE_MERKLE = "merkle"
+DIGEST_MODES = frozenset({DIGEST_MODE_COMPAT, DIGEST_MODE_MERKLE})
+
 DEFAULT_CLAIM_POLICY_PATH = (
     Path(__file__).resolve().parents[2] / "policies" / "claim_tags_v0_2.yaml"
 )
@@ -391,65 +403,138 @@ def model_from_payload(cls: type, payload: object) -> Any:
     Unbekannte Zusatzfelder, fehlende Pflichtfelder und falsche Typen führen
     fail-closed zu :class:`EvidenceRoutingError` (EVENT_SCHEMA_INVALID).
     """
-    spec = _MODEL_SPECS.get(cls)
-    if spec is None:
+    validator = _MODEL_VALIDATORS.get(cls)
+    if validator is None:
         raise EvidenceRoutingError(
             f"unknown model class: {cls!r}", [ReasonCode.EVENT_SCHEMA_INVALID]
         )
-    if not isinstance(payload, Mapping):
-        raise EvidenceRoutingError(
-            f"{cls.__name__} payload must be a mapping", [ReasonCode.EVENT_SCHEMA_INVALID]
-        )
+    return validator(payload)
 
-    unknown = set(payload) - set(spec)
-    if unknown:
-        raise EvidenceRoutingError(
-            f"{cls.__name__} payload has unknown fields: {sorted(unknown)}",
-            [ReasonCode.EVENT_SCHEMA_INVALID],
-        )
 
-    data: dict[str, Any] = {}
-    for name, kind in spec.items():
-        if name not in payload:
-            raise EvidenceRoutingError(
-                f"{cls.__name__} payload missing required field: {name}",
-                [ReasonCode.EVENT_SCHEMA_INVALID],
-            )
-        value = payload[name]
-        if kind == _STR:
-            if not isinstance(value, str):
-                raise EvidenceRoutingError(
-                    f"{cls.__name__}.{name} must be a string",
-                    [ReasonCode.EVENT_SCHEMA_INVALID],
-                )
-        elif kind == _NUM:
-            if isinstance(value, bool) or not isinstance(value, (int, float)):
-                raise EvidenceRoutingError(
-                    f"{cls.__name__}.{name} must be a number",
-                    [ReasonCode.EVENT_SCHEMA_INVALID],
-                )
-            value = float(value)
-        elif kind == _STR_LIST:
-            if not isinstance(value, (list, tuple)) or not all(
-                isinstance(item, str) for item in value
-            ):
-                raise EvidenceRoutingError(
-                    f"{cls.__name__}.{name} must be a list of strings",
-                    [ReasonCode.EVENT_SCHEMA_INVALID],
-                )
-            value = list(value)
-        data[name] = value
+def _schema_error(message: str) -> EvidenceRoutingError:
+    return EvidenceRoutingError(message, [ReasonCode.EVENT_SCHEMA_INVALID])
 
-    reason_codes = data.get("reason_codes")
-    if reason_codes is not None:
-        invalid = [code for code in reason_codes if code not in _KNOWN_REASON_CODES]
-        if invalid:
-            raise EvidenceRoutingError(
-                f"{cls.__name__}.reason_codes contains unknown codes: {invalid}",
-                [ReasonCode.EVENT_SCHEMA_INVALID],
+
+def _coerce_str(value: object, message: str) -> str:
+    if not isinstance(value, str):
+        raise _schema_error(message)
+    return value
+
+
+def _coerce_num(value: object, message: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise _schema_error(message)
+    return float(value)
+
+
+def _coerce_str_list(value: object, message: str) -> list[str]:
+    if not isinstance(value, (list, tuple)):
+        raise _schema_error(message)
+    for item in value:
+        if not isinstance(item, str):
+            raise _schema_error(message)
+    return list(value)
+
+
+# Typkürzel -> (Prüf-/Konvertierfunktion, Fehlermeldungs-Suffix)
+_FIELD_COERCERS: dict[str, tuple[Any, str]] = {
+    _STR: (_coerce_str, "must be a string"),
+    _NUM: (_coerce_num, "must be a number"),
+    _STR_LIST: (_coerce_str_list, "must be a list of strings"),
+}
+
+
+_STR_TYPE = frozenset({str})
+_NUM_TYPES = frozenset({int, float})
+
+
+def _field_getter(field_names: list[str]) -> Any:
+    """Werte mehrerer Felder als Tupel lesen (auch für null oder ein Feld)."""
+    if len(field_names) >= 2:
+        return operator.itemgetter(*field_names)
+    return lambda payload: tuple(payload[field_name] for field_name in field_names)
+
+
+def _compile_model_validator(cls: type, spec: Mapping[str, str]) -> Any:
+    """Spezialisierten Validator für ein Modell aus seinem Feldschema erzeugen.
+
+    Feldtabellen und Fehlermeldungen werden einmal vorberechnet; der Validator
+    ist eine Closure darüber. Geprüft wird in fester Reihenfolge: Mapping,
+    unbekannte Felder, je Feld in Spec-Reihenfolge Vorhandensein und Typ,
+    zuletzt bekannte Reason-Codes. Modelle entstehen über ihren regulären
+    ``__init__``.
+    """
+    name = cls.__name__
+    fields = frozenset(spec)
+    table = []
+    for field_name, kind in spec.items():
+        if kind not in _FIELD_COERCERS:
+            raise ValueError(f"unknown field kind in {name} spec: {kind!r}")
+        coerce, suffix = _FIELD_COERCERS[kind]
+        table.append(
+            (
+                field_name,
+                f"{name} payload missing required field: {field_name}",
+                coerce,
+                f"{name}.{field_name} {suffix}",
             )
+        )
+    fields_table = tuple(table)
+    check_codes = "reason_codes" in spec
+    order = tuple(spec)
+    # Schnellpfad für gültige Payloads: Felder je Typkürzel gebündelt prüfen.
+    # Schlägt eine Bündelprüfung fehl, ermittelt die geordnete Schleife den
+    # ersten Fehler — die Meldung bleibt dieselbe wie ohne Schnellpfad.
+    str_getter = _field_getter([f for f, kind in spec.items() if kind == _STR])
+    num_fields = tuple(f for f, kind in spec.items() if kind == _NUM)
+    list_fields = tuple(f for f, kind in spec.items() if kind == _STR_LIST)
+
+    def ordered(payload: Mapping[str, Any]) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        for field_name, missing, coerce, message in fields_table:
+            if field_name not in payload:
+                raise _schema_error(missing)
+            data[field_name] = coerce(payload[field_name], message)
+        return data
+
+    def fast(payload: Mapping[str, Any]) -> dict[str, Any] | None:
+        if len(payload) != len(order) or not set(map(type, str_getter(payload))) <= _STR_TYPE:
+            return None
+        data = {field_name: payload[field_name] for field_name in order}
+        for field_name in num_fields:
+            value = data[field_name]
+            if type(value) not in _NUM_TYPES:
+                return None
+            data[field_name] = float(value)
+        for field_name in list_fields:
+            value = data[field_name]
+            if type(value) is not list or not set(map(type, value)) <= _STR_TYPE:
+                return None
+            data[field_name] = list(value)
+        return data
+
+    def validate(payload: object) -> Any:
+        if not isinstance(payload, Mapping):
+            raise _schema_error(f"{name} payload must be a mapping")
+        if not payload.keys() <= fields:
+            raise _schema_error(
+                f"{name} payload has unknown fields: {sorted(set(payload) - fields)}"
+            )
+        data = fast(payload)
+        if data is None:
+            data = ordered(payload)
+        if check_codes and not _KNOWN_REASON_CODES.issuperset(data["reason_codes"]):
+            invalid = [code for code in data["reason_codes"] if code not in _KNOWN_REASON_CODES]
+            raise _schema_error(f"{name}.reason_codes contains unknown codes: {invalid}")
+        return cls(**data)
 
-    return cls(**data)
+    validate.__name__ = validate.__qualname__ = f"_validate_{name}"
+    return validate
+
+
+_MODEL_VALIDATORS: dict[type, Any] = {
+    cls: _compile_model_validator(cls, spec) for cls, spec in _MODEL_SPECS.items()
+}
 
 
 def normalize_trust(value: object) -> str:
@@ -464,14 +549,51 @@ def normalize_trust(value: object) -> str:
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class TagNormalization:
+    """Ergebnis der Alias-Normalisierung eines Claim-Tags."""
+
+    tag: str
+    known: bool
+    alias_applied: bool
+
+
 @dataclass(frozen=True)
 class ClaimPolicy:
-    """Read-only Sicht auf policies/claim_tags_v0_2.yaml (kein Truth-Maker)."""
+    """Read-only Sicht auf policies/claim_tags_v0_2.yaml (kein Truth-Maker).
+
+    ``tags`` und ``aliases`` werden beim Anlegen schreibgeschützt eingefroren,
+    weil dieselbe Instanz prozessweit geteilt wird (siehe
+    :func:`load_claim_policy`). Die Übergangstabelle und die vorberechneten
+    Normalisierungen machen Tag-Prüfungen zu einzelnen Dict-Lookups.
+    """
 
     version: str
     digest: str
-    tags: dict[str, tuple[str, ...]]
-    aliases: dict[str, str]
+    tags: Mapping[str, tuple[str, ...]]
+    aliases: Mapping[str, str]
+    transitions: Mapping[str, frozenset[str]] = field(init=False, repr=False, compare=False)
+    _normalizations: Mapping[str, TagNormalization] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        tags = MappingProxyType({tag: tuple(nxt) for tag, nxt in self.tags.items()})
+        aliases = MappingProxyType(dict(self.aliases))
+        normalizations = {tag: TagNormalization(tag, True, False) for tag in tags}
+        # Aliase haben Vorrang, auch wenn ein Alias zugleich ein Tagname ist.
+        for alias, target in aliases.items():
+            normalizations[alias] = TagNormalization(target, target in tags, True)
+        object.__setattr__(self, "tags", tags)
+        object.__setattr__(self, "aliases", aliases)
+        object.__setattr__(
+            self,
+            "transitions",
+            MappingProxyType({tag: frozenset(nxt) for tag, nxt in tags.items()}),
+        )
+        object.__setattr__(self, "_normalizations", MappingProxyType(normalizations))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # MappingProxyType ist nicht picklebar; z.B. für Prozess-Pools.
+        return (ClaimPolicy, (self.version, self.digest, dict(self.tags), dict(self.aliases)))
 
     def is_known_tag(self, tag: str) -> bool:
         return tag in self.tags
@@ -479,22 +601,53 @@ class ClaimPolicy:
     def allowed_next(self, tag: str) -> tuple[str, ...]:
         return self.tags.get(tag, ())
 
+    def permits(self, from_tag: str, to_tag: str) -> bool:
+        return to_tag in self.transitions.get(from_tag, ())
 
-@dataclass(frozen=True)
-class TagNormalization:
-    """Ergebnis der Alias-Normalisierung eines Claim-Tags."""
 
-    tag: str
-    known: bool
-    alias_applied: bool
+# Prozessweiter Policy-Cache: Pfad -> (mtime_ns, size, sha256) und
+# sha256 -> ClaimPolicy. Gleiche Bytes ergeben dieselbe Instanz.
+_POLICY_CACHE_LOCK = threading.Lock()
+_POLICY_FILE_KEYS: dict[Path, tuple[int, int, str]] = {}
+_POLICY_BY_DIGEST: dict[str, ClaimPolicy] = {}
 
 
 def load_claim_policy(path: str | Path | None = None) -> ClaimPolicy:
-    """Claim-Tag-Policy read-only laden; Version und SHA-256-Digest erfassen."""
+    """Claim-Tag-Policy read-only laden; Version und SHA-256-Digest erfassen.
+
+    Prozessweit gecacht: Solange aufgelöster Pfad, mtime und Größe gleich
+    bleiben, wird die Datei nicht erneut gelesen. Ändern sie sich, wird neu
+    gelesen und gehasht; nur ein neuer Digest führt zu erneutem YAML-Parsing.
+    """
     policy_path = Path(path) if path is not None else DEFAULT_CLAIM_POLICY_PATH
-    raw = policy_path.read_bytes()
+    resolved = policy_path.resolve()
+    # stat vor dem Lesen: Eine Änderung dazwischen ändert den Schlüssel und
+    # erzwingt beim nächsten Aufruf erneutes Lesen, nie einen veralteten Treffer.
+    stat = resolved.stat()
+    with _POLICY_CACHE_LOCK:
+        cached = _POLICY_FILE_KEYS.get(resolved)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return _POLICY_BY_DIGEST[cached[2]]
+
+    raw = resolved.read_bytes()
     digest = hashlib.sha256(raw).hexdigest()
+    with _POLICY_CACHE_LOCK:
+        policy = _POLICY_BY_DIGEST.get(digest)
+    if policy is None:
+        policy = _parse_claim_policy(raw, digest, policy_path)
+    with _POLICY_CACHE_LOCK:
+        policy = _POLICY_BY_DIGEST.setdefault(digest, policy)
+        _POLICY_FILE_KEYS[resolved] = (stat.st_mtime_ns, stat.st_size, digest)
+    return policy
+
+
+def _clear_claim_policy_cache() -> None:
+    with _POLICY_CACHE_LOCK:
+        _POLICY_FILE_KEYS.clear()
+        _POLICY_BY_DIGEST.clear()
 
+
+def _parse_claim_policy(raw: bytes, digest: str, policy_path: Path) -> ClaimPolicy:
     data = yaml.safe_load(raw)
     if not isinstance(data, Mapping):
         raise EvidenceRoutingError(
@@ -542,13 +695,10 @@ def normalize_claim_tag(tag: str, policy: ClaimPolicy) -> TagNormalization:
     if not isinstance(tag, str):
         raise EvidenceRoutingError("claim tag must be a string", [ReasonCode.EVENT_SCHEMA_INVALID])
     candidate = tag.strip()
-    alias_applied = False
-    if candidate in policy.aliases:
-        candidate = policy.aliases[candidate]
-        alias_applied = True
-    return TagNormalization(
-        tag=candidate, known=policy.is_known_tag(candidate), alias_applied=alias_applied
-    )
+    normalized = policy._normalizations.get(candidate)
+    if normalized is not None:
+        return normalized
+    return TagNormalization(tag=candidate, known=False, alias_applied=False)
 
 
 def compute_permitted_transitions(tag: str, policy: ClaimPolicy) -> tuple[str, ...]:
@@ -644,7 +794,7 @@ def evaluate_transition_request(
         _append_once(codes, ReasonCode.UNKNOWN_TO_TAG)
 
     if from_norm.known and to_norm.known:
-        if to_norm.tag in policy.allowed_next(from_norm.tag):
+        if policy.permits(from_norm.tag, to_norm.tag):
             _append_once(codes, ReasonCode.POLICY_TRANSITION_ALLOWED)
         else:
             stop = True
@@ -942,6 +1092,174 @@ def record_retraction(
 # ---------------------------------------------------------------------------
 
 
+@dataclass
+class _GuardViews:
+    """Typisierte Modellsichten und Tag-/Status-Maps für Guard-Neubewertungen.
+
+    Replay hält diese Sichten beim Anwenden jedes Events synchron zu den
+    serialisierten Records, damit eine Retag-Prüfung nur den eigenen Claim,
+    seine Relationen und Materialien berührt statt den ganzen Zustand neu zu
+    typisieren. Die Sichten sind abgeleitet und gehen nie in den Digest ein.
+    """
+
+    claims: dict[str, ClaimCandidate] = field(default_factory=dict)
+    materials: dict[str, MaterialRef] = field(default_factory=dict)
+    relations: dict[str, EvidenceRelation] = field(default_factory=dict)
+    current_tags: dict[str, str] = field(default_factory=dict)
+    claim_statuses: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class _ReplayIndexes:
+    """Rückwärtsindizes über Record-IDs, in Event-Reihenfolge.
+
+    Replay pflegt sie beim Anwenden jedes Events, damit Order-Prüfungen nicht
+    alle Entscheidungen eines Zustands durchsuchen. Wie die Guard-Sichten sind
+    sie abgeleitet und gehen nie in den Digest oder die Gleichheit ein.
+    """
+
+    human_by_request: dict[str, list[str]] = field(default_factory=dict)
+    guard_by_request: dict[str, list[str]] = field(default_factory=dict)
+    relations_by_claim: dict[str, list[str]] = field(default_factory=dict)
+    requests_by_claim: dict[str, list[str]] = field(default_factory=dict)
+    retractions_by_claim: dict[str, list[str]] = field(default_factory=dict)
+
+
+def _index_add(index: dict[str, list[str]], key: Any, stable_id: str) -> None:
+    index.setdefault(str(key), []).append(stable_id)
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), allow_nan=False)
+
+
+def _sha256_hex(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _record_leaf(stable_id: str, record: Any) -> str:
+    return _sha256_hex(f"{_canonical_json(stable_id)}:{_canonical_json(record)}")
+
+
+@dataclass
+class _RecordCollectionDigest:
+    """Gecachte Merkle-Blätter einer ``stable_id -> record``-Sammlung.
+
+    Jeder Record trägt den SHA-256 seines ``"id":{...}``-Fragments als Blatt;
+    als geändert gemeldete IDs werden beim nächsten Lesen neu gehasht, der
+    Rest bleibt.
+    """
+
+    source: dict[str, Any] | None = None
+    order: list[str] = field(default_factory=list)
+    leaves: list[str] = field(default_factory=list)
+    dirty: set[str] = field(default_factory=set)
+    merkle: str | None = None
+
+    def _position(self, stable_id: str) -> tuple[int, bool]:
+        index = bisect.bisect_left(self.order, stable_id)
+        return index, index < len(self.order) and self.order[index] == stable_id
+
+    def sync(self, records: dict[str, Any]) -> None:
+        pending = sum(1 for stable_id in self.dirty if not self._position(stable_id)[1])
+        if records is not self.source or len(records) != len(self.order) + pending:
+            # Sammlung ersetzt oder außerhalb des Replays verändert: neu aufbauen.
+            self.source = records
+            self.order, self.leaves = [], []
+            self.dirty = set(records)
+            self.merkle = None
+        if not self.dirty:
+            return
+        if 2 * len(self.dirty) >= len(self.order):
+            # Kalt oder überwiegend geändert: einmal sortieren und alles hashen.
+            self.order = sorted(records)
+            self.leaves = [_record_leaf(stable_id, records[stable_id]) for stable_id in self.order]
+        else:
+            self._merge(records, sorted(self.dirty))
+        self.dirty.clear()
+        self.merkle = None
+
+    def _merge(self, records: dict[str, Any], changed: list[str]) -> None:
+        """Sortierte geänderte IDs in einem linearen Durchlauf einarbeiten."""
+        order: list[str] = []
+        leaves: list[str] = []
+        kept = 0
+        for stable_id in changed:
+            index = bisect.bisect_left(self.order, stable_id, kept)
+            order.extend(self.order[kept:index])
+            leaves.extend(self.leaves[kept:index])
+            kept = index
+            if index < len(self.order) and self.order[index] == stable_id:
+                kept += 1
+            if stable_id in records:
+                order.append(stable_id)
+                leaves.append(_record_leaf(stable_id, records[stable_id]))
+        order.extend(self.order[kept:])
+        leaves.extend(self.leaves[kept:])
+        self.order, self.leaves = order, leaves
+
+    def digest(self) -> str:
+        if self.merkle is None:
+            self.merkle = _sha256_hex("\n".join(self.leaves))
+        return self.merkle
+
+
+@dataclass
+class _ListCollectionDigest:
+    """Gecachte Hash-Kette über die Einträge einer append-only Liste."""
+
+    source: list[Any] | None = None
+    length: int = 0
+    chain: str = ""
+
+    def sync(self, items: list[Any]) -> None:
+        if items is not self.source or len(items) < self.length:
+            self.source = items
+            self.length, self.chain = 0, ""
+        for item in items[self.length :]:
+            self.chain = _sha256_hex(self.chain + _sha256_hex(_canonical_json(item)))
+        self.length = len(items)
+
+    def digest(self) -> str:
+        return self.chain or _sha256_hex("")
+
+
+_CollectionDigests = (_RecordCollectionDigest, _ListCollectionDigest)
+
+
+@dataclass
+class _StateDigestCache:
+    """Pro Sammlung gecachte Merkle-Digests; Replay markiert geänderte Records.
+
+    Neue oder ersetzte Records meldet ``_apply_event`` über :meth:`touch`;
+    append-only Listen werden über ihre Länge nachgezogen. Ohne Meldung
+    invalidiert wird eine Sammlung nur, wenn sie ersetzt wird oder ihre Größe
+    sich ändert. Der Cache ist abgeleitet und geht weder in Gleichheit noch
+    in den Digest selbst ein.
+    """
+
+    records: dict[str, _RecordCollectionDigest] = field(default_factory=dict)
+    lists: dict[str, _ListCollectionDigest] = field(default_factory=dict)
+
+    def touch(self, collection: str, stable_id: str) -> None:
+        self.records.setdefault(collection, _RecordCollectionDigest()).dirty.add(stable_id)
+
+    def sync(self, canonical: Mapping[str, Any]) -> dict[str, Any]:
+        """Sammlungen nachziehen; liefert Name -> gecachte Sammlung oder Skalar."""
+        synced: dict[str, Any] = {}
+        for name, value in canonical.items():
+            if isinstance(value, dict):
+                entry: Any = self.records.setdefault(name, _RecordCollectionDigest())
+                entry.sync(value)
+            elif isinstance(value, list):
+                entry = self.lists.setdefault(name, _ListCollectionDigest())
+                entry.sync(value)
+            else:
+                entry = value
+            synced[name] = entry
+        return synced
+
+
 @dataclass
 class ReplayState:
     """Deterministisch rekonstruierter Zustand eines persistierten Eventstreams."""
@@ -959,11 +1277,32 @@ class ReplayState:
     warnings: list[str] = field(default_factory=list)
     policy_version: str | None = None
     policy_digest: str | None = None
+    _views: _GuardViews = field(default_factory=_GuardViews, init=False, repr=False, compare=False)
+    _index: _ReplayIndexes = field(
+        default_factory=_ReplayIndexes, init=False, repr=False, compare=False
+    )
+    _digest: _StateDigestCache = field(
+        default_factory=_StateDigestCache, init=False, repr=False, compare=False
+    )
+    # Journal (Sammlung, stable_id) angelegter oder geänderter Records. None,
+    # solange kein Konsument (inkrementeller Export) angemeldet ist; der
+    # Konsument leert es nach jedem Lauf, damit es nicht mit dem Stream wächst.
+    _changes: list[tuple[str, str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def state_digest(self) -> str:
         return compute_state_digest(self)
 
+    @property
+    def merkle_digest(self) -> str:
+        return compute_state_digest(self, mode=DIGEST_MODE_MERKLE)
+
+    def invalidate_digests(self) -> None:
+        """Merkle-Cache verwerfen, z.B. nach Änderungen an Records außerhalb des Replays."""
+        self._digest = _StateDigestCache()
+
     def current_tag(self, claim_id: str) -> str | None:
         record = self.claims.get(claim_id)
         if record is None:
@@ -971,6 +1310,33 @@ class ReplayState:
         tag = record.get("current_tag")
         return tag if isinstance(tag, str) else None
 
+    def human_decisions_for_request(self, request_id: str) -> list[dict[str, Any]]:
+        return _lookup(self.human_decisions, self._index.human_by_request, request_id)
+
+    def guard_decisions_for_request(self, request_id: str) -> list[dict[str, Any]]:
+        return _lookup(self.guard_decisions, self._index.guard_by_request, request_id)
+
+    def relations_for_claim(self, claim_id: str) -> list[dict[str, Any]]:
+        return _lookup(self.relations, self._index.relations_by_claim, claim_id)
+
+    def requests_for_claim(self, claim_id: str) -> list[dict[str, Any]]:
+        return _lookup(self.requests, self._index.requests_by_claim, claim_id)
+
+    def retractions_for_claim(self, claim_id: str) -> list[dict[str, Any]]:
+        return _lookup(self.retractions, self._index.retractions_by_claim, claim_id)
+
+
+def _record_changed(state: ReplayState, collection: str, stable_id: str) -> None:
+    state._digest.touch(collection, stable_id)
+    if state._changes is not None:
+        state._changes.append((collection, stable_id))
+
+
+def _lookup(
+    records: Mapping[str, dict[str, Any]], index: Mapping[str, list[str]], key: str
+) -> list[dict[str, Any]]:
+    return [records[stable_id] for stable_id in index.get(key, ())]
+
 
 def _reject(
     state: ReplayState, event: Mapping[str, Any], codes: Sequence[ReasonCode], note: str
@@ -986,16 +1352,52 @@ def _reject(
     )
 
 
-def _human_decisions_for_request(state: ReplayState, request_id: str) -> list[dict[str, Any]]:
-    return [
-        record
-        for record in state.human_decisions.values()
-        if record.get("request_id") == request_id
-    ]
+def _reject_unenveloped(state: ReplayState, note: str) -> None:
+    """Eingabe ohne lesbaren Envelope sichtbar quarantänisieren."""
+    state.rejected_events.append(
+        {
+            "event_type": None,
+            "event_id": None,
+            "reason_codes": [ReasonCode.EVENT_SCHEMA_INVALID.value],
+            "note": note,
+        }
+    )
+
+
+@dataclass(frozen=True)
+class _UnparsableLine:
+    """Platzhalter für eine JSONL-Zeile, die kein gültiges JSON ist."""
+
+    line_number: int
+
+
+def _iter_jsonl_events(source: str | Path | Iterable[str | bytes]) -> Iterator[Any]:
+    """JSONL-Zeilen lazy parsen, ohne den Rohstream zu materialisieren.
+
+    Nicht parsebare Zeilen werden nicht verworfen, sondern als
+    :class:`_UnparsableLine` weitergereicht, damit Replay sie sichtbar
+    quarantänisiert statt still zu überspringen. Ein Pfad auf einen rotierten
+    Ledger liest zuerst die versiegelten Segmente laut Manifest.
+    """
+    if isinstance(source, (str, Path)):
+        with open_ledger_stream(source) as handle:
+            yield from _iter_jsonl_events(handle)
+        return
+    for line_number, raw_line in enumerate(source, start=1):
+        line = raw_line.strip()
+        if line:
+            yield _parse_jsonl_line(line_number, line)
+
+
+def _parse_jsonl_line(line_number: int, line: str | bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:  # JSONDecodeError und UnicodeDecodeError
+        return _UnparsableLine(line_number)
 
 
 def replay_events(
-    events: Sequence[Mapping[str, Any]],
+    events: Iterable[Mapping[str, Any]],
     *,
     policy: ClaimPolicy | None = None,
 ) -> ReplayState:
@@ -1003,7 +1405,8 @@ def replay_events(
 
     Derselbe Stream plus dieselbe Policy ergeben denselben ReplayState und
     denselben state_digest (Invariante 10). Unzulässige Reihenfolgen werden
-    fail-closed als rejected_events sichtbar gehalten.
+    fail-closed als rejected_events sichtbar gehalten. Der Stream wird genau
+    einmal durchlaufen; ein Generator genügt.
     """
     # Replay is an enforcement boundary, not a policy-free deserializer. When
     # callers do not supply an explicit historical policy, use the repository
@@ -1013,35 +1416,53 @@ def replay_events(
     state = ReplayState(policy_version=policy.version, policy_digest=policy.digest)
 
     for event in events:
-        if not isinstance(event, Mapping):
-            state.rejected_events.append(
-                {
-                    "event_type": None,
-                    "event_id": None,
-                    "reason_codes": [ReasonCode.EVENT_SCHEMA_INVALID.value],
-                    "note": "event envelope is not a mapping",
-                }
-            )
-            continue
-        event_type = event.get("type")
-        payload = event.get("payload")
-        if (
-            not isinstance(event_type, str)
-            or not isinstance(payload, Mapping)
-            or not set(event) <= _ENVELOPE_ALLOWED_KEYS
-        ):
-            _reject(state, event, [ReasonCode.EVENT_SCHEMA_INVALID], "invalid event envelope")
-            continue
-        if event_type not in ERK_EVENT_TYPES:
-            _reject(state, event, [ReasonCode.UNKNOWN_EVENT_TYPE], "unknown event type")
-            continue
+        _replay_event(state, event, policy)
+    return state
 
-        try:
-            _apply_event(state, event, event_type, payload, policy)
-        except EvidenceRoutingError as exc:
-            _reject(state, event, exc.reason_codes or [ReasonCode.EVENT_SCHEMA_INVALID], str(exc))
 
-    return state
+def _replay_event(state: ReplayState, event: object, policy: ClaimPolicy) -> None:
+    """Ein Envelope prüfen und anwenden; Fehler werden sichtbar quarantänisiert."""
+    if isinstance(event, _UnparsableLine):
+        _reject_unenveloped(state, f"event line {event.line_number} is not valid JSON")
+        return
+    if not isinstance(event, Mapping):
+        _reject_unenveloped(state, "event envelope is not a mapping")
+        return
+    event_type = event.get("type")
+    payload = event.get("payload")
+    if (
+        not isinstance(event_type, str)
+        or not isinstance(payload, Mapping)
+        or not set(event) <= _ENVELOPE_ALLOWED_KEYS
+    ):
+        _reject(state, event, [ReasonCode.EVENT_SCHEMA_INVALID], "invalid event envelope")
+        return
+    if event_type not in ERK_EVENT_TYPES:
+        _reject(state, event, [ReasonCode.UNKNOWN_EVENT_TYPE], "unknown event type")
+        return
+
+    try:
+        _apply_event(state, event, event_type, payload, policy)
+    except EvidenceRoutingError as exc:
+        _reject(state, event, exc.reason_codes or [ReasonCode.EVENT_SCHEMA_INVALID], str(exc))
+
+
+def replay_jsonl(
+    source: str | Path | Iterable[str | bytes],
+    *,
+    policy: ClaimPolicy | None = None,
+) -> ReplayState:
+    """JSONL-Eventstream direkt aus Datei oder Zeilen-Iterable replayen.
+
+    ``source`` ist ein Dateipfad (``str`` wird immer als Pfad gelesen) oder ein
+    beliebiges Iterable von Zeilen, z.B. ein offenes Datei-Handle. Bei einem
+    rotierten Ledger werden die versiegelten Segmente vor der aktiven Datei
+    gelesen; Zeilennummern laufen über alle Dateien. Zeilen werden
+    lazy geparst; der Speicherbedarf wächst mit dem rekonstruierten Zustand,
+    nicht mit der Streamlänge. Ungültige JSON-Zeilen landen fail-closed als
+    EVENT_SCHEMA_INVALID in ``rejected_events``.
+    """
+    return replay_events(_iter_jsonl_events(source), policy=policy)
 
 
 def _apply_event(
@@ -1067,6 +1488,8 @@ def _apply_event(
             )
         record["trust"] = normalized_trust
         state.materials[material.material_id] = record
+        _record_changed(state, "materials", material.material_id)
+        state._views.materials[material.material_id] = replace(material, trust=normalized_trust)
         return
 
     if event_type == EVENT_CLAIM_CREATED:
@@ -1091,6 +1514,10 @@ def _apply_event(
         record["current_tag"] = current_tag
         record["retracted"] = False
         state.claims[claim.claim_id] = record
+        _record_changed(state, "claims", claim.claim_id)
+        state._views.claims[claim.claim_id] = claim
+        state._views.current_tags[claim.claim_id] = current_tag
+        state._views.claim_statuses[claim.claim_id] = claim.status
         return
 
     if event_type == EVENT_EVIDENCE_RELATION_RECORDED:
@@ -1116,6 +1543,9 @@ def _apply_event(
                 [ReasonCode.EVENT_SCHEMA_INVALID],
             )
         state.relations[relation.relation_id] = relation.to_payload()
+        _record_changed(state, "relations", relation.relation_id)
+        _index_add(state._index.relations_by_claim, relation.claim_id, relation.relation_id)
+        state._views.relations[relation.relation_id] = relation
         return
 
     if event_type == EVENT_TRANSITION_REQUESTED:
@@ -1140,6 +1570,8 @@ def _apply_event(
                     [ReasonCode.EVIDENCE_CLAIM_MISMATCH],
                 )
         state.requests[request.request_id] = request.to_payload()
+        _record_changed(state, "requests", request.request_id)
+        _index_add(state._index.requests_by_claim, request.claim_id, request.request_id)
         return
 
     if event_type == EVENT_GUARD_DECISION_RECORDED:
@@ -1168,6 +1600,8 @@ def _apply_event(
                 f"loaded={policy.version}/{policy.digest})"
             )
         state.guard_decisions[guard.decision_id] = guard.to_payload()
+        _record_changed(state, "guard_decisions", guard.decision_id)
+        _index_add(state._index.guard_by_request, guard.request_id, guard.decision_id)
         return
 
     if event_type == EVENT_HUMAN_DECISION_RECORDED:
@@ -1190,8 +1624,8 @@ def _apply_event(
                 [ReasonCode.EVENT_SCHEMA_INVALID],
             )
         if human.decision == HUMAN_APPROVE and not any(
-            record.get("request_id") == human.request_id and record.get("decision") == GUARD_PROPOSE
-            for record in state.guard_decisions.values()
+            record.get("decision") == GUARD_PROPOSE
+            for record in state.guard_decisions_for_request(human.request_id)
         ):
             # APPROVE ist nur als Freigabe eines konkreten Proposals anwendbar;
             # REJECT/DEFER/WITHDRAW bleiben als Entscheidungsgeschichte zulässig.
@@ -1199,7 +1633,7 @@ def _apply_event(
                 f"approve without PROPOSE guard decision for request: {human.request_id}",
                 [ReasonCode.EVENT_ORDER_INVALID],
             )
-        prior = _human_decisions_for_request(state, human.request_id)
+        prior = state.human_decisions_for_request(human.request_id)
         if human.decision == HUMAN_APPROVE and any(
             record.get("decision") == HUMAN_WITHDRAW for record in prior
         ):
@@ -1208,6 +1642,8 @@ def _apply_event(
                 [ReasonCode.EVENT_ORDER_INVALID],
             )
         state.human_decisions[human.decision_id] = human.to_payload()
+        _record_changed(state, "human_decisions", human.decision_id)
+        _index_add(state._index.human_by_request, human.request_id, human.decision_id)
         return
 
     if event_type == EVENT_CLAIM_RETAGGED:
@@ -1231,6 +1667,14 @@ def _apply_event(
         state.retractions[retraction.retraction_id] = retraction.to_payload()
         claim_record["retracted"] = True
         claim_record["status"] = CLAIM_STATUS_RETRACTED
+        _record_changed(state, "retractions", retraction.retraction_id)
+        _index_add(state._index.retractions_by_claim, retraction.claim_id, retraction.retraction_id)
+        _record_changed(state, "claims", retraction.claim_id)
+        views = state._views
+        views.claims[retraction.claim_id] = replace(
+            views.claims[retraction.claim_id], status=CLAIM_STATUS_RETRACTED
+        )
+        views.claim_statuses[retraction.claim_id] = CLAIM_STATUS_RETRACTED
         return
 
     raise EvidenceRoutingError(
@@ -1251,6 +1695,36 @@ def _model_from_state_record(cls: type, record: Mapping[str, Any]) -> Any:
     return model_from_payload(cls, payload)
 
 
+def _rebuild_guard_views(state: ReplayState) -> None:
+    """Guard-Sichten vollständig aus den Records ableiten (z.B. nach Restore)."""
+    views = _GuardViews()
+    for stable_id, record in state.claims.items():
+        views.claims[stable_id] = _model_from_state_record(ClaimCandidate, record)
+        views.current_tags[stable_id] = str(record.get("current_tag"))
+        views.claim_statuses[stable_id] = str(record.get("status"))
+    for stable_id, record in state.materials.items():
+        views.materials[stable_id] = _model_from_state_record(MaterialRef, record)
+    for stable_id, record in state.relations.items():
+        views.relations[stable_id] = _model_from_state_record(EvidenceRelation, record)
+    state._views = views
+
+
+def _rebuild_indexes(state: ReplayState) -> None:
+    """Rückwärtsindizes vollständig aus den Records ableiten (z.B. nach Restore)."""
+    index = _ReplayIndexes()
+    for stable_id, record in state.relations.items():
+        _index_add(index.relations_by_claim, record.get("claim_id"), stable_id)
+    for stable_id, record in state.requests.items():
+        _index_add(index.requests_by_claim, record.get("claim_id"), stable_id)
+    for stable_id, record in state.guard_decisions.items():
+        _index_add(index.guard_by_request, record.get("request_id"), stable_id)
+    for stable_id, record in state.human_decisions.items():
+        _index_add(index.human_by_request, record.get("request_id"), stable_id)
+    for stable_id, record in state.retractions.items():
+        _index_add(index.retractions_by_claim, record.get("claim_id"), stable_id)
+    state._index = index
+
+
 def _apply_retag_event(state: ReplayState, payload: Mapping[str, Any], policy: ClaimPolicy) -> None:
     # Vollständiges Feldschema: exakt die definierten Retag-Felder, keine Teilmenge.
     if set(payload) != _RETAG_PAYLOAD_FIELDS:
@@ -1370,31 +1844,18 @@ def _apply_retag_event(state: ReplayState, payload: Mapping[str, Any], policy: C
     # A persisted PROPOSE is historical evidence, not authority. Recompute the
     # guard against the replay state and current policy immediately before the
     # mutation, then require the stored decision to match that result exactly.
-    claims = {
-        stable_id: _model_from_state_record(ClaimCandidate, record)
-        for stable_id, record in state.claims.items()
-    }
-    materials = {
-        stable_id: _model_from_state_record(MaterialRef, record)
-        for stable_id, record in state.materials.items()
-    }
-    relations = {
-        stable_id: _model_from_state_record(EvidenceRelation, record)
-        for stable_id, record in state.relations.items()
-    }
+    # The typed views are maintained by replay, so the evaluation only looks
+    # up the request's own claim, relations and materials.
+    views = state._views
     recomputed_guard = evaluate_transition_request(
         request,
         policy=policy,
-        claims=claims,
-        materials=materials,
-        relations=relations,
+        claims=views.claims,
+        materials=views.materials,
+        relations=views.relations,
         decision_id=guard_id,
-        current_tags={
-            stable_id: str(record.get("current_tag")) for stable_id, record in state.claims.items()
-        },
-        claim_statuses={
-            stable_id: str(record.get("status")) for stable_id, record in state.claims.items()
-        },
+        current_tags=views.current_tags,
+        claim_statuses=views.claim_statuses,
     )
     if (
         recomputed_guard.decision != GUARD_PROPOSE
@@ -1422,7 +1883,7 @@ def _apply_retag_event(state: ReplayState, payload: Mapping[str, Any], policy: C
             [ReasonCode.HUMAN_REFERENCE_MISMATCH, ReasonCode.HUMAN_DECISION_REQUIRED],
         )
     approved_at = approval.get("decided_at", 0.0)
-    for record in _human_decisions_for_request(state, request_id):
+    for record in state.human_decisions_for_request(request_id):
         if record.get("decision") == HUMAN_WITHDRAW and record.get("decided_at", 0.0) >= float(
             approved_at
         ):
@@ -1432,7 +1893,7 @@ def _apply_retag_event(state: ReplayState, payload: Mapping[str, Any], policy: C
 
     from_tag = retag_from.tag
     to_tag = retag_to.tag
-    if to_tag not in policy.allowed_next(from_tag):
+    if not policy.permits(from_tag, to_tag):
         raise EvidenceRoutingError(
             f"retag edge not allowed by policy: {from_tag} -> {to_tag}",
             [ReasonCode.POLICY_TRANSITION_DENIED],
@@ -1445,6 +1906,8 @@ def _apply_retag_event(state: ReplayState, payload: Mapping[str, Any], policy: C
         )
 
     claim_record["current_tag"] = to_tag
+    views.current_tags[claim_id] = to_tag
+    _record_changed(state, "claims", claim_id)
     state.retag_history.append(
         {
             "claim_id": claim_id,
@@ -1464,15 +1927,58 @@ def _apply_retag_event(state: ReplayState, payload: Mapping[str, Any], policy: C
 # ---------------------------------------------------------------------------
 
 
-def compute_state_digest(state: ReplayState) -> str:
+def compute_state_digest(state: ReplayState, *, mode: str = DIGEST_MODE_COMPAT) -> str:
     """Deterministischer Digest über die kanonisch sortierte Zustandsdarstellung.
 
     Bewusst getrennt vom Ledger-Hash: Der Ledger-Hash sichert die Eventkette,
     der State-Digest identifiziert den rekonstruierten Zustand. Volatile Felder
     (Objektadressen, Laufzeit) sind ausgeschlossen, weil nur serialisierte
     Inhalte eingehen.
+
+    ``mode="compat"`` (Default) liefert exakt den SHA-256 über
+    ``json.dumps(sort_keys=True)`` des Gesamtzustands, wie ihn Fixtures und
+    Checkpoints erwarten. Er wird bei jedem Aufruf aus dem aktuellen Inhalt
+    gebildet und erfasst damit auch Änderungen außerhalb des Replays.
+
+    ``mode="merkle"`` hasht stattdessen die Digests der einzelnen Sammlungen
+    (siehe :func:`compute_collection_digests`) und serialisiert nur Records neu,
+    die sich seit dem letzten Lesen geändert haben. Invalidiert wird der Cache
+    durch Replay-Events, durch Ersetzen einer Sammlung und durch Änderungen
+    ihrer Größe. Wer Records direkt verändert, ruft danach
+    :meth:`ReplayState.invalidate_digests` auf.
     """
-    canonical = {
+    if mode not in DIGEST_MODES:
+        raise ValueError(f"unknown state digest mode: {mode!r}")
+    if mode == DIGEST_MODE_MERKLE:
+        synced = state._digest.sync(_canonical_state(state))
+        return _sha256_hex(_canonical_json(_merkle_roots(synced)))
+    return _sha256_hex(_canonical_json(_canonical_state(state)))
+
+
+def compute_collection_digests(state: ReplayState) -> dict[str, str]:
+    """Merkle-Digests je Sammlung (Records bzw. append-only Listen).
+
+    Damit lässt sich eingrenzen, welche Sammlung sich zwischen zwei Zuständen
+    unterscheidet, ohne den Gesamtzustand zu vergleichen.
+    """
+    synced = state._digest.sync(_canonical_state(state))
+    return {
+        name: entry.digest()
+        for name, entry in synced.items()
+        if isinstance(entry, _CollectionDigests)
+    }
+
+
+def _merkle_roots(synced: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        name: entry.digest() if isinstance(entry, _CollectionDigests) else entry
+        for name, entry in synced.items()
+    }
+
+
+def _canonical_state(state: ReplayState) -> dict[str, Any]:
+    """Die digest-relevanten Zustandsfelder; abgeleitete Sichten fehlen bewusst."""
+    return {
         "schema_version": state.schema_version,
         "policy_version": state.policy_version,
         "policy_digest": state.policy_digest,
@@ -1487,8 +1993,6 @@ def compute_state_digest(state: ReplayState) -> str:
         "rejected_events": state.rejected_events,
         "warnings": state.warnings,
     }
-    serialized = json.dumps(canonical, sort_keys=True, separators=(",", ":"), allow_nan=False)
-    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
 
 @dataclass(frozen=True)
@@ -1508,7 +2012,7 @@ class ReducedPublicExport:
         return asdict(self)
 
 
-def _export_local_refs(ids: Sequence[str], prefix: str, letter: str) -> dict[str, str]:
+def _export_local_refs(ids: Iterable[str], prefix: str, letter: str) -> dict[str, str]:
     """Deterministische, exportlokale Referenzen aus kanonisch sortierten IDs.
 
     Die Referenz ist eine Positionskennung innerhalb dieses Exports
@@ -1548,117 +2052,209 @@ def reduce_public_export(state: ReplayState) -> ReducedPublicExport:
     bindet ausschließlich diese Projektion und verrät keine Änderung, die nur
     im privaten Replay-Zustand stattgefunden hat.
     """
-    visible_claim_ids = [
-        stable_id for stable_id, record in state.claims.items() if _is_publicly_exportable(record)
-    ]
-    visible_material_ids = [
-        stable_id
-        for stable_id, record in state.materials.items()
-        if _is_publicly_exportable(record)
-    ]
-    visible_request_ids = [
-        stable_id
-        for stable_id, record in state.requests.items()
-        if _is_publicly_exportable(record) and record.get("claim_id") in visible_claim_ids
-    ]
-    visible_guard_ids = [
-        stable_id
-        for stable_id, record in state.guard_decisions.items()
-        if _is_publicly_exportable(record)
-        and record.get("request_id") in visible_request_ids
-        and record.get("policy_version") == state.policy_version
-        and record.get("policy_digest") == state.policy_digest
-    ]
-    visible_retraction_ids = [
-        stable_id
-        for stable_id, record in state.retractions.items()
-        if _is_publicly_exportable(record) and record.get("claim_id") in visible_claim_ids
-    ]
-
-    claim_refs = _export_local_refs(visible_claim_ids, "claim", "c")
-    material_refs = _export_local_refs(visible_material_ids, "material", "m")
-    request_refs = _export_local_refs(visible_request_ids, "request", "q")
-    guard_refs = _export_local_refs(visible_guard_ids, "guard", "g")
-    retraction_refs = _export_local_refs(visible_retraction_ids, "retraction", "r")
-
-    claims = [
-        {
-            "claim_ref": claim_refs[claim_id],
-            "schema_version": ERK_SCHEMA_VERSION,
-            "claim_tag": record.get("current_tag"),
-            "status": _public_status(
-                record.get("status"), frozenset({CLAIM_STATUS_ACTIVE, CLAIM_STATUS_RETRACTED})
-            ),
-            "retracted": bool(record.get("retracted", False)),
-        }
-        for claim_id, record in sorted(state.claims.items())
-        if claim_id in claim_refs
-    ]
-    materials = [
-        {
-            "material_ref": material_refs[material_id],
-            "schema_version": ERK_SCHEMA_VERSION,
-            "kind": (
-                str(record.get("kind")).strip().lower()
-                if str(record.get("kind")).strip().lower() in PUBLIC_MATERIAL_KINDS
-                else "other"
-            ),
-            "trust": (
-                record.get("trust")
-                if record.get("trust") in KNOWN_TRUST_LEVELS
-                else TRUST_UNTRUSTED
-            ),
-            "status": _public_status(
-                record.get("status"), frozenset({CLAIM_STATUS_ACTIVE, CLAIM_STATUS_RETRACTED})
-            ),
-        }
-        for material_id, record in sorted(state.materials.items())
-        if material_id in material_refs
-    ]
-    guard_decisions = []
-    for decision_id, record in sorted(state.guard_decisions.items()):
-        if decision_id not in guard_refs:
-            continue
-        entry: dict[str, Any] = {
-            "guard_ref": guard_refs[decision_id],
-            "decision": record.get("decision"),
-            "reason_codes": list(record.get("reason_codes", [])),
-            "policy_version": state.policy_version,
-            "policy_digest": state.policy_digest,
-        }
-        request_ref = request_refs.get(str(record.get("request_id")))
-        if request_ref is not None:
-            # Beziehung nur über die exportlokale Referenz; sonst weglassen.
-            entry["request_ref"] = request_ref
-        guard_decisions.append(entry)
-    retractions = []
-    for retraction_id, record in sorted(state.retractions.items()):
-        if retraction_id not in retraction_refs:
-            continue
-        entry = {
-            "retraction_ref": retraction_refs[retraction_id],
-            "status": _public_status(record.get("status"), frozenset({"RECORDED"})),
-        }
-        claim_ref = claim_refs.get(str(record.get("claim_id")))
-        if claim_ref is not None:
-            entry["claim_ref"] = claim_ref
-        retractions.append(entry)
-    projection = {
+    projection = _public_projection(state)
+    sections = {
+        section: list(_iter_public_section(state, projection, section))
+        for section in _EXPORT_SECTIONS
+    }
+    payload = {
         "export_schema_version": ERK_EXPORT_SCHEMA_VERSION,
         "policy_version": state.policy_version,
         "policy_digest": state.policy_digest,
-        "claims": claims,
-        "materials": materials,
-        "guard_decisions": guard_decisions,
-        "retractions": retractions,
+        **sections,
     }
     return ReducedPublicExport(
         export_schema_version=ERK_EXPORT_SCHEMA_VERSION,
         policy_version=state.policy_version,
         policy_digest=state.policy_digest,
-        export_digest=_compute_export_digest(projection),
-        claims=claims,
-        materials=materials,
-        guard_decisions=guard_decisions,
-        retractions=retractions,
+        export_digest=_compute_export_digest(payload),
+        claims=sections["claims"],
+        materials=sections["materials"],
+        guard_decisions=sections["guard_decisions"],
+        retractions=sections["retractions"],
     )
+
+
+def iter_public_export_ndjson(state: ReplayState) -> Iterator[str]:
+    """Public Export als NDJSON-Zeilen streamen, ohne Sektionen zu materialisieren.
+
+    Erste Zeile ist der Header (Schema und Policy), danach folgt je Eintrag eine
+    Zeile ``{"section": ..., "entry": {...}}`` in der Sektionsreihenfolge des
+    Digests, zuletzt ``{"section": "digest", "export_digest": ...}``. Der Digest
+    wird beim Streamen mitgeführt und ist identisch zu
+    ``reduce_public_export(state).export_digest``.
+    """
+    projection = _public_projection(state)
+    scalars = {
+        "export_schema_version": ERK_EXPORT_SCHEMA_VERSION,
+        "policy_version": state.policy_version,
+        "policy_digest": state.policy_digest,
+    }
+    yield _canonical_json({"section": "header", **scalars}) + "\n"
+
+    # Gleiche Bytes wie _compute_export_digest über die volle Projektion: Top-Level-
+    # Schlüssel sortiert, Skalare zwischen den Sektionen an ihrer Sortierposition.
+    hasher = hashlib.sha256(b"{")
+    keys = sorted([*scalars, *_EXPORT_SECTIONS])
+    for position, key in enumerate(keys):
+        prefix = "," if position else ""
+        hasher.update(f"{prefix}{_canonical_json(key)}:".encode())
+        if key in scalars:
+            hasher.update(_canonical_json(scalars[key]).encode("utf-8"))
+            continue
+        hasher.update(b"[")
+        for index, entry in enumerate(_iter_public_section(state, projection, key)):
+            serialized = _canonical_json(entry)
+            hasher.update((b"," if index else b"") + serialized.encode("utf-8"))
+            yield f'{{"entry":{serialized},"section":{_canonical_json(key)}}}\n'
+        hasher.update(b"]")
+    hasher.update(b"}")
+    yield _canonical_json({"section": "digest", "export_digest": hasher.hexdigest()}) + "\n"
+
+
+# Sektionen des Public Exports in der Sortierreihenfolge des Digests.
+_EXPORT_SECTIONS = ("claims", "guard_decisions", "materials", "retractions")
+
+
+# Exportlokale Referenzformate je Sammlung (Präfix, Buchstabe); Requests tragen
+# keine eigene Sektion, ihre Refs erscheinen nur in Guard-Einträgen.
+_EXPORT_REF_FORMATS = {
+    "claims": ("claim", "c"),
+    "materials": ("material", "m"),
+    "requests": ("request", "q"),
+    "guard_decisions": ("guard", "g"),
+    "retractions": ("retraction", "r"),
+}
+
+
+@dataclass(frozen=True)
+class _PublicProjection:
+    """Exportlokale Referenzen der sichtbaren Records je Sammlung.
+
+    ``refs[collection]`` ist nach interner ID sortiert; die Einfügereihenfolge
+    ist damit zugleich die Eintragsreihenfolge der Sektion.
+    """
+
+    refs: dict[str, dict[str, str]]
+
+
+def _is_visible_in_projection(
+    state: ReplayState,
+    collection: str,
+    record: Mapping[str, Any],
+    refs: Mapping[str, Mapping[str, str]],
+) -> bool:
+    """Sichtbarkeit eines Records; Joins nur gegen bereits sichtbare Refs."""
+    if not _is_publicly_exportable(record):
+        return False
+    if collection in ("requests", "retractions"):
+        return record.get("claim_id") in refs["claims"]
+    if collection == "guard_decisions":
+        return (
+            record.get("request_id") in refs["requests"]
+            and record.get("policy_version") == state.policy_version
+            and record.get("policy_digest") == state.policy_digest
+        )
+    return True
+
+
+def _public_projection(state: ReplayState) -> _PublicProjection:
+    """Sichtbarkeit je Sammlung in einem Durchlauf; Joins über Hash-Lookups.
+
+    Die Reihenfolge der Sammlungen in ``_EXPORT_REF_FORMATS`` stellt sicher,
+    dass Claims vor Requests/Retractions und Requests vor Guards feststehen.
+    """
+    refs: dict[str, dict[str, str]] = {}
+    for collection, (prefix, letter) in _EXPORT_REF_FORMATS.items():
+        visible = [
+            stable_id
+            for stable_id, record in getattr(state, collection).items()
+            if _is_visible_in_projection(state, collection, record, refs)
+        ]
+        refs[collection] = _export_local_refs(visible, prefix, letter)
+    return _PublicProjection(refs=refs)
+
+
+def _iter_public_section(
+    state: ReplayState, projection: _PublicProjection, section: str
+) -> Iterator[dict[str, Any]]:
+    """Einträge einer Sektion in Ref-Reihenfolge (= sortierte interne IDs)."""
+    if section not in _EXPORT_SECTIONS:
+        raise ValueError(f"unknown export section: {section!r}")
+    for stable_id in projection.refs[section]:
+        yield _public_section_entry(state, projection, section, stable_id)
+
+
+def _public_section_entry(
+    state: ReplayState, projection: _PublicProjection, section: str, stable_id: str
+) -> dict[str, Any]:
+    ref = projection.refs[section][stable_id]
+    if section == "claims":
+        return _public_claim_entry(ref, state.claims[stable_id])
+    if section == "materials":
+        return _public_material_entry(ref, state.materials[stable_id])
+    if section == "guard_decisions":
+        return _public_guard_entry(
+            ref, state.guard_decisions[stable_id], state, projection.refs["requests"]
+        )
+    return _public_retraction_entry(ref, state.retractions[stable_id], projection.refs["claims"])
+
+
+def _public_claim_entry(ref: str, record: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "claim_ref": ref,
+        "schema_version": ERK_SCHEMA_VERSION,
+        "claim_tag": record.get("current_tag"),
+        "status": _public_status(
+            record.get("status"), frozenset({CLAIM_STATUS_ACTIVE, CLAIM_STATUS_RETRACTED})
+        ),
+        "retracted": bool(record.get("retracted", False)),
+    }
+
+
+def _public_material_entry(ref: str, record: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "material_ref": ref,
+        "schema_version": ERK_SCHEMA_VERSION,
+        "kind": (
+            str(record.get("kind")).strip().lower()
+            if str(record.get("kind")).strip().lower() in PUBLIC_MATERIAL_KINDS
+            else "other"
+        ),
+        "trust": (
+            record.get("trust") if record.get("trust") in KNOWN_TRUST_LEVELS else TRUST_UNTRUSTED
+        ),
+        "status": _public_status(
+            record.get("status"), frozenset({CLAIM_STATUS_ACTIVE, CLAIM_STATUS_RETRACTED})
+        ),
+    }
+
+
+def _public_guard_entry(
+    ref: str, record: Mapping[str, Any], state: ReplayState, request_refs: Mapping[str, str]
+) -> dict[str, Any]:
+    entry: dict[str, Any] = {
+        "guard_ref": ref,
+        "decision": record.get("decision"),
+        "reason_codes": list(record.get("reason_codes", [])),
+        "policy_version": state.policy_version,
+        "policy_digest": state.policy_digest,
+    }
+    request_ref = request_refs.get(str(record.get("request_id")))
+    if request_ref is not None:
+        # Beziehung nur über die exportlokale Referenz; sonst weglassen.
+        entry["request_ref"] = request_ref
+    return entry
+
+
+def _public_retraction_entry(
+    ref: str, record: Mapping[str, Any], claim_refs: Mapping[str, str]
+) -> dict[str, Any]:
+    entry: dict[str, Any] = {
+        "retraction_ref": ref,
+        "status": _public_status(record.get("status"), frozenset({"RECORDED"})),
+    }
+    claim_ref = claim_refs.get(str(record.get("claim_id")))
+    if claim_ref is not None:
+        entry["claim_ref"] = claim_ref
+    return entry
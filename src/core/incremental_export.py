@@ -0,0 +1,199 @@
+"""
+src/core/incremental_export.py
+
+Inkrementeller Public Export für den Evidence Routing Kernel v0.1a.
+
+Der Exporter merkt sich die letzte Projektion eines ``ReplayState`` samt der
+Zuordnung interner IDs zu exportlokalen Referenzen und projiziert beim
+nächsten Lauf nur die Records neu, die seitdem angelegt oder geändert wurden
+(Änderungsjournal des Replays). Das Ergebnis ist identisch zu
+``reduce_public_export(state)`` — inklusive ``export_digest``.
+
+Das Journal führt der Replay nur, solange ein Exporter am Zustand hängt;
+jeder Lauf leert es. Sein Speicher wächst also mit den Änderungen zwischen
+zwei Läufen, nicht mit der Streamlänge.
+
+Grenzen:
+- Referenzen sind Positionen in sortierten IDs. Eine neue sichtbare ID, die
+  nicht hinter allen bisherigen einsortiert, verschiebt die Nummerierung;
+  dann wird vollständig neu projiziert und der Grund berichtet.
+- Der Exporter ist an genau ein ``ReplayState``-Objekt gebunden. Ein anderer
+  Zustand (z.B. nach Checkpoint-Restore) oder eine andere Policy erzwingt
+  einen vollständigen Neuaufbau. Ein zweiter Exporter am selben Zustand
+  übernimmt das Journal; der erste baut dann beim nächsten Lauf neu auf.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any
+
+from .evidence_routing import (
+    _EXPORT_REF_FORMATS,
+    _EXPORT_SECTIONS,
+    ERK_EXPORT_SCHEMA_VERSION,
+    ReducedPublicExport,
+    ReplayState,
+    _canonical_json,
+    _is_visible_in_projection,
+    _public_projection,
+    _public_section_entry,
+    _PublicProjection,
+)
+
+EXPORT_UPDATE_FULL = "FULL"
+EXPORT_UPDATE_INCREMENTAL = "INCREMENTAL"
+EXPORT_UPDATE_UNCHANGED = "UNCHANGED"
+
+
+@dataclass(frozen=True)
+class PublicExportUpdate:
+    """Ergebnis eines Exportlaufs und wie es zustande kam.
+
+    ``mode`` ist FULL, INCREMENTAL oder UNCHANGED; ``reprojected`` zählt die
+    neu projizierten Sektionseinträge, ``reason`` nennt bei FULL den Anlass.
+    """
+
+    export: ReducedPublicExport
+    mode: str
+    reprojected: int
+    reason: str | None = None
+
+
+@dataclass
+class _SectionCache:
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    fragments: list[str] = field(default_factory=list)
+    positions: dict[str, int] = field(default_factory=dict)
+
+
+class _RefShift(Exception):
+    """Neue sichtbare ID würde bestehende Referenzen verschieben."""
+
+
+class IncrementalPublicExporter:
+    """Public Export, der nur geänderte Records neu projiziert.
+
+    Unveränderte Sektionseinträge werden zwischen Läufen geteilt; gelieferte
+    Exporte sind daher als unveränderlich zu behandeln.
+    """
+
+    def __init__(self) -> None:
+        self._state: ReplayState | None = None
+        self._policy: tuple[str | None, str | None] = (None, None)
+        self._journal: list[tuple[str, str]] | None = None
+        self._projection = _PublicProjection(refs={})
+        self._sections: dict[str, _SectionCache] = {}
+        self._export: ReducedPublicExport | None = None
+
+    def update(self, state: ReplayState) -> PublicExportUpdate:
+        """Export für ``state`` liefern; inkrementell, wo die Refs stabil bleiben."""
+        reason = self._rebuild_reason(state)
+        if reason is None and self._export is not None and self._journal is not None:
+            if not self._journal:
+                return PublicExportUpdate(self._export, EXPORT_UPDATE_UNCHANGED, 0)
+            pending = list(self._journal)
+            self._journal.clear()
+            try:
+                reprojected = self._apply_changes(state, pending)
+            except _RefShift as shift:
+                reason = str(shift)
+            else:
+                self._export = self._assemble(state)
+                return PublicExportUpdate(self._export, EXPORT_UPDATE_INCREMENTAL, reprojected)
+
+        export, reprojected = self._rebuild(state)
+        return PublicExportUpdate(export, EXPORT_UPDATE_FULL, reprojected, reason)
+
+    def _rebuild_reason(self, state: ReplayState) -> str | None:
+        if self._export is None:
+            return "no previous export"
+        if state is not self._state:
+            return "different replay state"
+        if state._changes is not self._journal:
+            return "change journal taken over"
+        if (state.policy_version, state.policy_digest) != self._policy:
+            return "policy changed"
+        return None
+
+    def _rebuild(self, state: ReplayState) -> tuple[ReducedPublicExport, int]:
+        self._state = state
+        self._policy = (state.policy_version, state.policy_digest)
+        self._journal = state._changes = []
+        self._projection = _public_projection(state)
+        self._sections = {section: _SectionCache() for section in _EXPORT_SECTIONS}
+        reprojected = 0
+        for section in _EXPORT_SECTIONS:
+            for stable_id in self._projection.refs[section]:
+                self._store(state, section, stable_id)
+                reprojected += 1
+        export = self._export = self._assemble(state)
+        return export, reprojected
+
+    def _apply_changes(self, state: ReplayState, pending: list[tuple[str, str]]) -> int:
+        refs = self._projection.refs
+        touched: dict[tuple[str, str], None] = {}
+        # Journalreihenfolge = Eventreihenfolge: Claims stehen fest, bevor ihre
+        # Requests/Retractions, und Requests, bevor ihre Guards geprüft werden.
+        for collection, stable_id in pending:
+            if collection not in refs:
+                continue
+            if stable_id not in refs[collection]:
+                record = getattr(state, collection)[stable_id]
+                if not _is_visible_in_projection(state, collection, record, refs):
+                    continue
+                self._append_ref(collection, stable_id)
+            if collection in self._sections:
+                touched[(collection, stable_id)] = None
+        for section, stable_id in touched:
+            self._store(state, section, stable_id)
+        return len(touched)
+
+    def _append_ref(self, collection: str, stable_id: str) -> None:
+        refs = self._projection.refs[collection]
+        if refs and stable_id < next(reversed(refs)):
+            raise _RefShift(f"ref numbering shift in {collection}")
+        prefix, letter = _EXPORT_REF_FORMATS[collection]
+        refs[stable_id] = f"{prefix}:{letter}{len(refs) + 1:03d}"
+
+    def _store(self, state: ReplayState, section: str, stable_id: str) -> None:
+        cache = self._sections[section]
+        entry = _public_section_entry(state, self._projection, section, stable_id)
+        fragment = _canonical_json(entry)
+        position = cache.positions.get(stable_id)
+        if position is None:
+            cache.positions[stable_id] = len(cache.entries)
+            cache.entries.append(entry)
+            cache.fragments.append(fragment)
+        else:
+            cache.entries[position] = entry
+            cache.fragments[position] = fragment
+
+    def _assemble(self, state: ReplayState) -> ReducedPublicExport:
+        scalars = {
+            "export_schema_version": ERK_EXPORT_SCHEMA_VERSION,
+            "policy_version": state.policy_version,
+            "policy_digest": state.policy_digest,
+        }
+        # Gleiche Bytes wie _compute_export_digest über die volle Projektion.
+        hasher = hashlib.sha256(b"{")
+        for position, key in enumerate(sorted([*scalars, *_EXPORT_SECTIONS])):
+            prefix = "," if position else ""
+            hasher.update(f"{prefix}{_canonical_json(key)}:".encode())
+            if key in scalars:
+                hasher.update(_canonical_json(scalars[key]).encode("utf-8"))
+            else:
+                fragments = self._sections[key].fragments
+                hasher.update(("[" + ",".join(fragments) + "]").encode("utf-8"))
+        hasher.update(b"}")
+        return ReducedPublicExport(
+            export_schema_version=ERK_EXPORT_SCHEMA_VERSION,
+            policy_version=state.policy_version,
+            policy_digest=state.policy_digest,
+            export_digest=hasher.hexdigest(),
+            claims=list(self._sections["claims"].entries),
+            materials=list(self._sections["materials"].entries),
+            guard_decisions=list(self._sections["guard_decisions"].entries),
+            retractions=list(self._sections["retractions"].entries),
+        )
@@ -9,25 +9,86 @@ Features:
 - SHA-256 hash chain for integrity
 - Span/context support via ContextVars
 - Type-safe event emission (gate, metric, span)
+- Long-lived writer with configurable durability (fsync / group commit / OS-buffered)
+- Constant-time tail recovery (reverse seek, optional sidecar)
+- Optional segment rotation with a manifest chaining hashes across files
+- Bounded in-memory retention with an anchor hash for window verification
+- All-or-nothing batch emission (emit_many / transaction) with a single write
+- Multi-process appends to one file under an advisory lock (shared=True)
 """
 
 from __future__ import annotations
 
+import bisect
 import hashlib
+import hmac
+import io
 import json
+import multiprocessing
 import os
+import threading
 import time
 import uuid
-from collections.abc import Iterator, Mapping
-from contextlib import contextmanager
+import weakref
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, suppress
 from contextvars import ContextVar
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
-from typing import Any, TextIO
+from typing import Any, BinaryIO, NamedTuple, TextIO
+
+try:
+    import fcntl
+except ModuleNotFoundError:  # non-POSIX: shared appends are unavailable
+    fcntl = None  # type: ignore[assignment]
 
 # Context variable for current span
 _current_span: ContextVar[str | None] = ContextVar("current_span", default=None)
 
+# Durability modes for file-backed ledgers
+DURABILITY_FSYNC = "fsync"  # flush + fsync after every event
+DURABILITY_GROUP = "group"  # flush + fsync every N events or after T ms (and on flush/close)
+DURABILITY_OS = "os"  # flush to the OS after every event, never fsync
+DURABILITY_MODES = (DURABILITY_FSYNC, DURABILITY_GROUP, DURABILITY_OS)
+
+# In-memory retention of emitted events
+RETAIN_ALL = "all"  # keep every event (default)
+RETAIN_NONE = "none"  # keep no events
+RETAIN_LAST = "last"  # ring buffer of the last ``retain_last`` events
+RETAIN_SINCE_CHECKPOINT = "checkpoint"  # keep events since the last checkpoint()
+RETENTION_MODES = (RETAIN_ALL, RETAIN_NONE, RETAIN_LAST, RETAIN_SINCE_CHECKPOINT)
+
+# Sidecar next to a ledger file recording its tail position (``<name>.tail``)
+TAIL_SIDECAR_SUFFIX = ".tail"
+_TAIL_READ_BLOCK = 4096
+
+# Advisory lock file serializing shared appends (``<name>.lock``)
+LOCK_SUFFIX = ".lock"
+
+# Byte-offset index next to a ledger file (``<name>.idx``, see ledger_index)
+INDEX_SUFFIX = ".idx"
+
+# Segmented ledgers: sealed ``<stem>.<seq>.jsonl`` files listed in ``<stem>.manifest.json``
+SEGMENT_MANIFEST_SCHEMA_VERSION = "ledger_segments.v0.1"
+_SEGMENT_FIELD_TYPES: dict[str, Any] = {
+    "name": str,
+    "first_prev_hash": (str, type(None)),
+    "first_hash": str,
+    "last_hash": str,
+    "events": int,
+    "bytes": int,
+    "sha256": str,
+}
+
+# Keys of an ``emit_many`` item (the arguments of ``Ledger.event``)
+_BATCH_EVENT_KEYS = frozenset({"type", "payload", "event_id", "timestamp", "span_id"})
+_BATCH_REQUIRED_KEYS = frozenset({"type", "payload"})
+
+# The string encoder json.dumps uses with ensure_ascii (C-accelerated if available)
+_encode_json_str = json.encoder.encode_basestring_ascii
+
 _SERIALIZED_EVENT_REQUIRED_KEYS = frozenset({"type", "payload", "timestamp", "event_id", "hash"})
 _SERIALIZED_EVENT_ALLOWED_KEYS = _SERIALIZED_EVENT_REQUIRED_KEYS | {
     "span_id",
@@ -82,6 +143,178 @@ def _hash_event_content(event: Mapping[str, Any]) -> str:
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
+@dataclass(frozen=True)
+class LedgerTail:
+    """Position of the last event line in a ledger file.
+
+    ``offset`` is the byte offset where the last non-empty line starts and
+    ``end`` the offset just past it (including its newline). ``events`` is the
+    number of non-empty lines, when known.
+    """
+
+    last_hash: str | None
+    offset: int
+    end: int
+    events: int | None = None
+
+
+def _tail_hash(line: bytes) -> str | None:
+    """Extract the ``hash`` of a raw ledger line; None if it has no usable hash."""
+    try:
+        event = json.loads(line)
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(event, dict):
+        return None
+    value = event.get("hash")
+    return value if isinstance(value, str) else None
+
+
+def read_ledger_tail(path: str | Path) -> LedgerTail | None:
+    """Locate the last event line by seeking backwards from EOF.
+
+    Reads only the trailing blocks that contain the last non-empty line, so
+    the cost does not grow with the file size. Returns None for a missing or
+    blank file. A malformed last line yields ``last_hash=None``.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+
+    with path.open("rb") as handle:
+        return _tail_before(handle, handle.seek(0, os.SEEK_END))
+
+
+def _tail_before(handle: BinaryIO, position: int) -> LedgerTail | None:
+    """Last non-empty line that ends at or before byte ``position``."""
+    buffer = b""
+    while position > 0:
+        step = min(_TAIL_READ_BLOCK, position)
+        position -= step
+        handle.seek(position)
+        buffer = handle.read(step) + buffer
+        content = buffer.rstrip()
+        if not content:
+            continue
+        newline = content.rfind(b"\n")
+        if newline < 0 and position > 0:
+            continue
+        start = newline + 1
+        line_break = buffer.find(b"\n", len(content))
+        end = len(buffer) if line_break < 0 else line_break + 1
+        return LedgerTail(
+            last_hash=_tail_hash(content[start:].strip()),
+            offset=position + start,
+            end=position + end,
+        )
+    return None
+
+
+@dataclass(frozen=True)
+class LedgerSegment:
+    """Manifest entry of a sealed ledger segment.
+
+    ``first_prev_hash`` is the ``prev_hash`` of the segment's first event and
+    must equal the previous segment's ``last_hash`` (None for the first one).
+    ``sha256`` and ``bytes`` cover the raw segment file.
+    """
+
+    name: str
+    first_prev_hash: str | None
+    first_hash: str
+    last_hash: str
+    events: int
+    bytes: int
+    sha256: str
+
+
+def segment_manifest_path(path: str | Path) -> Path:
+    """Manifest path of a (possibly) segmented ledger at ``path``."""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.manifest.json")
+
+
+def _segment_path(path: Path, sequence: int) -> Path:
+    return path.with_name(f"{path.stem}.{sequence:06d}{path.suffix}")
+
+
+def load_segment_manifest(path: str | Path) -> list[LedgerSegment]:
+    """Sealed segments of the ledger at ``path`` in chain order.
+
+    Returns an empty list for an unsegmented ledger. A malformed manifest or a
+    segment name out of sequence raises ``ValueError``.
+    """
+    path = Path(path)
+    manifest = segment_manifest_path(path)
+    if not manifest.exists():
+        return []
+
+    data = json.loads(manifest.read_text(encoding="utf-8"))
+    if (
+        not isinstance(data, dict)
+        or data.get("manifest_schema_version") != SEGMENT_MANIFEST_SCHEMA_VERSION
+        or not isinstance(data.get("segments"), list)
+    ):
+        raise ValueError(f"invalid segment manifest: {manifest}")
+    segments: list[LedgerSegment] = []
+    for sequence, entry in enumerate(data["segments"], start=1):
+        if not isinstance(entry, dict) or set(entry) != set(_SEGMENT_FIELD_TYPES):
+            raise ValueError(f"segment manifest entry {sequence} has an invalid field set")
+        for name, kind in _SEGMENT_FIELD_TYPES.items():
+            if not isinstance(entry[name], kind) or isinstance(entry[name], bool):
+                raise ValueError(f"segment manifest entry {sequence} has wrong type: {name}")
+        if entry["name"] != _segment_path(path, sequence).name:
+            raise ValueError(f"segment manifest entry {sequence} is out of sequence")
+        segments.append(LedgerSegment(**entry))
+    return segments
+
+
+def _sealed_head(segments: list[LedgerSegment]) -> str | None:
+    """Hash the active file continues from: the last sealed ``last_hash``."""
+    return segments[-1].last_hash if segments else None
+
+
+def _write_segment_manifest(path: Path, segments: list[LedgerSegment]) -> None:
+    manifest = segment_manifest_path(path)
+    data = {
+        "manifest_schema_version": SEGMENT_MANIFEST_SCHEMA_VERSION,
+        "segments": [asdict(segment) for segment in segments],
+    }
+    scratch = manifest.with_name(manifest.name + ".tmp")
+    scratch.write_text(json.dumps(data, sort_keys=True, indent=2) + "\n", encoding="utf-8")
+    os.replace(scratch, manifest)
+
+
+def _seal_segment_entry(segment: Path, prev_hash: str | None) -> LedgerSegment:
+    """Verify a finished segment file and describe it for the manifest.
+
+    The segment's chain must verify line by line and link to ``prev_hash``,
+    the ``last_hash`` of the previous sealed segment (None for the first).
+    Otherwise sealing is refused with ``ValueError``: the manifest checksum
+    would vouch for tampered or broken events from then on.
+    """
+    check = _verify_range(segment, prev_hash=prev_hash)
+    if check is None:
+        raise ValueError(f"refusing to seal ledger segment with a broken hash chain: {segment}")
+    if check.first_hash is None or check.last_hash is None:
+        raise ValueError(f"cannot seal ledger segment without hashed events: {segment}")
+    digest = hashlib.sha256()
+    size = 0
+    with segment.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+            size += len(block)
+    return LedgerSegment(
+        name=segment.name,
+        first_prev_hash=check.first_prev_hash,
+        first_hash=check.first_hash,
+        last_hash=check.last_hash,
+        events=check.events,
+        bytes=size,
+        sha256=digest.hexdigest(),
+    )
+
+
 @dataclass
 class LedgerEvent:
     """Single ledger event with hash-chain support."""
@@ -124,6 +357,114 @@ class LedgerEvent:
         )
 
 
+def _build_event(
+    event_type: str,
+    payload: Mapping[str, Any],
+    event_id: str | None,
+    timestamp: float | None,
+    span_id: str | None,
+) -> tuple[LedgerEvent, str]:
+    """Validate and canonicalise the arguments of :meth:`Ledger.event` (unchained).
+
+    Returns the event and the canonical JSON encoding of its payload, which
+    :func:`_encode_event` reuses for the hash and the file line.
+    """
+    if not isinstance(event_type, str) or not event_type.strip():
+        raise ValueError("event_type must be a non-empty string")
+    if not isinstance(payload, Mapping):
+        raise ValueError("payload must be a mapping")
+    if event_id is not None and (not isinstance(event_id, str) or not event_id.strip()):
+        raise ValueError("event_id must be a non-empty string when provided")
+    if timestamp is not None and (
+        isinstance(timestamp, bool) or not isinstance(timestamp, (int, float))
+    ):
+        raise ValueError("timestamp must be int or float when provided")
+
+    try:
+        canonical = json.dumps(
+            dict(payload), sort_keys=True, separators=(",", ":"), allow_nan=False
+        )
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"payload is not canonically JSON-serializable: {exc}") from exc
+    payload_copy: dict[str, Any] = json.loads(canonical)
+
+    kwargs: dict[str, Any] = {"type": event_type, "payload": payload_copy}
+    if event_id is not None:
+        kwargs["event_id"] = event_id
+    if timestamp is not None:
+        kwargs["timestamp"] = float(timestamp)
+    if span_id is not None:
+        kwargs["span_id"] = span_id
+
+    return LedgerEvent(**kwargs), canonical
+
+
+def _encode_json_scalar(value: str | float | None) -> str:
+    if value is None:
+        return "null"
+    if type(value) is str:
+        return _encode_json_str(value)
+    return json.dumps(value)
+
+
+def _encode_event(event: LedgerEvent, payload_json: str) -> str:
+    """Hash a chained event and return its file line from one payload encoding.
+
+    ``payload_json`` must be the canonical (``sort_keys``) encoding of
+    ``event.payload``. The hashed content is assembled in sorted key order and
+    the line in :meth:`LedgerEvent.to_dict` order, so both are byte-identical
+    to :func:`_hash_event_content` and ``json.dumps(event.to_dict())``.
+    """
+    event_type = _encode_json_str(event.type)
+    event_id = _encode_json_str(event.event_id)
+    timestamp = _encode_json_scalar(event.timestamp)
+    span_id = _encode_json_scalar(event.span_id)
+    prev_hash = _encode_json_scalar(event.prev_hash)
+    content = (
+        f'{{"event_id":{event_id},"payload":{payload_json},"prev_hash":{prev_hash},'
+        f'"span_id":{span_id},"timestamp":{timestamp},"type":{event_type}}}'
+    )
+    event.hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    line = f'{{"type":{event_type},"payload":{payload_json},"timestamp":{timestamp},'
+    line += f'"event_id":{event_id}'
+    if event.span_id is not None:
+        line += f',"span_id":{span_id}'
+    if event.prev_hash is not None:
+        line += f',"prev_hash":{prev_hash}'
+    return line + f',"hash":"{event.hash}"}}\n'
+
+
+class LedgerTransaction:
+    """Events collected by :meth:`Ledger.transaction`, emitted together on exit."""
+
+    def __init__(self) -> None:
+        self.events: list[LedgerEvent] = []
+        self._payloads: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def event(
+        self,
+        event_type: str,
+        payload: Mapping[str, Any],
+        *,
+        event_id: str | None = None,
+        timestamp: float | None = None,
+        span_id: str | None = None,
+    ) -> LedgerEvent:
+        """Validate and queue a generic domain event (same arguments as :meth:`Ledger.event`).
+
+        The returned event gets its hash-chain fields when the transaction commits.
+        """
+        if span_id is None:
+            span_id = _current_span.get()
+        event, payload_json = _build_event(event_type, payload, event_id, timestamp, span_id)
+        self.events.append(event)
+        self._payloads.append(payload_json)
+        return event
+
+
 class Ledger:
     """Append-only runtime ledger with hash-chain integrity.
 
@@ -141,65 +482,520 @@ class Ledger:
         path: str | Path | None = None,
         run_id: str | None = None,
         manifest_sha256: str | None = None,
+        *,
+        durability: str = DURABILITY_OS,
+        commit_every: int = 64,
+        commit_interval_ms: float = 50.0,
+        tail_sidecar: bool = False,
+        segment_max_bytes: int | None = None,
+        segment_max_events: int | None = None,
+        index: bool = False,
+        retention: str = RETAIN_ALL,
+        retain_last: int | None = None,
+        shared: bool = False,
     ):
         """Initialize ledger.
 
+        The JSONL file is opened lazily on the first event and kept open until
+        :meth:`close`. With ``DURABILITY_GROUP`` the most recent events may sit
+        in the process buffer until the next group commit; other readers see
+        them only after :meth:`flush` or :meth:`close`. A timer thread commits
+        pending events once the oldest is ``commit_interval_ms`` old, also when
+        no further event is emitted.
+
         Args:
             path: Path to JSONL file. If None, events are stored in memory only.
             run_id: Optional run identifier for correlation.
             manifest_sha256: Optional static manifest hash for integrity.
+            durability: One of ``DURABILITY_MODES`` (default: OS-buffered).
+            commit_every: Group commit after this many pending events.
+            commit_interval_ms: Group commit once the oldest pending event is
+                this old (milliseconds), at the latest by the commit timer.
+            tail_sidecar: Maintain ``<path>.tail`` with the last hash, offset
+                and event count. It is refreshed on flush/close and group
+                commits and only trusted after a cross-check against the file.
+            segment_max_bytes: Seal the active file as a segment once it
+                reaches this size. The file at ``path`` stays the active
+                segment; sealed ones become ``<stem>.000001<suffix>`` etc.
+            segment_max_events: Seal the active file after this many events.
+            index: Maintain a byte-offset index (``<path>.idx``, see
+                :mod:`src.core.ledger_index`) while appending.
+            retention: Which emitted events stay in memory, one of
+                ``RETENTION_MODES``. Dropped events only leave memory; the
+                hash of the last dropped one becomes the anchor for
+                :meth:`verify_chain`.
+            retain_last: Ring buffer size for ``RETAIN_LAST``.
+            shared: Coordinate appends with other processes writing the same
+                file. Every append takes an advisory lock on ``<path>.lock``,
+                re-reads the file tail and chains onto it; lines always reach
+                the OS before the lock is released. When another process
+                appended in between, the in-memory window restarts at the file
+                tail. Needs ``fcntl`` (POSIX); not combinable with
+                ``tail_sidecar``, ``index`` or ``segment_max_events``, whose
+                per-process counters would go stale.
         """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"unknown durability mode: {durability!r}")
+        if commit_every < 1:
+            raise ValueError("commit_every must be >= 1")
+        if commit_interval_ms < 0:
+            raise ValueError("commit_interval_ms must be >= 0")
+        for name, limit in (
+            ("segment_max_bytes", segment_max_bytes),
+            ("segment_max_events", segment_max_events),
+        ):
+            if limit is not None and limit < 1:
+                raise ValueError(f"{name} must be >= 1")
+        if retention not in RETENTION_MODES:
+            raise ValueError(f"unknown retention mode: {retention!r}")
+        if (retention == RETAIN_LAST) != (retain_last is not None):
+            raise ValueError("retain_last is required with (and only with) RETAIN_LAST")
+        if retain_last is not None and retain_last < 1:
+            raise ValueError("retain_last must be >= 1")
+        if shared:
+            if fcntl is None:
+                raise ValueError("shared appends need POSIX advisory locks (fcntl)")
+            if not path:
+                raise ValueError("shared appends need a ledger path")
+            if tail_sidecar or index or segment_max_events is not None:
+                raise ValueError(
+                    "shared appends do not support tail_sidecar, index or segment_max_events"
+                )
         self.path = Path(path) if path else None
         self.run_id = run_id or os.environ.get("ENTA_RUN_ID") or str(uuid.uuid4())
         self.manifest_sha256 = manifest_sha256 or os.environ.get("ENTA_STATIC_MANIFEST_SHA256")
-        self._events: list[LedgerEvent] = []
+        self.durability = durability
+        self.commit_every = commit_every
+        self.commit_interval_ms = commit_interval_ms
+        self.retention = retention
+        self._events: list[LedgerEvent] | deque[LedgerEvent] = (
+            deque(maxlen=retain_last) if retain_last is not None else []
+        )
         self._prev_hash: str | None = None
+        self._anchor_hash: str | None = None
         self._file: TextIO | None = None
+        self._file_finalizer: weakref.finalize | None = None
+        self._pending = 0
+        self._pending_since = 0.0
+        self._commit_timer: threading.Timer | None = None
+        # Serializes file access between emitting threads and the commit timer
+        # (reentrant: close() calls flush(), _rotate() calls _commit()).
+        self._io_lock = threading.RLock()
+        self.tail_sidecar = tail_sidecar
+        self._persisted_events: int | None = 0 if tail_sidecar else None
+        self._tail_offset = 0
+        self._written_hash: str | None = None  # hash of the last line written to the file
+        self._file_end = 0
+        self.segment_max_bytes = segment_max_bytes
+        self.segment_max_events = segment_max_events
+        self._segment_events = 0
+        self.index = index
+        self._index: Any = None  # ledger_index.LedgerIndex, created on first write
+        self.shared = shared
+        self._lock_fd: int | None = None
+        self._lock_finalizer: weakref.finalize | None = None
 
         # Initialize file if path provided
         if self.path:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            # Load existing hash chain if file exists
-            if self.path.exists():
+            # Load existing hash chain (active file or last sealed segment)
+            if shared:
+                self._lock_shared()
+                try:
+                    self._load_last_hash()
+                finally:
+                    self._unlock_shared()
+            else:
                 self._load_last_hash()
 
+    @property
+    def sidecar_path(self) -> Path | None:
+        """Path of the tail sidecar, if this ledger maintains one."""
+        if self.path is None or not self.tail_sidecar:
+            return None
+        return self.path.with_name(self.path.name + TAIL_SIDECAR_SUFFIX)
+
+    @property
+    def persisted_events(self) -> int | None:
+        """Number of event lines in the file (tracked only with ``tail_sidecar``)."""
+        return self._persisted_events
+
+    @property
+    def segmented(self) -> bool:
+        """Whether this ledger rotates its file into sealed segments."""
+        return self.segment_max_bytes is not None or self.segment_max_events is not None
+
     def _load_last_hash(self) -> None:
-        """Load the last hash from existing ledger file."""
-        if not self.path or not self.path.exists():
+        """Load the last hash from existing ledger file (reverse seek, O(1)).
+
+        An empty or missing active file continues the chain from the last
+        sealed segment, if the ledger has a manifest.
+        """
+        if not self.path:
             return
 
-        last_line = None
-        with open(self.path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    last_line = line
+        segments = self._complete_interrupted_seal()
+        if not self.path.exists():
+            if segments:
+                self._prev_hash = self._anchor_hash = segments[-1].last_hash
+            return
 
-        if last_line:
+        tail = read_ledger_tail(self.path)
+        if tail is not None:
+            self._prev_hash = tail.last_hash
+            self._tail_offset = tail.offset
+            self._written_hash = tail.last_hash
+        elif segments:
+            self._prev_hash = segments[-1].last_hash
+        self._anchor_hash = self._prev_hash
+        if self.tail_sidecar:
+            self._persisted_events = self._recover_event_count(tail)
+        if self.segmented and tail is not None:
+            # Bounded by the segment size limits.
+            with self.path.open("rb") as handle:
+                self._segment_events = sum(1 for raw in handle if raw.strip())
+
+    def _complete_interrupted_seal(self) -> list[LedgerSegment]:
+        """Register a segment that was renamed but not yet added to the manifest.
+
+        The orphan is verified like a regular rotation; a broken chain raises
+        ``ValueError`` and leaves it unregistered.
+        """
+        path = self._require_path()
+        segments = load_segment_manifest(path)
+        orphan = _segment_path(path, len(segments) + 1)
+        if orphan.exists():
+            segments.append(_seal_segment_entry(orphan, _sealed_head(segments)))
+            _write_segment_manifest(path, segments)
+        return segments
+
+    def _recover_event_count(self, tail: LedgerTail | None) -> int:
+        """Event count from the sidecar, cross-checked against the file.
+
+        The sidecar is trusted only if the line at its recorded offset still
+        carries its recorded hash; lines appended after it are counted. A
+        missing or inconsistent sidecar falls back to a full count.
+        """
+        path, sidecar = self._require_path(), self.sidecar_path
+        if sidecar is None:
+            raise RuntimeError("ledger does not maintain a tail sidecar")
+        if tail is None:
+            return 0
+        try:
+            recorded = json.loads(sidecar.read_text(encoding="utf-8"))
+            offset, end, events = recorded["offset"], recorded["end"], recorded["events"]
+            recorded_hash = recorded["hash"]
+            if not all(isinstance(value, int) for value in (offset, end, events)):
+                raise ValueError("sidecar positions must be integers")
+            with path.open("rb") as handle:
+                handle.seek(offset)
+                line = handle.readline()
+                if offset + len(line) != end or _tail_hash(line.strip()) != recorded_hash:
+                    raise ValueError("sidecar does not match ledger file")
+                if recorded_hash is None or end > tail.end:
+                    raise ValueError("sidecar points past the ledger tail")
+                return int(events) + sum(1 for raw in handle if raw.strip())
+        except (OSError, ValueError, KeyError, TypeError):
+            with path.open("rb") as handle:
+                return sum(1 for raw in handle if raw.strip())
+
+    def _write_sidecar(self) -> None:
+        """Atomically record the current tail position next to the ledger."""
+        sidecar = self.sidecar_path
+        if sidecar is None or not self._persisted_events:
+            return
+        record = {
+            "hash": self._written_hash,
+            "offset": self._tail_offset,
+            "end": self._file_end,
+            "events": self._persisted_events,
+        }
+        scratch = sidecar.with_name(sidecar.name + ".tmp")
+        scratch.write_text(json.dumps(record, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(scratch, sidecar)
+
+    @property
+    def lock_path(self) -> Path | None:
+        """Path of the advisory lock file, if this ledger appends in shared mode."""
+        if self.path is None or not self.shared:
+            return None
+        return self.path.with_name(self.path.name + LOCK_SUFFIX)
+
+    def _lock_shared(self) -> None:
+        """Take the exclusive advisory lock serializing shared appends."""
+        if self._lock_fd is None:
+            lock_path = self.lock_path
+            if lock_path is None:
+                raise RuntimeError("only a file-backed shared ledger takes the append lock")
+            self._lock_fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._lock_finalizer = weakref.finalize(self, os.close, self._lock_fd)
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+
+    def _unlock_shared(self) -> None:
+        if self._lock_fd is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _release_lock(self) -> None:
+        if self._lock_finalizer is not None:
+            self._lock_finalizer()
+            self._lock_finalizer = None
+            self._lock_fd = None
+
+    def _adopt_shared_tail(self) -> None:
+        """Continue the chain from the file as other processes left it (lock held).
+
+        One ``stat`` when nothing changed since this ledger's last write;
+        otherwise the tail is re-read (reverse seek) and, after a rotation by
+        another process, the handle is reopened on the new active file.
+        """
+        with self._io_lock:
+            path = self._require_path()
             try:
-                event = json.loads(last_line)
-                self._prev_hash = event.get("hash")
-            except json.JSONDecodeError:
-                pass
+                stat: os.stat_result | None = os.stat(path)
+            except FileNotFoundError:
+                stat = None
+            if self._file is not None:
+                same_file = stat is not None and os.fstat(self._file.fileno()).st_ino == stat.st_ino
+                if same_file and stat is not None and stat.st_size == self._file_end:
+                    return
+                if not same_file:
+                    if self._pending:
+                        self._commit()
+                    self._release_file()
+            tail = read_ledger_tail(path) if stat is not None else None
+            if tail is not None:
+                head: str | None = tail.last_hash
+                self._tail_offset = tail.offset
+            else:
+                segments = load_segment_manifest(path)
+                head = segments[-1].last_hash if segments else None
+                self._tail_offset = 0
+            self._written_hash = head
+            self._file_end = stat.st_size if stat is not None else 0
+            if head != self._prev_hash:
+                # Another process extended the chain: restart the window at its head.
+                self._events.clear()
+                self._anchor_hash = self._prev_hash = head
 
     def _emit(self, event: LedgerEvent) -> None:
         """Emit event to ledger with hash-chain."""
-        # Set span from context if not explicitly set
-        if event.span_id is None:
-            event.span_id = _current_span.get()
-
-        # Set hash chain
-        event.prev_hash = self._prev_hash
-        event.hash = event.compute_hash()
-        self._prev_hash = event.hash
+        self._emit_batch([event], [None])
+
+    def _retain(self, event: LedgerEvent) -> None:
+        """Keep ``event`` in memory; move the anchor past events that drop out."""
+        events = self._events
+        if self.retention == RETAIN_NONE:
+            self._anchor_hash = event.hash
+        elif isinstance(events, deque) and len(events) == events.maxlen:
+            self._anchor_hash = events[0].hash
+            events.append(event)
+        else:
+            events.append(event)
+
+    @property
+    def anchor_hash(self) -> str | None:
+        """Hash preceding the oldest retained event.
+
+        None for a fresh chain; otherwise the hash of the last event that
+        dropped out of memory, or the file tail the ledger was opened on.
+        """
+        return self._anchor_hash
 
-        # Store in memory
-        self._events.append(event)
+    def checkpoint(self) -> str | None:
+        """Mark a checkpoint at the current chain head and return its hash.
 
-        # Write to file if path configured
-        if self.path:
-            with open(self.path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(event.to_dict(), separators=(",", ":")) + "\n")
+        With ``RETAIN_SINCE_CHECKPOINT`` the retained events are released and
+        the head becomes the new anchor. File-backed events are flushed first.
+        """
+        self.flush()
+        return self._mark_checkpoint()
+
+    def _mark_checkpoint(self) -> str | None:
+        """The in-memory part of :meth:`checkpoint`, without any I/O."""
+        if self.retention == RETAIN_SINCE_CHECKPOINT:
+            self._events.clear()
+            self._anchor_hash = self._prev_hash
+        return self._prev_hash
+
+    def _require_path(self) -> Path:
+        """The ledger file path; file operations on an in-memory ledger are a bug."""
+        if self.path is None:
+            raise RuntimeError("ledger has no file path")
+        return self.path
+
+    def _open_file(self) -> TextIO:
+        """Open the append handle once and keep it for subsequent events."""
+        if self._file is None:
+            self._file = open(self._require_path(), "a", encoding="utf-8")
+            self._file_end = os.fstat(self._file.fileno()).st_size
+            # Closes the handle of a ledger that is dropped without close().
+            self._file_finalizer = weakref.finalize(self, self._file.close)
+        return self._file
+
+    def _write_lines(self, lines: list[str], events: list[LedgerEvent]) -> None:
+        """Append serialized lines with one write and apply the durability policy.
+
+        The lines count as one unit: they are flushed or committed together.
+        If the write or its durability step fails, the file is cut back to
+        where the unit began and the error is re-raised, so nothing of the
+        unit stays appended. Rotation is left to :meth:`_rotate_if_due`.
+        """
+        with self._io_lock:
+            handle = self._open_file()
+            if self.index and self._index is None:
+                # Imported here: ledger_index builds on this module.
+                from .ledger_index import LedgerIndex
+
+                self._index = LedgerIndex(self._require_path())
+            before = (
+                self._file_end,
+                self._tail_offset,
+                self._written_hash,
+                self._persisted_events,
+                self._pending,
+            )
+            try:
+                handle.write("".join(lines))
+                for line, event in zip(lines, events):
+                    # Lines are ASCII (json.dumps escapes non-ASCII), so len() is the byte size.
+                    self._tail_offset = self._file_end
+                    self._file_end += len(line)
+                    if self._index is not None:
+                        self._index.record(self._tail_offset, len(line), event.to_dict())
+                self._written_hash = events[-1].hash
+                if self._persisted_events is not None:
+                    self._persisted_events += len(lines)
+                if self.durability == DURABILITY_OS:
+                    handle.flush()
+                elif self.durability == DURABILITY_FSYNC:
+                    self._commit()
+                else:
+                    if self.shared:
+                        # Other processes append right after the lock is released.
+                        handle.flush()
+                    if self._pending == 0:
+                        self._pending_since = time.monotonic()
+                    self._pending += len(lines)
+                    elapsed_ms = (time.monotonic() - self._pending_since) * 1000.0
+                    if self._pending >= self.commit_every or elapsed_ms >= self.commit_interval_ms:
+                        self._group_commit()
+                    elif self._commit_timer is None:
+                        self._start_commit_timer(self.commit_interval_ms - elapsed_ms)
+            except BaseException:
+                self._discard_unit(*before)
+                raise
+            if self.segmented:
+                self._segment_events += len(lines)
+
+    def _discard_unit(
+        self,
+        file_end: int,
+        tail_offset: int,
+        written_hash: str | None,
+        persisted_events: int | None,
+        pending: int,
+    ) -> None:
+        """Undo a failed :meth:`_write_lines`: cut the file back to ``file_end``.
+
+        The handle is dropped (its buffer may still hold part of the unit) and
+        the index is closed; the next write reopens both, and the index
+        rebuilds itself if its sidecar ran ahead of the file.
+        """
+        handle, self._file = self._file, None
+        if self._file_finalizer is not None:
+            self._file_finalizer.detach()
+            self._file_finalizer = None
+        if handle is not None:
+            with suppress(OSError):
+                handle.close()
+        if self._index is not None:
+            with suppress(OSError):
+                self._index.close()
+            self._index = None
+        with suppress(OSError):
+            os.truncate(self._require_path(), file_end)
+        self._file_end, self._tail_offset, self._written_hash = file_end, tail_offset, written_hash
+        self._persisted_events, self._pending = persisted_events, pending
+
+    def _rotate_if_due(self) -> None:
+        """Rotate once the active file reached a segment limit (after a whole unit)."""
+        with self._io_lock:
+            if (
+                self.segment_max_events is not None
+                and self._segment_events >= self.segment_max_events
+            ) or (self.segment_max_bytes is not None and self._file_end >= self.segment_max_bytes):
+                self._rotate()
+
+    def _rotate(self) -> None:
+        """Seal the active file as the next segment and start an empty one.
+
+        The segment's chain is verified against the last sealed hash first; a
+        broken chain raises ``ValueError`` and the active file stays in place.
+        The segment is fsynced before it is renamed, and the manifest is
+        replaced atomically afterwards. A crash in between leaves a renamed
+        segment that the next ``Ledger`` on this path registers.
+        """
+        path = self._require_path()
+        self._commit()
+        self._release_file()
+        segments = load_segment_manifest(path)
+        entry = _seal_segment_entry(path, _sealed_head(segments))
+        sealed = _segment_path(path, len(segments) + 1)
+        os.replace(path, sealed)
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        active_index = path.with_name(path.name + INDEX_SUFFIX)
+        if active_index.exists():
+            os.replace(active_index, sealed.with_name(sealed.name + INDEX_SUFFIX))
+        segments.append(replace(entry, name=sealed.name))
+        _write_segment_manifest(path, segments)
+        self._segment_events = 0
+        self._tail_offset = 0
+        self._file_end = 0
+        if self._persisted_events is not None:
+            self._persisted_events = 0
+            sidecar = self.sidecar_path
+            if sidecar is not None and sidecar.exists():
+                sidecar.unlink()
+
+    def _commit(self) -> None:
+        """Flush buffered lines and fsync them to stable storage."""
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        timer, self._commit_timer = self._commit_timer, None
+        if timer is not None:
+            timer.cancel()
+
+    def _group_commit(self) -> None:
+        """Commit pending events and refresh the tail sidecar and the index."""
+        self._commit()
+        self._write_sidecar()
+        if self._index is not None:
+            self._index.flush()
+
+    def _start_commit_timer(self, delay_ms: float) -> None:
+        """Commit pending events after ``delay_ms`` even if no further event arrives."""
+        timer = threading.Timer(delay_ms / 1000.0, _commit_when_due, args=(weakref.ref(self),))
+        timer.daemon = True
+        self._commit_timer = timer
+        timer.start()
+
+    def _commit_due(self) -> None:
+        """Timer thread: group-commit the events that waited ``commit_interval_ms``.
+
+        A failing commit leaves the events pending; the next emit, ``flush()``
+        or ``close()`` commits them again and raises in the caller.
+        """
+        with self._io_lock:
+            if self._commit_timer is not threading.current_thread():
+                return  # a commit in between already covered these events
+            self._commit_timer = None
+            if self._pending:
+                self._group_commit()
 
     def event(
         self,
@@ -227,36 +1023,116 @@ class Ledger:
         Returns:
             Das emittierte LedgerEvent inklusive Hash-Chain-Feldern.
         """
-        if not isinstance(event_type, str) or not event_type.strip():
-            raise ValueError("event_type must be a non-empty string")
-        if not isinstance(payload, Mapping):
-            raise ValueError("payload must be a mapping")
-        if event_id is not None and (not isinstance(event_id, str) or not event_id.strip()):
-            raise ValueError("event_id must be a non-empty string when provided")
-        if timestamp is not None and (
-            isinstance(timestamp, bool) or not isinstance(timestamp, (int, float))
-        ):
-            raise ValueError("timestamp must be int or float when provided")
+        event, payload_json = _build_event(event_type, payload, event_id, timestamp, span_id)
+        self._emit_batch([event], [payload_json])
+        return event
+
+    def emit_many(self, events: Iterable[Mapping[str, Any]]) -> list[LedgerEvent]:
+        """Emit a batch of generic domain events, all or nothing.
 
+        Each item carries the arguments of :meth:`event` as keys (required
+        ``type`` and ``payload``, optional ``event_id``, ``timestamp``,
+        ``span_id``).
+        All items are validated and canonicalised before the first one is
+        chained; any invalid item raises ``ValueError`` and nothing is
+        appended. The batch is then hash-chained in one pass and written to
+        the file with a single write, flushed or committed as one unit. A
+        batch is never split across segments; rotation is considered after it.
+
+        Args:
+            events: Event specifications in chain order.
+
+        Returns:
+            The emitted LedgerEvents with their hash-chain fields.
+        """
+        batch: list[LedgerEvent] = []
+        payloads: list[str] = []
+        for position, spec in enumerate(events):
+            if not isinstance(spec, Mapping):
+                raise ValueError(f"batch item {position} must be a mapping")
+            unknown = set(spec) - _BATCH_EVENT_KEYS
+            if unknown:
+                raise ValueError(f"batch item {position} has unknown keys: {sorted(unknown)}")
+            missing = _BATCH_REQUIRED_KEYS - set(spec)
+            if missing:
+                raise ValueError(f"batch item {position} is missing keys: {sorted(missing)}")
+            try:
+                event, payload_json = _build_event(
+                    spec["type"],
+                    spec["payload"],
+                    spec.get("event_id"),
+                    spec.get("timestamp"),
+                    spec.get("span_id"),
+                )
+            except ValueError as exc:
+                raise ValueError(f"batch item {position}: {exc}") from exc
+            batch.append(event)
+            payloads.append(payload_json)
+        self._emit_batch(batch, payloads)
+        return batch
+
+    def _emit_batch(self, batch: list[LedgerEvent], payloads: Sequence[str | None]) -> None:
+        """Chain, write and retain events as one unit, all or nothing.
+
+        ``payloads`` are the canonical payload encodings from
+        :func:`_build_event`; each is serialised into the hash and the file
+        line without encoding the payload again. Events of the typed helpers
+        (``None`` payload encoding) keep their payload's key order on disk.
+        The chain head and the retained window only advance once the unit is
+        written. In shared mode the whole unit runs under the append lock.
+        """
+        if not batch:
+            return
+        if self.shared:
+            self._lock_shared()
         try:
-            canonical = json.dumps(
-                dict(payload), sort_keys=True, separators=(",", ":"), allow_nan=False
-            )
-        except (TypeError, ValueError) as exc:
-            raise ValueError(f"payload is not canonically JSON-serializable: {exc}") from exc
-        payload_copy: dict[str, Any] = json.loads(canonical)
-
-        kwargs: dict[str, Any] = {"type": event_type, "payload": payload_copy}
-        if event_id is not None:
-            kwargs["event_id"] = event_id
-        if timestamp is not None:
-            kwargs["timestamp"] = float(timestamp)
-        if span_id is not None:
-            kwargs["span_id"] = span_id
-
-        event = LedgerEvent(**kwargs)
-        self._emit(event)
-        return event
+            if self.shared:
+                self._adopt_shared_tail()
+            context_span = _current_span.get()
+            prev_hash = self._prev_hash
+            lines = []
+            for event, payload_json in zip(batch, payloads):
+                if event.span_id is None:
+                    event.span_id = context_span
+                event.prev_hash = prev_hash
+                if payload_json is None:
+                    event.hash = event.compute_hash()
+                    lines.append(json.dumps(event.to_dict(), separators=(",", ":")) + "\n")
+                else:
+                    lines.append(_encode_event(event, payload_json))
+                prev_hash = event.hash
+            if self.path:
+                # First: a failed write leaves the chain head and window unchanged.
+                self._write_lines(lines, batch)
+            self._prev_hash = prev_hash
+            for event in batch:
+                self._retain(event)
+            if self.path and self.segmented:
+                self._rotate_if_due()
+        finally:
+            if self.shared:
+                self._unlock_shared()
+
+    @contextmanager
+    def transaction(self) -> Iterator[LedgerTransaction]:
+        """Collect events and emit them with :meth:`emit_many` on success.
+
+        Events added inside the block are validated immediately but only
+        chained and written when the block exits normally; if it raises,
+        nothing is appended. Events pick up the span active when they are
+        added.
+
+        Usage:
+            with ledger.transaction() as tx:
+                for row in rows:
+                    tx.event("MATERIAL_REGISTERED", row)
+
+        Yields:
+            The transaction collecting the events
+        """
+        transaction = LedgerTransaction()
+        yield transaction
+        self._emit_batch(transaction.events, transaction._payloads)
 
     def metric(self, metric_id: str, value: float, **tags: Any) -> None:
         """Emit a metric event.
@@ -331,18 +1207,36 @@ class Ledger:
         Returns:
             List of event dictionaries
         """
-        events = [e.to_dict() for e in self._events]
         if event_type:
-            events = [e for e in events if e["type"] == event_type]
-        return events
+            return [e.to_dict() for e in self._events if e.type == event_type]
+        return [e.to_dict() for e in self._events]
 
     def verify_chain(self) -> bool:
         """Verify the integrity of the hash chain.
 
+        Covers the retained events, linked to :attr:`anchor_hash`; see
+        :meth:`verify_window`.
+
         Returns:
             True if hash chain is valid, False otherwise
         """
-        prev_hash = None
+        return self.verify_window(self._anchor_hash)
+
+    def verify_window(self, anchor_hash: str | None) -> bool:
+        """Verify the retained events against an externally stored anchor.
+
+        The oldest retained event must link to ``anchor_hash``, every event's
+        hash must match its content, and the window must end at the current
+        chain head.
+
+        Args:
+            anchor_hash: Hash preceding the oldest retained event (None for
+                the start of a chain).
+
+        Returns:
+            True if the retained window is valid, False otherwise
+        """
+        prev_hash = anchor_hash
         for event in self._events:
             if event.prev_hash != prev_hash:
                 return False
@@ -351,12 +1245,50 @@ class Ledger:
             if event.hash != computed:
                 return False
             prev_hash = event.hash
-        return True
+        return prev_hash == self._prev_hash
+
+    def flush(self) -> None:
+        """Write out buffered events.
+
+        In ``DURABILITY_OS`` mode events are already handed to the OS; otherwise
+        pending events are flushed and fsynced.
+        """
+        with self._io_lock:
+            if self._file is None:
+                return
+            if self.durability == DURABILITY_OS:
+                self._file.flush()
+            else:
+                self._commit()
+            self._write_sidecar()
+            if self._index is not None:
+                self._index.flush()
 
     def close(self) -> None:
-        """Close the ledger (flush any buffered writes)."""
-        # Currently no buffering, but provided for future use
-        pass
+        """Close the ledger: flush buffered writes and release the file handle.
+
+        A closed ledger stays usable; the next event reopens the file.
+        """
+        self._release_lock()
+        with self._io_lock:
+            if self._file is None:
+                return
+            try:
+                self.flush()
+            finally:
+                self._release_file()
+                if self._index is not None:
+                    self._index.close()
+                    self._index = None
+
+    def _release_file(self) -> None:
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        if self._file_finalizer is not None:
+            self._file_finalizer.detach()
+            self._file_finalizer = None
 
     def __enter__(self) -> Ledger:
         return self
@@ -365,6 +1297,45 @@ class Ledger:
         self.close()
 
 
+def _commit_when_due(ref: weakref.ref[Ledger]) -> None:
+    """Commit timer callback; the weak reference lets an abandoned ledger be collected."""
+    ledger = ref()
+    if ledger is not None:
+        ledger._commit_due()
+
+
+def iter_ledger(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Lazily yield events from a ledger file, one parsed line at a time.
+
+    Same tolerant semantics as :func:`load_ledger`, but without holding the
+    whole file in memory; suitable for streaming into ``replay_events``.
+    Sealed segments listed in the ledger's manifest are yielded first.
+
+    Args:
+        path: Path to JSONL ledger file
+
+    Yields:
+        Event dictionaries in file order
+    """
+    path = Path(path)
+    try:
+        segments = load_segment_manifest(path)
+    except (OSError, UnicodeError, ValueError):
+        segments = []
+    files = [_segment_path(path, sequence) for sequence in range(1, len(segments) + 1)]
+    for file in [*files, path]:
+        if not file.exists():
+            continue
+        with open(file, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+
 def load_ledger(path: str | Path) -> list[dict[str, Any]]:
     """Load events from a ledger file.
 
@@ -377,55 +1348,455 @@ def load_ledger(path: str | Path) -> list[dict[str, Any]]:
     Returns:
         List of event dictionaries
     """
-    events: list[dict[str, Any]] = []
-    path = Path(path)
-    if not path.exists():
-        return events
+    return list(iter_ledger(path))
 
-    with open(path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
 
-    return events
+class _ChainedFiles(io.RawIOBase):
+    """Read-only raw stream over several files as one byte sequence.
 
+    File sizes are taken once at open; bytes appended later are not read.
+    """
 
-def verify_chain_from_file(path: str | Path) -> bool:
-    """Verify a persisted ledger strictly and fail closed on malformed input.
+    def __init__(self, files: list[Path]) -> None:
+        super().__init__()
+        self._files = files
+        self._starts: list[int] = []
+        size = 0
+        for file in files:
+            self._starts.append(size)
+            size += file.stat().st_size
+        self._size = size
+        self._position = 0
+        self._current = -1
+        self._handle: io.BufferedReader | None = None
+
+    def readable(self) -> bool:
+        return True
 
-    A non-existent or empty file is treated as a valid empty chain. Any unreadable
-    JSONL line, non-object record, unknown field, missing required field, broken
-    link, or hash mismatch makes the verification fail.
-    """
-    path = Path(path)
-    if not path.exists():
+    def seekable(self) -> bool:
         return True
 
-    prev_hash: str | None = None
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self._position = offset
+        return offset
+
+    def readinto(self, buffer: Any) -> int:
+        if self._position >= self._size:
+            return 0
+        index = bisect.bisect_right(self._starts, self._position) - 1
+        if index != self._current or self._handle is None:
+            self._close_handle()
+            self._handle = self._files[index].open("rb")
+            self._current = index
+        self._handle.seek(self._position - self._starts[index])
+        limit = min(len(buffer), self._size - self._position)
+        read = self._handle.readinto(memoryview(buffer)[:limit])
+        self._position += read
+        return read
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def close(self) -> None:
+        self._close_handle()
+        super().close()
+
+
+def open_ledger_stream(path: str | Path) -> BinaryIO:
+    """Open a ledger as one read-only binary stream in chain order.
+
+    Sealed segments listed in the ledger's manifest come first, then the
+    active file; offsets and line numbers run across all of them. Unlike
+    :func:`iter_ledger` this reader is strict: a malformed manifest raises
+    ``ValueError`` and a missing segment or an unsegmented, missing ledger
+    raises ``FileNotFoundError``.
+    """
+    path = Path(path)
+    segments = load_segment_manifest(path)
+    if not segments:
+        return path.open("rb")
+    files = [_segment_path(path, sequence) for sequence in range(1, len(segments) + 1)]
+    if path.exists():
+        files.append(path)
+    return io.BufferedReader(_ChainedFiles(files))
+
+
+class _RangeCheck(NamedTuple):
+    """Outcome of verifying a byte range of a ledger file."""
+
+    first_prev_hash: str | None
+    first_hash: str | None
+    last_hash: str | None
+    events: int
+    end: int  # offset just past the last newline-terminated line read
+
+
+def _verify_range(
+    path: Path,
+    start: int = 0,
+    stop: int | None = None,
+    prev_hash: str | None = None,
+    *,
+    linked: bool = True,
+) -> _RangeCheck | None:
+    """Strictly verify the lines in ``[start, stop)``; None on the first failure.
+
+    ``start`` and ``stop`` must be line starts. Lines are split like a text
+    file with universal newlines. With ``linked=False`` the first event's
+    ``prev_hash`` is not checked but reported, so independently verified
+    ranges can be stitched together afterwards.
+    """
+    first_prev_hash: str | None = None
+    first_hash: str | None = None
+    events = 0
+    position = end = start
     try:
-        with path.open(encoding="utf-8") as handle:
-            for raw_line in handle:
-                line = raw_line.strip()
-                if not line:
-                    continue
-
-                event = json.loads(line)
-                if not _is_valid_serialized_event(event):
-                    return False
-                if event.get("prev_hash") != prev_hash:
-                    return False
-                if event["hash"] != _hash_event_content(event):
-                    return False
-
-                prev_hash = event["hash"]
+        with path.open("rb") as handle:
+            handle.seek(start)
+            while stop is None or position < stop:
+                raw_line = handle.readline()
+                if not raw_line:
+                    break
+                position += len(raw_line)
+                for piece in raw_line.splitlines():
+                    line = piece.decode("utf-8").strip()
+                    if not line:
+                        continue
+
+                    event = json.loads(line)
+                    if not _is_valid_serialized_event(event):
+                        return None
+                    if (linked or events) and event.get("prev_hash") != prev_hash:
+                        return None
+                    if event["hash"] != _hash_event_content(event):
+                        return None
+
+                    if not events:
+                        first_prev_hash = event.get("prev_hash")
+                        first_hash = event["hash"]
+                    prev_hash = event["hash"]
+                    events += 1
+                if raw_line.endswith(b"\n"):
+                    end = position
     except (OSError, UnicodeError, json.JSONDecodeError, TypeError, ValueError):
+        return None
+
+    return _RangeCheck(first_prev_hash, first_hash, prev_hash, events, end)
+
+
+def _verify_chunk(job: tuple[str, int, int]) -> _RangeCheck | None:
+    file, start, stop = job
+    return _verify_range(Path(file), start, stop, linked=False)
+
+
+def _chunk_boundaries(path: Path, start: int, chunk_bytes: int) -> list[int]:
+    """Line-aligned offsets splitting ``[start, EOF)`` into ~``chunk_bytes`` pieces."""
+    size = path.stat().st_size
+    boundaries = [start]
+    with path.open("rb") as handle:
+        target = start + chunk_bytes
+        while target < size:
+            handle.seek(target - 1)
+            handle.readline()
+            boundary = handle.tell()
+            if boundary >= size:
+                break
+            boundaries.append(boundary)
+            target = boundary + chunk_bytes
+    boundaries.append(size)
+    return boundaries
+
+
+def _verify_file(
+    path: Path, start: int, prev_hash: str | None, workers: int | None, chunk_bytes: int
+) -> _RangeCheck | None:
+    """Verify ``path`` from ``start``; hash chunks in parallel when ``workers > 1``.
+
+    Workers recompute the hashes and the links inside their chunk; the links
+    between chunks are stitched sequentially here.
+    """
+    if workers is None or workers < 2:
+        return _verify_range(path, start, None, prev_hash)
+    try:
+        boundaries = _chunk_boundaries(path, start, chunk_bytes)
+    except OSError:
+        return None
+    if len(boundaries) <= 2:
+        return _verify_range(path, start, None, prev_hash)
+
+    jobs = [(str(path), low, high) for low, high in zip(boundaries, boundaries[1:])]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        chunks = list(executor.map(_verify_chunk, jobs))
+
+    first: _RangeCheck | None = None
+    events = 0
+    end = start
+    for chunk in chunks:
+        if chunk is None:
+            return None
+        end = chunk.end
+        if not chunk.events:
+            continue
+        if chunk.first_prev_hash != prev_hash:
+            return None
+        first = first or chunk
+        prev_hash = chunk.last_hash
+        events += chunk.events
+    return _RangeCheck(
+        first.first_prev_hash if first else None,
+        first.first_hash if first else None,
+        prev_hash,
+        events,
+        end,
+    )
+
+
+def _verify_segment(job: tuple[str, LedgerSegment, bool]) -> bool:
+    """Check one sealed segment against its manifest entry.
+
+    The raw bytes must match the recorded size and SHA-256. With ``full`` the
+    segment's own chain is re-verified line by line as well.
+    """
+    file, segment, full = job
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(file, "rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+                size += len(block)
+    except OSError:
+        return False
+    if size != segment.bytes or digest.hexdigest() != segment.sha256:
+        return False
+    if not full:
+        return True
+    result = _verify_range(Path(file), prev_hash=segment.first_prev_hash)
+    return result is not None and (result.first_hash, result.last_hash, result.events) == (
+        segment.first_hash,
+        segment.last_hash,
+        segment.events,
+    )
+
+
+@dataclass(frozen=True)
+class VerificationWatermark:
+    """Verified prefix of a ledger, for incremental re-verification.
+
+    ``offset`` is the byte offset up to which the active file was verified and
+    ``last_hash`` the hash of the last event before it. ``sealed_segments`` and
+    ``sealed_last_hash`` pin the segment manifest at that time. ``tag`` is a
+    SHA-256 (or, with a key, HMAC-SHA256) over all other fields.
+    """
+
+    sealed_segments: int
+    sealed_last_hash: str | None
+    offset: int
+    last_hash: str | None
+    events: int
+    tag: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class ChainVerification:
+    """Result of :func:`verify_ledger`.
+
+    ``watermark`` is set only when the chain is valid. ``resumed`` tells
+    whether a previous watermark was honoured; ``events_verified`` counts the
+    active-file events hashed in this run.
+    """
+
+    ok: bool
+    watermark: VerificationWatermark | None = None
+    resumed: bool = False
+    events_verified: int = 0
+
+
+_WATERMARK_FIELD_TYPES: dict[str, Any] = {
+    "sealed_segments": int,
+    "sealed_last_hash": (str, type(None)),
+    "offset": int,
+    "last_hash": (str, type(None)),
+    "events": int,
+    "tag": str,
+}
+
+# Chunk size for parallel verification of a single file
+VERIFY_CHUNK_BYTES = 8 << 20
+
+
+def _watermark_tag(fields: Mapping[str, Any], key: bytes | None) -> str:
+    body = json.dumps(
+        {name: fields[name] for name in _WATERMARK_FIELD_TYPES if name != "tag"},
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    if key is None:
+        return hashlib.sha256(body).hexdigest()
+    return hmac.new(key, body, hashlib.sha256).hexdigest()
+
+
+def _make_watermark(
+    segments: list[LedgerSegment], check: _RangeCheck, events: int, key: bytes | None
+) -> VerificationWatermark:
+    fields: dict[str, Any] = {
+        "sealed_segments": len(segments),
+        "sealed_last_hash": segments[-1].last_hash if segments else None,
+        "offset": check.end,
+        "last_hash": check.last_hash,
+        "events": events,
+    }
+    return VerificationWatermark(**fields, tag=_watermark_tag(fields, key))
+
+
+def verification_watermark_from_dict(
+    data: object, *, key: bytes | None = None
+) -> VerificationWatermark:
+    """Parse a stored watermark and check its tag; ``ValueError`` if it does not hold."""
+    if not isinstance(data, Mapping) or set(data) != set(_WATERMARK_FIELD_TYPES):
+        raise ValueError("verification watermark field set invalid")
+    for name, kind in _WATERMARK_FIELD_TYPES.items():
+        if not isinstance(data[name], kind) or isinstance(data[name], bool):
+            raise ValueError(f"verification watermark field has wrong type: {name}")
+    if not hmac.compare_digest(_watermark_tag(data, key), data["tag"]):
+        raise ValueError("verification watermark tag mismatch")
+    return VerificationWatermark(**dict(data))
+
+
+def _resume_point(
+    path: Path, segments: list[LedgerSegment], watermark: VerificationWatermark
+) -> bool:
+    """Whether ``watermark`` still describes a prefix of this ledger."""
+    sealed = watermark.sealed_segments
+    if sealed > len(segments):
         return False
+    sealed_last_hash = segments[sealed - 1].last_hash if sealed else None
+    if sealed_last_hash != watermark.sealed_last_hash:
+        return False
+    if sealed < len(segments):
+        # Rotated since: the watermarked active file is a sealed segment now.
+        return True
+    if not path.exists():
+        return watermark.offset == 0
+    with path.open("rb") as handle:
+        if handle.seek(0, os.SEEK_END) < watermark.offset:
+            return False
+        tail = _tail_before(handle, watermark.offset)
+    if tail is None:
+        return watermark.last_hash == sealed_last_hash
+    return tail.last_hash == watermark.last_hash
+
+
+def verify_ledger(
+    path: str | Path,
+    watermark: VerificationWatermark | None = None,
+    *,
+    key: bytes | None = None,
+    full: bool = False,
+    workers: int | None = None,
+    chunk_bytes: int = VERIFY_CHUNK_BYTES,
+) -> ChainVerification:
+    """Verify a persisted ledger, optionally resuming from a watermark.
+
+    Same strict, fail-closed checks as :func:`verify_chain_from_file`. With a
+    watermark whose tag holds and whose recorded line still carries its
+    recorded hash, only the bytes appended since are verified (plus any
+    segments sealed since); the verified prefix is trusted to be unchanged.
+    A stale or foreign watermark is ignored and the ledger is verified in
+    full. ``workers > 1`` splits the file into ``chunk_bytes`` pieces hashed in
+    a process pool; sealed segments are checked in the same pool.
+    """
+    path = Path(path)
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be >= 1")
+    try:
+        segments = load_segment_manifest(path)
+    except (OSError, UnicodeError, ValueError):
+        return ChainVerification(ok=False)
+
+    prev_hash: str | None = None
+    for segment in segments:
+        if segment.first_prev_hash != prev_hash:
+            return ChainVerification(ok=False)
+        prev_hash = segment.last_hash
+
+    resumed = False
+    first_unchecked = 0
+    start, start_hash, events = 0, prev_hash, 0
+    if watermark is not None:
+        try:
+            tag = _watermark_tag(watermark.to_dict(), key)
+            resumed = hmac.compare_digest(tag, watermark.tag) and _resume_point(
+                path, segments, watermark
+            )
+        except (OSError, TypeError):
+            resumed = False
+        if resumed:
+            first_unchecked = watermark.sealed_segments
+            if watermark.sealed_segments == len(segments):
+                start, start_hash, events = watermark.offset, watermark.last_hash, watermark.events
+
+    jobs = [
+        (str(_segment_path(path, sequence)), segment, full)
+        for sequence, segment in enumerate(segments, start=1)
+        if sequence > first_unchecked
+    ]
+    if workers is not None and workers > 1 and len(jobs) > 1:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            checked = list(executor.map(_verify_segment, jobs))
+    else:
+        checked = [_verify_segment(job) for job in jobs]
+    if not all(checked):
+        return ChainVerification(ok=False)
+
+    if path.exists():
+        check = _verify_file(path, start, start_hash, workers, chunk_bytes)
+    else:
+        check = _RangeCheck(None, None, start_hash, 0, 0)
+    if check is None:
+        return ChainVerification(ok=False, resumed=resumed)
+    return ChainVerification(
+        ok=True,
+        watermark=_make_watermark(segments, check, events + check.events, key),
+        resumed=resumed,
+        events_verified=check.events,
+    )
+
 
-    return True
+def verify_chain_from_file(
+    path: str | Path, *, full: bool = False, workers: int | None = None
+) -> bool:
+    """Verify a persisted ledger strictly and fail closed on malformed input.
+
+    A non-existent or empty file is treated as a valid empty chain. Any unreadable
+    JSONL line, non-object record, unknown field, missing required field, broken
+    link, or hash mismatch makes the verification fail.
+
+    For a segmented ledger the manifest links (each segment's first
+    ``prev_hash`` equals the previous ``last_hash``) are checked, every sealed
+    segment must match its recorded size and SHA-256, and the active file is
+    verified line by line from the last sealed hash. Sealed segments are
+    re-verified line by line only with ``full=True``. ``workers > 1`` verifies
+    segments and chunks of the active file in a process pool. An unreadable
+    manifest fails the verification.
+    """
+    return verify_ledger(path, full=full, workers=workers).ok
 
 
 def create_ledger_from_env() -> Ledger | None:
@@ -435,6 +1806,8 @@ def create_ledger_from_env() -> Ledger | None:
         ENTA_LEDGER_PATH: Path to ledger file
         ENTA_RUN_ID: Run identifier
         ENTA_STATIC_MANIFEST_SHA256: Manifest hash
+        ENTA_LEDGER_DURABILITY: Durability mode (fsync, group, os; default os)
+        ENTA_LEDGER_SHARED: Coordinate appends with other processes (1/true/yes/on)
 
     Returns:
         Ledger instance or None if ENTA_LEDGER_PATH not set
@@ -447,4 +1820,6 @@ def create_ledger_from_env() -> Ledger | None:
         path=path,
         run_id=os.environ.get("ENTA_RUN_ID"),
         manifest_sha256=os.environ.get("ENTA_STATIC_MANIFEST_SHA256"),
+        durability=os.environ.get("ENTA_LEDGER_DURABILITY") or DURABILITY_OS,
+        shared=os.environ.get("ENTA_LEDGER_SHARED", "").lower() in {"1", "true", "yes", "on"},
     )
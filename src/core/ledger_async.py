@@ -0,0 +1,310 @@
+"""
+src/core/ledger_async.py
+
+Ledger writer for asyncio services.
+
+``AsyncLedger`` keeps the producer API of :class:`~src.core.ledger.Ledger`
+(``metric``, ``gate``, ``event``, ``span`` ...) synchronous and cheap: each
+call assigns the hash chain in the caller, in call order, and hands the
+serialized line to a queue. A writer thread drains the queue and appends the
+queued lines to the file in batches, so the event loop never waits for disk
+I/O. A producer call on the event loop never blocks; backpressure is awaited
+with ``drain()``, as with ``asyncio.StreamWriter``.
+
+Features:
+- Deterministic ordering: chain order is call order, and the file follows it
+- Batched writes off the event loop (one write per drained batch)
+- Backpressure: ``await drain()`` waits, without blocking the event loop,
+  until fewer than ``max_pending`` writes are queued; producers in other
+  threads block in the call instead
+- Awaitable ``flush()`` / ``close()``; ``async with`` support
+- ``_current_span`` ContextVar semantics unchanged: the span is read in the
+  producing task's context, never in the writer thread
+
+A failed write stops the ledger fail-closed. The error is re-raised by the
+next producer call and by ``flush()``/``close()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from collections.abc import Iterable, Mapping
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Any
+
+from .ledger import Ledger, LedgerEvent, LedgerTransaction
+
+# Marks the end of the queue for the writer thread
+_STOP = object()
+
+
+def _on_event_loop() -> bool:
+    """Whether the calling thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class _QueueingLedger(Ledger):
+    """Ledger whose file writes are queued for a writer thread."""
+
+    def __init__(
+        self,
+        path: Path,
+        run_id: str | None,
+        manifest_sha256: str | None,
+        *,
+        max_pending: int,
+        batch_size: int,
+        **options: Any,
+    ):
+        if options.get("shared"):
+            # The chain is assigned before the write is queued, not under the lock.
+            raise ValueError("AsyncLedger does not support shared appends")
+        super().__init__(path, run_id, manifest_sha256, **options)
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        # Unbounded: the event loop must never block in put(). The limit is
+        # enforced by drain() and, for producers in other threads, in the call.
+        self._queue: queue.Queue[Any] = queue.Queue()
+        # Signalled by the writer whenever it has taken writes off the queue.
+        self._space = threading.Condition()
+        self._writer: threading.Thread | None = None
+        self._error: BaseException | None = None
+
+    def _check_writer(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("ledger writer failed; no further events are written") from (
+                self._error
+            )
+
+    def _write_lines(self, lines: list[str], events: list[LedgerEvent]) -> None:
+        # Runs in the producer: the chain is already assigned, only the write is deferred.
+        self._check_writer()
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._drain, name=f"ledger-writer:{self.path}", daemon=True
+            )
+            self._writer.start()
+        if not _on_event_loop():
+            self.wait_for_space()
+        self._queue.put((lines, events))
+
+    def wait_for_space(self) -> None:
+        """Block until fewer than ``max_pending`` writes are queued (or the writer failed)."""
+        with self._space:
+            self._space.wait_for(
+                lambda: self._queue.qsize() < self.max_pending or self._error is not None
+            )
+        self._check_writer()
+
+    def _rotate_if_due(self) -> None:
+        """No-op in the producer; the writer thread rotates after each write."""
+
+    def _drain(self) -> None:
+        """Writer thread: append queued lines in batches until stopped."""
+        while True:
+            items = [self._queue.get()]
+            while len(items) < self.batch_size and items[-1] is not _STOP:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines: list[str] = []
+            events: list[LedgerEvent] = []
+            for item in items:
+                if item is not _STOP:
+                    lines.extend(item[0])
+                    events.extend(item[1])
+            try:
+                if lines and self._error is None:
+                    with self._io_lock:
+                        super()._write_lines(lines, events)
+                        if self.segmented:
+                            super()._rotate_if_due()
+            except Exception as exc:
+                self._error = exc
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+                with self._space:
+                    self._space.notify_all()
+            if items[-1] is _STOP:
+                return
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self) -> None:
+        """Wait until the queue is written, then flush like :meth:`Ledger.flush`."""
+        self._queue.join()
+        self._check_writer()
+        with self._io_lock:
+            super().flush()
+
+    def close(self) -> None:
+        """Stop the writer thread after the queue is written and close the file."""
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(_STOP)
+            writer.join()
+        with self._io_lock:
+            super().close()
+        self._check_writer()
+
+
+class AsyncLedger:
+    """Hash-chained ledger whose file writes run off the event loop.
+
+    Producers call the synchronous API as on :class:`Ledger`; only
+    ``drain()``, ``flush()``, ``checkpoint()`` and ``close()`` are awaited.
+
+    Usage:
+        async with AsyncLedger("/path/to/events.jsonl") as ledger:
+            ledger.metric("mzm.phi", 0.85)
+            with ledger.span("stability.check"):
+                ledger.gate("stability_taxonomy_v1", passed=True)
+            await ledger.drain()
+            await ledger.flush()
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        run_id: str | None = None,
+        manifest_sha256: str | None = None,
+        *,
+        max_pending: int = 1024,
+        batch_size: int = 256,
+        **options: Any,
+    ):
+        """Initialize the ledger.
+
+        Args:
+            path: Path to JSONL file. If None, events are stored in memory only
+                and nothing is queued.
+            run_id: Optional run identifier for correlation.
+            manifest_sha256: Optional static manifest hash for integrity.
+            max_pending: Queued writes (single events or batches) before
+                ``drain()`` waits for the writer to catch up. Producers on
+                the event loop are never blocked; producers in other threads
+                block in the call.
+            batch_size: Queued writes the writer appends with one file write.
+            **options: Further :class:`Ledger` options (durability, retention,
+                segmentation, index, ...). They apply in the writer thread.
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self._ledger: Ledger
+        if path is None:
+            self._ledger = Ledger(None, run_id, manifest_sha256, **options)
+        else:
+            self._ledger = _QueueingLedger(
+                Path(path),
+                run_id,
+                manifest_sha256,
+                max_pending=max_pending,
+                batch_size=batch_size,
+                **options,
+            )
+
+    @property
+    def path(self) -> Path | None:
+        return self._ledger.path
+
+    @property
+    def run_id(self) -> str:
+        return self._ledger.run_id
+
+    @property
+    def pending(self) -> int:
+        """Queued writes not yet taken by the writer thread."""
+        return self._ledger.pending if isinstance(self._ledger, _QueueingLedger) else 0
+
+    @property
+    def anchor_hash(self) -> str | None:
+        return self._ledger.anchor_hash
+
+    def event(
+        self,
+        event_type: str,
+        payload: Mapping[str, Any],
+        *,
+        event_id: str | None = None,
+        timestamp: float | None = None,
+        span_id: str | None = None,
+    ) -> LedgerEvent:
+        """Chain and queue a generic domain event (see :meth:`Ledger.event`)."""
+        return self._ledger.event(
+            event_type, payload, event_id=event_id, timestamp=timestamp, span_id=span_id
+        )
+
+    def emit_many(self, events: Iterable[Mapping[str, Any]]) -> list[LedgerEvent]:
+        """Chain and queue a batch as one write (see :meth:`Ledger.emit_many`)."""
+        return self._ledger.emit_many(events)
+
+    def transaction(self) -> AbstractContextManager[LedgerTransaction]:
+        """Collect events and queue them as one write on success."""
+        return self._ledger.transaction()
+
+    def metric(self, metric_id: str, value: float, **tags: Any) -> None:
+        self._ledger.metric(metric_id, value, **tags)
+
+    def gate(self, gate_id: str, passed: bool, reason: str | None = None) -> None:
+        self._ledger.gate(gate_id, passed, reason)
+
+    def span(self, name: str) -> AbstractContextManager[str]:
+        """Span context for the current task (see :meth:`Ledger.span`).
+
+        The span is a ContextVar, so concurrent tasks each see their own.
+        """
+        return self._ledger.span(name)
+
+    def get_events(self, event_type: str | None = None) -> list[dict[str, Any]]:
+        return self._ledger.get_events(event_type)
+
+    def verify_chain(self) -> bool:
+        return self._ledger.verify_chain()
+
+    async def drain(self) -> None:
+        """Wait until fewer than ``max_pending`` writes are queued.
+
+        Other tasks keep running meanwhile. Raises if the writer failed.
+        """
+        ledger = self._ledger
+        if isinstance(ledger, _QueueingLedger):
+            if ledger.pending >= ledger.max_pending:
+                await asyncio.to_thread(ledger.wait_for_space)
+            ledger._check_writer()
+
+    async def flush(self) -> None:
+        """Wait until every queued event is written and flushed per durability mode."""
+        await asyncio.to_thread(self._ledger.flush)
+
+    async def checkpoint(self) -> str | None:
+        """Mark a checkpoint at the current head, then await its flush.
+
+        See :meth:`Ledger.checkpoint`. The mark is set before awaiting, so
+        events other tasks emit meanwhile come after it.
+        """
+        head = self._ledger._mark_checkpoint()
+        await self.flush()
+        return head
+
+    async def close(self) -> None:
+        """Write the queue, stop the writer thread and close the file."""
+        await asyncio.to_thread(self._ledger.close)
+
+    async def __aenter__(self) -> AsyncLedger:
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
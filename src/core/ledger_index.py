@@ -0,0 +1,339 @@
+"""
+src/core/ledger_index.py
+
+Byte-offset index for ledger files.
+
+Maps ``event_id``, ``type`` and span ids to the byte offsets of their lines,
+so audit queries seek to and parse only the matching lines instead of
+scanning the whole ledger.
+
+Features:
+- One ``<file>.idx`` JSONL sidecar per ledger file (sealed segments included)
+- Built incrementally: ``Ledger(index=True)`` records each appended line;
+  lines appended by other writers are picked up on the next open
+- Lazy query API over all segments of a ledger
+
+The index is derived data. It is cross-checked against the ledger file when
+opened and rebuilt if it does not match; integrity is still the job of
+``verify_chain_from_file``.
+"""
+
+from __future__ import annotations
+
+import json
+import weakref
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+from .ledger import INDEX_SUFFIX, _segment_path, load_segment_manifest
+
+_SPAN_EVENT_TYPES = frozenset({"span_start", "span_end"})
+
+
+def index_path(ledger_path: str | Path) -> Path:
+    """Index sidecar of a single ledger file."""
+    ledger_path = Path(ledger_path)
+    return ledger_path.with_name(ledger_path.name + INDEX_SUFFIX)
+
+
+def _event_spans(event: dict[str, Any]) -> list[str]:
+    """Span ids an event belongs to.
+
+    Besides the event's own ``span_id`` (the enclosing span), ``span_start``
+    and ``span_end`` events also belong to the span they open or close.
+    """
+    spans = []
+    if isinstance(event.get("span_id"), str):
+        spans.append(event["span_id"])
+    payload = event.get("payload")
+    if event.get("type") in _SPAN_EVENT_TYPES and isinstance(payload, dict):
+        own = payload.get("span_id")
+        if isinstance(own, str) and own not in spans:
+            spans.append(own)
+    return spans
+
+
+class LedgerIndex:
+    """Byte-offset index of one ledger file by ``event_id``, ``type`` and span id.
+
+    Opening the index loads ``<file>.idx``, checks its last entry against the
+    ledger file and indexes any lines appended since. A mismatching index is
+    rebuilt from the ledger file.
+
+    Usage:
+        index = LedgerIndex("/path/to/events.jsonl")
+        for event in index.iter_events(event_type="gate"):
+            ...
+    """
+
+    def __init__(self, ledger_path: str | Path, *, persist: bool = True):
+        """Open (and if needed build or extend) the index of ``ledger_path``.
+
+        Args:
+            ledger_path: Path to a single JSONL ledger file.
+            persist: Write new entries to the ``.idx`` sidecar. Without it the
+                index lives in memory only.
+        """
+        self.ledger_path = Path(ledger_path)
+        self.path = index_path(self.ledger_path)
+        self.persist = persist
+        self._offsets: list[int] = []
+        self._lengths: list[int] = []
+        self._event_ids: list[str | None] = []
+        self._by_event_id: dict[str, list[int]] = {}
+        self._by_type: dict[str, list[int]] = {}
+        self._by_span: dict[str, list[int]] = {}
+        self._end = 0
+        self._file: TextIO | None = None
+        self._file_finalizer: weakref.finalize | None = None
+
+        if not self._load() and self.path.exists() and persist:
+            self.path.unlink()
+        self.sync()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _load(self) -> bool:
+        """Load the sidecar; False if it is missing, unreadable or stale."""
+        if not self.path.exists():
+            return False
+        try:
+            lines = self.path.read_text(encoding="utf-8").split("\n")
+            # One parse for the whole sidecar is about twice as fast as per line.
+            entries = json.loads("[" + ",".join(line for line in lines if line.strip()) + "]")
+            for entry in entries:
+                self._add(entry["o"], entry["l"], entry["e"], entry["t"], entry["s"])
+        except (OSError, UnicodeError, ValueError, KeyError, TypeError):
+            self._reset()
+            return False
+        if self._offsets and not self._matches_ledger():
+            self._reset()
+            return False
+        return True
+
+    def _matches_ledger(self) -> bool:
+        """Whether the last indexed line is still where the index says."""
+        offset, length = self._offsets[-1], self._lengths[-1]
+        try:
+            with self.ledger_path.open("rb") as handle:
+                handle.seek(offset)
+                raw_line = handle.readline()
+            event = json.loads(raw_line)
+        except (OSError, ValueError):
+            return False
+        return (
+            len(raw_line) == length
+            and isinstance(event, dict)
+            and event.get("event_id") == self._event_ids[-1]
+        )
+
+    def _reset(self) -> None:
+        self._offsets.clear()
+        self._lengths.clear()
+        self._event_ids.clear()
+        self._by_event_id.clear()
+        self._by_type.clear()
+        self._by_span.clear()
+        self._end = 0
+
+    def _add(
+        self,
+        offset: int,
+        length: int,
+        event_id: str | None,
+        event_type: str | None,
+        spans: Iterable[str],
+    ) -> dict[str, Any]:
+        if offset < self._end:
+            raise ValueError("index entries must follow the file order")
+        position = len(self._offsets)
+        self._offsets.append(offset)
+        self._lengths.append(length)
+        self._event_ids.append(event_id)
+        if event_id is not None:
+            self._by_event_id.setdefault(event_id, []).append(position)
+        if event_type is not None:
+            self._by_type.setdefault(event_type, []).append(position)
+        spans = list(spans)
+        for span in spans:
+            self._by_span.setdefault(span, []).append(position)
+        self._end = offset + length
+        return {"o": offset, "l": length, "e": event_id, "t": event_type, "s": spans}
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        if not self.persist:
+            return
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._file_finalizer = weakref.finalize(self, self._file.close)
+        self._file.write(json.dumps(entry, sort_keys=True, separators=(",", ":")) + "\n")
+
+    def sync(self) -> int:
+        """Index lines appended to the ledger file since the last entry.
+
+        Unparsable lines are skipped, like :func:`iter_ledger` does. Returns
+        the number of new entries.
+        """
+        if not self.ledger_path.exists():
+            return 0
+        added = 0
+        with self.ledger_path.open("rb") as handle:
+            handle.seek(self._end)
+            offset = self._end
+            for raw_line in handle:
+                if not raw_line.endswith(b"\n"):
+                    break  # line still being written
+                line_offset = offset
+                offset += len(raw_line)
+                if not raw_line.strip():
+                    continue
+                try:
+                    event = json.loads(raw_line)
+                except ValueError:
+                    continue
+                if not isinstance(event, dict):
+                    continue
+                self.record(line_offset, len(raw_line), event)
+                added += 1
+        self.flush()
+        return added
+
+    def record(self, offset: int, length: int, event: dict[str, Any]) -> None:
+        """Add the line at ``offset`` (``length`` bytes incl. newline) for ``event``."""
+        event_id = event.get("event_id")
+        event_type = event.get("type")
+        entry = self._add(
+            offset,
+            length,
+            event_id if isinstance(event_id, str) else None,
+            event_type if isinstance(event_type, str) else None,
+            _event_spans(event),
+        )
+        self._write(entry)
+
+    def offsets(
+        self,
+        *,
+        event_id: str | None = None,
+        event_type: str | None = None,
+        span_id: str | None = None,
+    ) -> list[int]:
+        """Byte offsets of the lines matching all given keys, in file order."""
+        selections = [
+            index.get(key, [])
+            for index, key in (
+                (self._by_event_id, event_id),
+                (self._by_type, event_type),
+                (self._by_span, span_id),
+            )
+            if key is not None
+        ]
+        if not selections:
+            positions: Iterable[int] = range(len(self._offsets))
+        else:
+            smallest = min(selections, key=len)
+            others = [set(selection) for selection in selections if selection is not smallest]
+            positions = [p for p in smallest if all(p in other for other in others)]
+        return [self._offsets[position] for position in positions]
+
+    def iter_events(
+        self,
+        *,
+        event_id: str | None = None,
+        event_type: str | None = None,
+        span_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily seek to and parse the matching lines."""
+        offsets = self.offsets(event_id=event_id, event_type=event_type, span_id=span_id)
+        return self.read_at(offsets)
+
+    def read_at(self, offsets: Iterable[int]) -> Iterator[dict[str, Any]]:
+        """Parse the lines at the given offsets.
+
+        Raises ``ValueError`` if a line no longer holds an event object.
+        """
+        offsets = list(offsets)
+        if not offsets:
+            return
+        with self.ledger_path.open("rb") as handle:
+            for offset in offsets:
+                handle.seek(offset)
+                event = json.loads(handle.readline())
+                if not isinstance(event, dict):
+                    raise ValueError(f"ledger index is stale at offset {offset}")
+                yield event
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._file_finalizer is not None:
+            self._file_finalizer.detach()
+            self._file_finalizer = None
+
+
+def _ledger_files(path: Path) -> list[Path]:
+    segments = load_segment_manifest(path)
+    files = [_segment_path(path, sequence) for sequence in range(1, len(segments) + 1)]
+    return [file for file in [*files, path] if file.exists()]
+
+
+def query_ledger(
+    path: str | Path,
+    *,
+    event_id: str | None = None,
+    event_type: str | None = None,
+    span_id: str | None = None,
+    span_name: str | None = None,
+    persist: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Lazily yield the events of a ledger that match all given keys.
+
+    Sealed segments are searched before the active file, each through its own
+    index (built or extended on first use). ``span_name`` selects the spans
+    opened under that name (``span_start`` payload ``name``) and yields their
+    events, including the span's own start/end events.
+
+    Args:
+        path: Path to the (active) ledger file.
+        event_id, event_type, span_id: Keys that must all match.
+        span_name: Restrict to spans opened under this name.
+        persist: Write index sidecars while building them.
+
+    Yields:
+        Event dictionaries in ledger order
+    """
+    indexes = [LedgerIndex(file, persist=persist) for file in _ledger_files(Path(path))]
+    try:
+        span_ids: list[str | None] = [span_id]
+        if span_name is not None:
+            opened = {
+                event["payload"].get("span_id")
+                for index in indexes
+                for event in index.iter_events(event_type="span_start")
+                if isinstance(event.get("payload"), dict)
+                and event["payload"].get("name") == span_name
+            }
+            if span_id is not None:
+                opened &= {span_id}
+            span_ids = [*sorted(span for span in opened if isinstance(span, str))]
+        for index in indexes:
+            offsets = sorted(
+                {
+                    offset
+                    for span in span_ids
+                    for offset in index.offsets(
+                        event_id=event_id, event_type=event_type, span_id=span
+                    )
+                }
+            )
+            yield from index.read_at(offsets)
+    finally:
+        for index in indexes:
+            index.close()
@@ -13,6 +13,9 @@ Version: 1.0 (Minimal-Stubs für Testbarkeit; vollständige Implementierung folg
 import math
 from typing import Union
 
+from .metrics_batch import fd_batch
+from .mutual_info import mutual_information
+
 
 def eci(signal: list[Union[int, float]]) -> float:
     """[HYP] ECI-Proxy — geklemmter Mittelwert eines Signals in [0.0, 1.0].
@@ -71,7 +74,9 @@ def plv(phases: list[Union[int, float]]) -> float:
 def mi(x: list[Union[int, float]], y: list[Union[int, float]]) -> float:
     """Mutual Information - Misst geteilte Information zwischen zwei Signalen.
 
-    Verwendet histogram-basierte Schätzung mit sqrt(n) Bins.
+    Verwendet histogram-basierte Schätzung mit sqrt(n) Bins. Dünner Wrapper um
+    :func:`src.core.mutual_info.mutual_information`; dort gibt es auch KSG,
+    adaptive Bin-Regeln und die MI aller Kanalpaare.
 
     Args:
         x: Erste Datenreihe
@@ -80,97 +85,35 @@ def mi(x: list[Union[int, float]], y: list[Union[int, float]]) -> float:
     Returns:
         float: MI-Wert >= 0.0 (0.0 = keine gemeinsame Information)
     """
-    n = min(len(x), len(y))
-    if n < 2:
-        return 0.0
-
-    xs = list(x[:n])
-    ys = list(y[:n])
-
-    x_min, x_max = min(xs), max(xs)
-    y_min, y_max = min(ys), max(ys)
-    if x_min == x_max or y_min == y_max:
-        return 0.0
-
-    bins = max(2, int(math.sqrt(n)))
-
-    def _bin(val: float, vmin: float, vmax: float) -> int:
-        idx = int((val - vmin) / (vmax - vmin) * bins)
-        return min(idx, bins - 1)
-
-    joint: dict[tuple[int, int], int] = {}
-    x_counts: dict[int, int] = {}
-    y_counts: dict[int, int] = {}
-
-    for xi, yi in zip(xs, ys):
-        bx = _bin(float(xi), x_min, x_max)
-        by = _bin(float(yi), y_min, y_max)
-        joint[(bx, by)] = joint.get((bx, by), 0) + 1
-        x_counts[bx] = x_counts.get(bx, 0) + 1
-        y_counts[by] = y_counts.get(by, 0) + 1
-
-    result = 0.0
-    for (bx, by), cnt in joint.items():
-        pxy = cnt / n
-        px = x_counts[bx] / n
-        py = y_counts[by] / n
-        if pxy > 0 and px > 0 and py > 0:
-            result += pxy * math.log(pxy / (px * py))
-
-    return float(max(0.0, result))
+    return mutual_information(x, y)
 
 
-def fd(series: list[Union[int, float]]) -> float:
+def fd(
+    series: list[Union[int, float]],
+    k_max: Union[int, str] = 4,
+    *,
+    clamp: bool = True,
+    standard: bool = False,
+) -> float:
     """Fractal Dimension - Misst Selbstähnlichkeit/Organisation (Higuchi-Methode).
 
     Schätzt die fraktale Dimension einer Zeitreihe via Higuchi-Algorithmus.
     Ergebnis liegt typischerweise in [1.0, 2.0] (1.0 = glatt, 2.0 = komplex).
+    Dünner Wrapper um :func:`src.core.metrics_batch.fd_batch`; für viele Reihen
+    auf einmal direkt ``fd_batch`` nutzen.
 
     Args:
         series: Datenreihe zur Analyse (mindestens 4 Punkte empfohlen)
+        k_max: Größtes Intervall ``k`` (höchstens ``n // 2``) oder ``"auto"``;
+            der Standard 4 entspricht der bisherigen Schätzung
+        clamp: Ergebnis auf [1.0, 2.0] klemmen
+        standard: Kurvenlänge nach Higuchi normieren; ohne diese Option liegt
+            die Schätzung wie bisher um 1 unter der Higuchi-Dimension
 
     Returns:
-        float: FD-Wert (clamped auf [1.0, 2.0])
+        float: FD-Wert (clamped auf [1.0, 2.0], sofern ``clamp``)
     """
-    n = len(series)
-    if n < 4:
-        return 1.0
-
-    k_max = min(4, n // 2)
-    log_k: list[float] = []
-    log_l: list[float] = []
-
-    for k in range(1, k_max + 1):
-        lengths: list[float] = []
-        for m in range(1, k + 1):
-            idxs = list(range(m - 1, n, k))
-            if len(idxs) < 2:
-                continue
-            total = sum(abs(series[idxs[i]] - series[idxs[i - 1]]) for i in range(1, len(idxs)))
-            length = total * (n - 1) / (k * (len(idxs) - 1))
-            lengths.append(length)
-        if not lengths:
-            continue
-        avg = sum(lengths) / len(lengths)
-        if avg > 0:
-            log_k.append(math.log(1.0 / k))
-            log_l.append(math.log(avg))
-
-    if len(log_k) < 2:
-        return 1.5
-
-    # Linear regression slope = Higuchi FD estimate
-    n_pts = len(log_k)
-    sx = sum(log_k)
-    sy = sum(log_l)
-    sxx = sum(v * v for v in log_k)
-    sxy = sum(log_k[i] * log_l[i] for i in range(n_pts))
-    denom = n_pts * sxx - sx * sx
-    if abs(denom) < 1e-10:
-        return 1.5
-    slope = (n_pts * sxy - sx * sy) / denom
-
-    return float(min(max(slope, 1.0), 2.0))
+    return float(fd_batch(series, k_max, clamp=clamp, standard=standard)[0])
 
 
 def pf(series: list[Union[int, float]]) -> float:
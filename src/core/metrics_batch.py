@@ -0,0 +1,289 @@
+"""Vektorisierte Core-5 Metriken für viele Zeitreihen auf einmal.
+
+NumPy-Engine zu :mod:`src.core.metrics`: Jede Funktion nimmt ein Array der Form
+``(n_series, n_samples)`` (oder eine einzelne 1-D-Reihe) und liefert ein Array
+der Form ``(n_series,)`` mit dem Ergebnis je Zeile. Gedacht für 250-Hz-Fenster
+vieler Probanden; die skalaren Funktionen bleiben die Referenz. Ausnahme ist
+FD: :func:`metrics.fd` ruft :func:`fd_batch` auf, das die vollständige
+Higuchi-Schätzung mit wählbarem ``k_max`` enthält.
+
+Übereinstimmung mit der Referenz (``tests/unit/test_core5_metrics_batch.py``):
+- ECI, PF, PLV, MI, FD: ``|batch - skalar| <= BATCH_ABS_TOLERANCE`` (1e-9).
+  Abweichungen stammen nur aus der Summationsreihenfolge (NumPy summiert
+  paarweise) und aus ULP-Unterschieden von ``sin``/``cos``/``log``; typisch
+  liegen sie unter 1e-12.
+- MI: Bin-Zuordnung und Zählung sind bitgleich zur Referenz (gleiche
+  Gleitkomma-Ausdrücke, Abschneiden wie ``int()``).
+- FD: Referenz ist die frühere Schleifen-Implementierung mit ``k_max=4``
+  (im Test erhalten). An ihren Schwellen (``avg > 0``, ``|denom| < 1e-10``)
+  kann ein ULP-Unterschied theoretisch den Rückfallwert 1.5 umschalten.
+
+Zeilen müssen gleich lang sein (rechteckiges Array).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import numpy as np
+
+# Dokumentierte Toleranz gegenüber den skalaren Referenzfunktionen
+BATCH_ABS_TOLERANCE = 1e-9
+
+# Obergrenze für k_max="auto" in fd_batch
+HIGUCHI_AUTO_K_MAX = 64
+
+# Obergrenze der gleichzeitig gehaltenen Histogrammzellen in mi_batch (~32 MB)
+_MAX_HIST_CELLS = 1 << 22
+
+
+def _as_rows(values: Any, name: str = "values") -> np.ndarray:
+    """Eingabe als float64-Array ``(n_series, n_samples)``; 1-D wird eine Zeile."""
+    rows: np.ndarray = np.asarray(values, dtype=np.float64)
+    if rows.ndim == 1:
+        rows = rows[np.newaxis, :]
+    if rows.ndim != 2:
+        raise ValueError(f"{name} must be 1-D or 2-D (n_series, n_samples), got {rows.ndim}-D")
+    return rows
+
+
+def _zeros(n_series: int) -> np.ndarray:
+    zeros: np.ndarray = np.zeros(n_series)
+    return zeros
+
+
+def eci_batch(signals: Any) -> np.ndarray:
+    """[HYP] ECI-Proxy je Zeile — geklemmter Mittelwert, wie :func:`metrics.eci`.
+
+    Args:
+        signals: Array ``(n_series, n_samples)``
+
+    Returns:
+        np.ndarray: ``(n_series,)``, Werte in [0.0, 1.0]; leere Zeilen → 0.0
+    """
+    rows = _as_rows(signals, "signals")
+    if rows.shape[1] == 0:
+        return _zeros(rows.shape[0])
+    values: np.ndarray = np.clip(rows.mean(axis=1), 0.0, 1.0)
+    return values
+
+
+def plv_batch(phases: Any) -> np.ndarray:
+    """Phase Locking Value je Zeile, wie :func:`metrics.plv`.
+
+    Args:
+        phases: Phasen (Radians), Array ``(n_series, n_samples)``
+
+    Returns:
+        np.ndarray: ``(n_series,)``, Werte in [0.0, 1.0]; leere Zeilen → 0.0
+    """
+    rows = _as_rows(phases, "phases")
+    if rows.shape[1] == 0:
+        return _zeros(rows.shape[0])
+    # np.mod rundet wie Python-% nach unten: gleiche Normierung auf [-pi, pi)
+    wrapped = np.mod(rows + math.pi, 2.0 * math.pi) - math.pi
+    mean_cos = np.cos(wrapped).mean(axis=1)
+    mean_sin = np.sin(wrapped).mean(axis=1)
+    r = np.sqrt(mean_cos * mean_cos + mean_sin * mean_sin)
+    values: np.ndarray = np.clip(r, 0.0, 1.0)
+    return values
+
+
+def _bin_rows(
+    rows: np.ndarray, bins: int, value_range: tuple[float, float] | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Bin-Indizes je Wert wie ``metrics.mi._bin``; Maske der nicht konstanten Zeilen.
+
+    Mit ``value_range`` sind die Bin-Grenzen fest; Werte außerhalb landen im
+    ersten bzw. letzten Bin, und keine Zeile gilt als konstant.
+    """
+    if value_range is not None:
+        low_edge, high_edge = value_range
+        if not high_edge > low_edge:
+            raise ValueError(f"value range must be increasing, got {value_range}")
+        index = np.floor((rows - low_edge) / (high_edge - low_edge) * bins)
+        return np.clip(index, 0, bins - 1).astype(np.int64), np.ones(rows.shape[0], dtype=bool)
+    low = rows.min(axis=1, keepdims=True)
+    high = rows.max(axis=1, keepdims=True)
+    varying = (high > low)[:, 0]
+    span = np.where(high > low, high - low, 1.0)
+    # Gleicher Ausdruck wie die Referenz; astype schneidet wie int() ab (Werte >= 0).
+    index = ((rows - low) / span * bins).astype(np.int64)
+    return np.minimum(index, bins - 1), varying
+
+
+def mi_batch(
+    x: Any,
+    y: Any,
+    *,
+    bins: int | None = None,
+    x_range: tuple[float, float] | None = None,
+    y_range: tuple[float, float] | None = None,
+) -> np.ndarray:
+    """Mutual Information je Zeilenpaar, wie :func:`metrics.mi` (sqrt(n) Bins).
+
+    Ohne Zusatzargumente identisch zur Referenz. ``bins`` und feste
+    Wertebereiche entsprechen dem Histogramm von
+    :class:`~src.core.metrics_stream.StreamingMI`.
+
+    Args:
+        x: Erste Datenreihen, Array ``(n_series, n_samples)``
+        y: Zweite Datenreihen mit gleicher Zeilenzahl; beide werden auf die
+            kürzere Spaltenzahl gekürzt
+        bins: Bins je Achse (Standard: ``max(2, int(sqrt(n)))``)
+        x_range, y_range: Feste Bin-Grenzen ``(low, high)`` statt Min/Max je Zeile
+
+    Returns:
+        np.ndarray: ``(n_series,)``, MI-Werte >= 0.0 (nats)
+    """
+    xs, ys = _as_rows(x, "x"), _as_rows(y, "y")
+    if xs.shape[0] != ys.shape[0]:
+        raise ValueError(f"x and y need the same number of series: {xs.shape[0]} != {ys.shape[0]}")
+    n = min(xs.shape[1], ys.shape[1])
+    result = _zeros(xs.shape[0])
+    if n < 2:
+        return result
+    xs, ys = xs[:, :n], ys[:, :n]
+
+    if bins is None:
+        bins = max(2, int(math.sqrt(n)))
+    elif bins < 2:
+        raise ValueError(f"bins must be >= 2, got {bins}")
+    bx, x_varying = _bin_rows(xs, bins, x_range)
+    by, y_varying = _bin_rows(ys, bins, y_range)
+    active = np.flatnonzero(x_varying & y_varying)
+
+    cells = bins * bins
+    chunk = max(1, _MAX_HIST_CELLS // cells)
+    for start in range(0, active.size, chunk):
+        selected = active[start : start + chunk]
+        offsets: np.ndarray = np.arange(selected.size, dtype=np.int64)[:, np.newaxis] * cells
+        codes = offsets + bx[selected] * bins + by[selected]
+        joint = np.bincount(codes.ravel(), minlength=selected.size * cells)
+        joint = joint.reshape(selected.size, bins, bins)
+        pxy = joint / n
+        px = joint.sum(axis=2) / n
+        py = joint.sum(axis=1) / n
+        occupied = joint > 0
+        expected = px[:, :, np.newaxis] * py[:, np.newaxis, :]
+        terms = np.zeros_like(pxy)
+        terms[occupied] = pxy[occupied] * np.log(pxy[occupied] / expected[occupied])
+        result[selected] = terms.sum(axis=(1, 2))
+    clamped: np.ndarray = np.maximum(result, 0.0)
+    return clamped
+
+
+def _higuchi_k_max(n: int, k_max: int | str) -> int:
+    """Effektives ``k_max`` für eine Reihe der Länge ``n`` (höchstens ``n // 2``)."""
+    if k_max == "auto":
+        k_max = min(max(4, n // 10), HIGUCHI_AUTO_K_MAX)
+    elif isinstance(k_max, str) or k_max < 2:
+        raise ValueError(f"k_max must be an int >= 2 or 'auto', got {k_max!r}")
+    return min(int(k_max), n // 2)
+
+
+def higuchi_curve(series: Any, k_max: int | str = 4) -> tuple[np.ndarray, np.ndarray]:
+    """Higuchi-Kurvenlängen ``L(k)`` je Zeile für ``k = 1 .. k_max`` (Higuchi 1988).
+
+    Je ``k`` wird die Differenz im Abstand ``k`` einmal über strided Views
+    gebildet; die Teilreihen ``m = 1 .. k`` sind dann die Spalten einer
+    ``(n // k, k)``-Umformung, ohne Indexlisten.
+
+    Args:
+        series: Array ``(n_series, n_samples)`` mit mindestens 4 Samples
+        k_max: Größtes ``k`` (höchstens ``n // 2``) oder ``"auto"``
+
+    Returns:
+        tuple: ``(k, curve)`` mit ``k`` der Form ``(k_max,)`` und ``curve``
+            der Form ``(n_series, k_max)``
+    """
+    rows = _as_rows(series, "series")
+    n_series, n = rows.shape
+    if n < 4:
+        raise ValueError(f"Higuchi curve needs at least 4 samples, got {n}")
+    k_max = _higuchi_k_max(n, k_max)
+    ks = np.arange(1, k_max + 1)
+    curve = np.zeros((n_series, k_max))
+    for k in ks:
+        diffs = np.abs(rows[:, k:] - rows[:, :-k])
+        full, rest = divmod(n - k, k)
+        # Spalte m-1 summiert die Beträge der Teilreihe, die bei Index m-1 beginnt.
+        totals = diffs[:, : full * k].reshape(n_series, full, k).sum(axis=1)
+        totals[:, :rest] += diffs[:, full * k :]
+        steps = np.full(k, full)
+        steps[:rest] += 1
+        curve[:, k - 1] = (totals * ((n - 1) / (k * steps))).mean(axis=1) / k
+    return ks, curve
+
+
+def fd_batch(
+    series: Any, k_max: int | str = 4, *, clamp: bool = True, standard: bool = False
+) -> np.ndarray:
+    """Fraktale Dimension (Higuchi) je Zeile, wie :func:`metrics.fd`.
+
+    Die Steigung ist der Kleinste-Quadrate-Fit von ``log L(k)`` gegen
+    ``log(1/k)`` über alle ``k`` mit positiver Kurvenlänge.
+
+    Die bisherige Referenz verwendet ``k * L(k)`` statt ``L(k)``; ihre
+    Steigung liegt damit genau um 1 unter der Higuchi-Dimension (weißes
+    Rauschen ≈ 1.0 statt 2.0). Mit den Standards bleibt dieses Verhalten
+    erhalten; ``standard=True`` liefert die Schätzung nach Higuchi.
+
+    Args:
+        series: Array ``(n_series, n_samples)``
+        k_max: Größtes ``k`` (höchstens ``n // 2``). ``"auto"`` wählt ein
+            Zehntel der Reihenlänge, mindestens 4 und höchstens
+            ``HIGUCHI_AUTO_K_MAX``.
+        clamp: Ergebnis auf [1.0, 2.0] klemmen; ``False`` liefert die rohe
+            Steigung.
+        standard: Kurvenlänge nach Higuchi normieren (siehe oben).
+
+    Returns:
+        np.ndarray: ``(n_series,)``, FD-Werte; weniger als 4 Punkte → 1.0,
+            nicht schätzbar → 1.5
+    """
+    rows = _as_rows(series, "series")
+    n_series, n = rows.shape
+    _higuchi_k_max(n, k_max)  # Argument auch bei kurzen Reihen prüfen
+    if n < 4:
+        ones: np.ndarray = np.ones(n_series)
+        return ones
+
+    ks, curve = higuchi_curve(rows, k_max)
+    if not standard:
+        curve = curve * ks
+    log_k = np.log(1.0 / ks)
+
+    # Lineare Regression je Zeile über die k mit positiver Kurvenlänge
+    valid = curve > 0
+    weight = valid.astype(np.float64)
+    log_l = np.log(np.where(valid, curve, 1.0))
+    n_pts = weight.sum(axis=1)
+    sx = (weight * log_k).sum(axis=1)
+    sy = (weight * log_l).sum(axis=1)
+    sxx = (weight * log_k * log_k).sum(axis=1)
+    sxy = (weight * log_k * log_l).sum(axis=1)
+    denom = n_pts * sxx - sx * sx
+    estimable = (n_pts >= 2) & (np.abs(denom) >= 1e-10)
+    slope = (n_pts * sxy - sx * sy) / np.where(estimable, denom, 1.0)
+    if clamp:
+        slope = np.clip(slope, 1.0, 2.0)
+    dimension: np.ndarray = np.where(estimable, slope, 1.5)
+    return dimension
+
+
+def pf_batch(series: Any) -> np.ndarray:
+    """Power Flux je Zeile, wie :func:`metrics.pf` (Mittel der Absolutwerte).
+
+    Args:
+        series: Array ``(n_series, n_samples)``
+
+    Returns:
+        np.ndarray: ``(n_series,)``; leere Zeilen → 0.0
+    """
+    rows = _as_rows(series, "series")
+    if rows.shape[1] == 0:
+        return _zeros(rows.shape[0])
+    values: np.ndarray = np.abs(rows).mean(axis=1)
+    return values
@@ -0,0 +1,215 @@
+"""Gleitende Core-5 Metriken für Live-Sessions (Streaming).
+
+Akkumulatoren über die letzten ``window`` Samples mit ``push(sample)`` und
+``value()``. Jedes ``push`` kostet amortisiert O(1): laufende Summen werden um
+den neuen Beitrag erhöht und um den exakt gespeicherten Beitrag des
+herausfallenden Samples verringert. Damit sich Rundungsfehler nicht über
+lange Sessions aufsummieren, werden die Summen alle ``window`` Schritte aus dem
+Fenster neu gebildet (``math.fsum``).
+
+- :class:`StreamingECI` — geklemmter laufender Mittelwert (ECI-Proxy)
+- :class:`StreamingPLV` — laufende cos/sin-Summen
+- :class:`StreamingPF` — laufende Summe der Absolutwerte
+- :class:`StreamingMI` — inkrementelles 2-D-Histogramm mit festen Bin-Grenzen
+
+``value()`` entspricht nach jedem Schritt der Batch-Funktion aus
+:mod:`src.core.metrics_batch` auf dem aktuellen Fenster, innerhalb von
+``BATCH_ABS_TOLERANCE`` (Replay-Test: ``tests/unit/test_core5_metrics_stream.py``).
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+
+class _SlidingSums:
+    """Laufende Summen fester Breite über die Beiträge der letzten ``window`` Samples."""
+
+    def __init__(self, window: int, width: int):
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self.window = window
+        self._terms: deque[tuple[float, ...]] = deque()
+        self._sums = [0.0] * width
+        self._since_resync = 0
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def _push_terms(self, terms: tuple[float, ...]) -> None:
+        sums = self._sums
+        if len(self._terms) == self.window:
+            for index, term in enumerate(self._terms.popleft()):
+                sums[index] -= term
+        self._terms.append(terms)
+        for index, term in enumerate(terms):
+            sums[index] += term
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            # Amortisiert O(1): einmal je Fensterlänge exakt neu summieren.
+            self._sums = [math.fsum(column) for column in zip(*self._terms)]
+            self._since_resync = 0
+
+
+class StreamingECI(_SlidingSums):
+    """[HYP] ECI-Proxy über ein gleitendes Fenster, wie :func:`metrics.eci`.
+
+    Usage:
+        stream = StreamingECI(window=250)
+        for sample in samples:
+            stream.push(sample)
+            current = stream.value()
+    """
+
+    def __init__(self, window: int):
+        super().__init__(window, 1)
+
+    def push(self, sample: float) -> None:
+        self._push_terms((float(sample),))
+
+    def value(self) -> float:
+        """Geklemmter Mittelwert des Fensters in [0.0, 1.0]; leer → 0.0."""
+        if not self._terms:
+            return 0.0
+        return min(max(self._sums[0] / len(self._terms), 0.0), 1.0)
+
+
+class StreamingPLV(_SlidingSums):
+    """Phase Locking Value über ein gleitendes Fenster, wie :func:`metrics.plv`."""
+
+    def __init__(self, window: int):
+        super().__init__(window, 2)
+
+    def push(self, phase: float) -> None:
+        """Phase (Radians) aufnehmen; Normierung auf [-pi, pi) wie die Referenz."""
+        wrapped = ((float(phase) + math.pi) % (2.0 * math.pi)) - math.pi
+        self._push_terms((math.cos(wrapped), math.sin(wrapped)))
+
+    def value(self) -> float:
+        """PLV des Fensters in [0.0, 1.0]; leer → 0.0."""
+        if not self._terms:
+            return 0.0
+        n = len(self._terms)
+        mean_cos, mean_sin = self._sums[0] / n, self._sums[1] / n
+        return min(max(math.sqrt(mean_cos * mean_cos + mean_sin * mean_sin), 0.0), 1.0)
+
+
+class StreamingPF(_SlidingSums):
+    """Power Flux über ein gleitendes Fenster, wie :func:`metrics.pf`."""
+
+    def __init__(self, window: int):
+        super().__init__(window, 1)
+
+    def push(self, sample: float) -> None:
+        self._push_terms((abs(float(sample)),))
+
+    def value(self) -> float:
+        """Mittel der Absolutwerte im Fenster; leer → 0.0."""
+        if not self._terms:
+            return 0.0
+        return self._sums[0] / len(self._terms)
+
+
+def _xlogx(count: int) -> float:
+    return count * math.log(count) if count > 0 else 0.0
+
+
+class StreamingMI:
+    """Mutual Information über ein gleitendes Fenster mit festem Histogramm.
+
+    Die Bin-Grenzen sind fest (``x_range``/``y_range``), damit ein Sample beim
+    Eintreten und Austreten genau eine Zelle ändert; Werte außerhalb landen im
+    Randbin. Gespeichert werden nur das Fenster (Bin-Paare) und die besetzten
+    Zellen, also höchstens O(window) Speicher. Mit ``S = sum(c * log c)``
+    über Verbund- und Randzählungen gilt
+
+        MI = log n + (S_xy - S_x - S_y) / n,
+
+    sodass jedes ``push`` die drei Summen in O(1) nachführt.
+
+    Entspricht ``mi_batch(x, y, bins=bins, x_range=x_range, y_range=y_range)``
+    auf dem aktuellen Fenster.
+    """
+
+    def __init__(
+        self,
+        window: int,
+        x_range: tuple[float, float],
+        y_range: tuple[float, float],
+        bins: int | None = None,
+    ):
+        """Akkumulator anlegen.
+
+        Args:
+            window: Fensterlänge in Samples.
+            x_range, y_range: Feste Bin-Grenzen ``(low, high)`` je Achse.
+            bins: Bins je Achse (Standard: ``max(2, int(sqrt(window)))``, die
+                Regel der Referenz für ein volles Fenster).
+        """
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        for name, (low, high) in (("x_range", x_range), ("y_range", y_range)):
+            if not high > low:
+                raise ValueError(f"{name} must be increasing, got {(low, high)}")
+        if bins is None:
+            bins = max(2, int(math.sqrt(window)))
+        elif bins < 2:
+            raise ValueError(f"bins must be >= 2, got {bins}")
+        self.window = window
+        self.bins = bins
+        self.x_range = (float(x_range[0]), float(x_range[1]))
+        self.y_range = (float(y_range[0]), float(y_range[1]))
+        self._pairs: deque[tuple[int, int]] = deque()
+        self._joint: dict[tuple[int, int], int] = {}
+        self._x_counts: dict[int, int] = {}
+        self._y_counts: dict[int, int] = {}
+        self._s_joint = self._s_x = self._s_y = 0.0
+        self._since_resync = 0
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def _bin(self, value: float, value_range: tuple[float, float]) -> int:
+        low, high = value_range
+        # Gleicher Ausdruck wie mi_batch mit festem Bereich.
+        index = math.floor((float(value) - low) / (high - low) * self.bins)
+        return min(max(index, 0), self.bins - 1)
+
+    @staticmethod
+    def _shift(counts: dict, key: object, delta: int) -> float:
+        """Zählung ändern; liefert die Änderung von ``c * log c``."""
+        before = counts.get(key, 0)
+        after = before + delta
+        if after:
+            counts[key] = after
+        else:
+            del counts[key]
+        return _xlogx(after) - _xlogx(before)
+
+    def _apply(self, pair: tuple[int, int], delta: int) -> None:
+        self._s_joint += self._shift(self._joint, pair, delta)
+        self._s_x += self._shift(self._x_counts, pair[0], delta)
+        self._s_y += self._shift(self._y_counts, pair[1], delta)
+
+    def push(self, x: float, y: float) -> None:
+        """Ein Samplepaar aufnehmen; das älteste fällt bei vollem Fenster heraus."""
+        if len(self._pairs) == self.window:
+            self._apply(self._pairs.popleft(), -1)
+        pair = (self._bin(x, self.x_range), self._bin(y, self.y_range))
+        self._pairs.append(pair)
+        self._apply(pair, 1)
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            # Amortisiert O(1): höchstens window besetzte Zellen neu summieren.
+            self._s_joint = math.fsum(_xlogx(c) for c in self._joint.values())
+            self._s_x = math.fsum(_xlogx(c) for c in self._x_counts.values())
+            self._s_y = math.fsum(_xlogx(c) for c in self._y_counts.values())
+            self._since_resync = 0
+
+    def value(self) -> float:
+        """MI des Fensters in nats (>= 0.0); weniger als 2 Samples → 0.0."""
+        n = len(self._pairs)
+        if n < 2:
+            return 0.0
+        return max(0.0, math.log(n) + (self._s_joint - self._s_x - self._s_y) / n)
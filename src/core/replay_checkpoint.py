@@ -0,0 +1,322 @@
+"""
+src/core/replay_checkpoint.py
+
+Replay-Checkpoints für den Evidence Routing Kernel v0.1a.
+
+Ein Checkpoint ist ein serialisierter ``ReplayState``, gebunden an die Policy
+(Version + Digest) und an den Ledger-``hash`` des zuletzt angewandten Events.
+Replay setzt beim neuesten Checkpoint fort, dessen Hash noch in der Kette
+steht, und wendet nur die danach angehängten Events an. Das Ergebnis ist
+byte-identisch zu einem vollständigen Replay (Invariante 10).
+
+Grenzen:
+- Ein Checkpoint ist abgeleiteter Cache, keine Quelle. Bei Policy-Drift,
+  unbekanntem Hash oder abweichendem State-Digest wird er verworfen und der
+  Stream weiter vorne (notfalls vollständig) replayt.
+- Die Integrität des Präfixes klärt der Ledger (``verify_chain_from_file``);
+  der Checkpoint verlässt sich auf die Hash-Kette, er prüft sie nicht erneut.
+- Lesen und Schreiben von Checkpoint-Dateien ist Sache der Tools; dieses Modul
+  liest nur den Eventstream.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .evidence_routing import (
+    ClaimPolicy,
+    EvidenceRoutingError,
+    ReasonCode,
+    ReplayState,
+    _canonical_state,
+    _parse_jsonl_line,
+    _rebuild_guard_views,
+    _rebuild_indexes,
+    _replay_event,
+    compute_state_digest,
+    load_claim_policy,
+)
+from .ledger import open_ledger_stream
+
+ERK_CHECKPOINT_SCHEMA_VERSION = "erk_replay_checkpoint.v0.1"
+
+_CHECKPOINT_FIELDS = {
+    "checkpoint_schema_version": str,
+    "policy_version": str,
+    "policy_digest": str,
+    "last_event_hash": str,
+    "line_number": int,
+    "byte_offset": int,
+    "state_digest": str,
+    "state": dict,
+}
+
+
+@dataclass(frozen=True)
+class ReplayCheckpoint:
+    """Persistierbarer Replay-Snapshot an einer Position der Ledger-Kette.
+
+    ``line_number`` (1-basiert) und ``byte_offset`` bezeichnen die Zeile des
+    zuletzt angewandten Events; ``last_event_hash`` ist deren Ledger-Hash.
+    ``state`` ist die kanonische, digest-relevante Zustandsdarstellung.
+    """
+
+    checkpoint_schema_version: str
+    policy_version: str
+    policy_digest: str
+    last_event_hash: str
+    line_number: int
+    byte_offset: int
+    state_digest: str
+    state: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class ResumedReplay:
+    """Ergebnis eines fortgesetzten Replays inklusive neuer Kettenposition.
+
+    ``resumed_from`` ist None, wenn kein Checkpoint verwendbar war und der
+    Stream vollständig replayt wurde. ``last_event_hash`` ist None, wenn die
+    letzte Zeile keinen Ledger-Hash trägt — dann ist kein neuer Checkpoint
+    möglich.
+    """
+
+    state: ReplayState
+    resumed_from: ReplayCheckpoint | None
+    events_applied: int
+    last_event_hash: str | None
+    line_number: int
+    byte_offset: int
+
+    def to_checkpoint(self) -> ReplayCheckpoint:
+        """Checkpoint für den erreichten Zustand erzeugen (fail-closed ohne Hash)."""
+        if self.last_event_hash is None:
+            raise EvidenceRoutingError(
+                "stream tail carries no ledger hash; cannot checkpoint",
+                [ReasonCode.EVENT_SCHEMA_INVALID],
+            )
+        return create_replay_checkpoint(
+            self.state,
+            last_event_hash=self.last_event_hash,
+            line_number=self.line_number,
+            byte_offset=self.byte_offset,
+        )
+
+
+def create_replay_checkpoint(
+    state: ReplayState,
+    *,
+    last_event_hash: str,
+    line_number: int,
+    byte_offset: int,
+) -> ReplayCheckpoint:
+    """ReplayState als Checkpoint an der angegebenen Kettenposition einfrieren."""
+    if state.policy_version is None or state.policy_digest is None:
+        raise EvidenceRoutingError(
+            "replay state is not bound to a policy", [ReasonCode.POLICY_DIGEST_MISMATCH]
+        )
+    serialized = json.dumps(
+        _canonical_state(state), sort_keys=True, separators=(",", ":"), allow_nan=False
+    )
+    return ReplayCheckpoint(
+        checkpoint_schema_version=ERK_CHECKPOINT_SCHEMA_VERSION,
+        policy_version=state.policy_version,
+        policy_digest=state.policy_digest,
+        last_event_hash=last_event_hash,
+        line_number=line_number,
+        byte_offset=byte_offset,
+        state_digest=compute_state_digest(state),
+        state=json.loads(serialized),
+    )
+
+
+def replay_checkpoint_from_dict(data: object) -> ReplayCheckpoint:
+    """Checkpoint strikt gegen das geschlossene Feldschema parsen."""
+    if not isinstance(data, Mapping) or set(data) != set(_CHECKPOINT_FIELDS):
+        raise EvidenceRoutingError(
+            "replay checkpoint field set invalid", [ReasonCode.EVENT_SCHEMA_INVALID]
+        )
+    for name, kind in _CHECKPOINT_FIELDS.items():
+        value = data[name]
+        if not isinstance(value, kind) or isinstance(value, bool):
+            raise EvidenceRoutingError(
+                f"replay checkpoint field has wrong type: {name}",
+                [ReasonCode.EVENT_SCHEMA_INVALID],
+            )
+    if data["checkpoint_schema_version"] != ERK_CHECKPOINT_SCHEMA_VERSION:
+        raise EvidenceRoutingError(
+            f"unknown checkpoint schema: {data['checkpoint_schema_version']!r}",
+            [ReasonCode.EVENT_SCHEMA_INVALID],
+        )
+    return ReplayCheckpoint(**copy.deepcopy(dict(data)))
+
+
+def restore_replay_state(checkpoint: ReplayCheckpoint, *, policy: ClaimPolicy) -> ReplayState:
+    """ReplayState aus einem Checkpoint wiederherstellen und gegenprüfen.
+
+    Fail-closed: Policy-Drift (POLICY_DIGEST_MISMATCH) oder ein Zustand, der
+    nicht mehr auf ``state_digest`` abbildet (EVENT_SCHEMA_INVALID), verwirft
+    den Checkpoint.
+    """
+    if checkpoint.policy_digest != policy.digest or checkpoint.policy_version != policy.version:
+        raise EvidenceRoutingError(
+            "checkpoint was taken under a different policy",
+            [ReasonCode.POLICY_DIGEST_MISMATCH],
+        )
+    data = copy.deepcopy(checkpoint.state)
+    expected = set(_canonical_state(ReplayState()))
+    if set(data) != expected:
+        raise EvidenceRoutingError(
+            "checkpoint state field set invalid", [ReasonCode.EVENT_SCHEMA_INVALID]
+        )
+    state = ReplayState(**data)
+    if (
+        state.policy_digest != checkpoint.policy_digest
+        or state.policy_version != checkpoint.policy_version
+        or compute_state_digest(state) != checkpoint.state_digest
+    ):
+        raise EvidenceRoutingError(
+            "checkpoint state does not match its recorded digest",
+            [ReasonCode.EVENT_SCHEMA_INVALID],
+        )
+    _rebuild_guard_views(state)
+    _rebuild_indexes(state)
+    return state
+
+
+def resume_replay_jsonl(
+    path: str | Path,
+    checkpoints: Sequence[ReplayCheckpoint] = (),
+    *,
+    policy: ClaimPolicy | None = None,
+) -> ResumedReplay:
+    """JSONL-Ledger ab dem neuesten noch gültigen Checkpoint replayen.
+
+    Ein Checkpoint ist gültig, wenn er unter derselben Policy entstand und sein
+    ``last_event_hash`` noch in der Datei steht. Zuerst wird die gespeicherte
+    Byte-Position direkt geprüft (O(1)); nur wenn keine passt — etwa weil die
+    Datei neu geschrieben wurde — wird einmal nach den Hashes gesucht. Ohne
+    gültigen Checkpoint wird vollständig replayt. Ein rotierter Ledger zählt
+    als ein Stream: Zeilennummern und Byte-Positionen laufen über die
+    versiegelten Segmente und die aktive Datei.
+    """
+    if policy is None:
+        policy = load_claim_policy()
+    path = Path(path)
+    candidates = sorted(
+        (
+            checkpoint
+            for checkpoint in checkpoints
+            if checkpoint.policy_digest == policy.digest
+            and checkpoint.policy_version == policy.version
+        ),
+        key=lambda checkpoint: checkpoint.line_number,
+        reverse=True,
+    )
+
+    with open_ledger_stream(path) as handle:
+        resumed = _select_checkpoint(handle, candidates, policy)
+        if resumed is None:
+            state = ReplayState(policy_version=policy.version, policy_digest=policy.digest)
+            checkpoint = None
+            line_number, byte_offset = 0, 0
+            handle.seek(0)
+        else:
+            state, checkpoint, line_number, byte_offset = resumed
+
+        last_event_hash = checkpoint.last_event_hash if checkpoint is not None else None
+        events_applied = 0
+        offset = handle.tell()
+        for raw_line in handle:
+            line_offset = offset
+            offset += len(raw_line)
+            line_number += 1
+            line = raw_line.strip()
+            if not line:
+                continue
+            event = _parse_jsonl_line(line_number, line)
+            _replay_event(state, event, policy)
+            events_applied += 1
+            byte_offset = line_offset
+            tail_hash = event.get("hash") if isinstance(event, Mapping) else None
+            last_event_hash = tail_hash if isinstance(tail_hash, str) else None
+
+    return ResumedReplay(
+        state=state,
+        resumed_from=checkpoint,
+        events_applied=events_applied,
+        last_event_hash=last_event_hash,
+        line_number=line_number,
+        byte_offset=byte_offset,
+    )
+
+
+def _line_hash(line: bytes) -> object:
+    event = _parse_jsonl_line(0, line)
+    return event.get("hash") if isinstance(event, Mapping) else None
+
+
+def _select_checkpoint(
+    handle: Any, candidates: Sequence[ReplayCheckpoint], policy: ClaimPolicy
+) -> tuple[ReplayState, ReplayCheckpoint, int, int] | None:
+    """Neuesten verwendbaren Checkpoint wählen und den Handle dahinter positionieren."""
+    if not candidates:
+        return None
+
+    # Schneller Pfad: gespeicherte Position trägt noch denselben Hash.
+    for checkpoint in candidates:
+        handle.seek(checkpoint.byte_offset)
+        if _line_hash(handle.readline()) != checkpoint.last_event_hash:
+            continue
+        resume_at = handle.tell()
+        try:
+            state = restore_replay_state(checkpoint, policy=policy)
+        except EvidenceRoutingError:
+            continue
+        handle.seek(resume_at)
+        return state, checkpoint, checkpoint.line_number, checkpoint.byte_offset
+
+    # Fallback: Datei wurde umgeschrieben; Hashes einmal in der Kette suchen.
+    wanted = {checkpoint.last_event_hash for checkpoint in candidates}
+    found: dict[str, tuple[int, int, int]] = {}
+    handle.seek(0)
+    offset = 0
+    for line_number, raw_line in enumerate(handle, start=1):
+        line_offset = offset
+        offset += len(raw_line)
+        line = raw_line.strip()
+        if not line:
+            continue
+        tail_hash = _line_hash(line)
+        if isinstance(tail_hash, str) and tail_hash in wanted:
+            found[tail_hash] = (line_number, line_offset, offset)
+
+    relocated = sorted(
+        (
+            (found[checkpoint.last_event_hash], checkpoint)
+            for checkpoint in candidates
+            if checkpoint.last_event_hash in found
+        ),
+        key=lambda item: item[0][0],
+        reverse=True,
+    )
+    for (line_number, line_offset, resume_at), checkpoint in relocated:
+        if line_number != checkpoint.line_number:
+            # Zeilennummern fließen in rejected_events ein; bei verschobener
+            # Position wäre der fortgesetzte Zustand nicht mehr byte-identisch.
+            continue
+        try:
+            state = restore_replay_state(checkpoint, policy=policy)
+        except EvidenceRoutingError:
+            continue
+        handle.seek(resume_at)
+        return state, checkpoint, line_number, line_offset
+    return None
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark — Core-5 Metriken, skalar vs. vektorisiert
+Misst die skalaren Referenzfunktionen (src/core/metrics.py, Zeile für Zeile)
+gegen die NumPy-Engine (src/core/metrics_batch.py) für 10^3 bis 10^6 Samples
+je Reihe. Die Ergebnisse müssen innerhalb von BATCH_ABS_TOLERANCE übereinstimmen.
+
+    python3 tests/benchmark/test_core5_metrics_batch.py [--series 4] [--max-samples 1000000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.core.metrics import fd, mi, pf, plv  # noqa: E402
+from src.core.metrics_batch import (  # noqa: E402
+    BATCH_ABS_TOLERANCE,
+    fd_batch,
+    mi_batch,
+    pf_batch,
+    plv_batch,
+)
+
+METRICS = {
+    "plv": (plv, plv_batch, 1),
+    "mi": (mi, mi_batch, 2),
+    "fd": (fd, fd_batch, 1),
+    "pf": (pf, pf_batch, 1),
+}
+
+
+def biosignal_windows(n_series, n_samples, seed=0):
+    """Synthetische 250-Hz-Fenster: 10-Hz-Rhythmus mit Drift und Rauschen."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_samples) / 250.0
+    phase = rng.uniform(0.0, 2.0 * np.pi, size=(n_series, 1))
+    drift = np.cumsum(rng.normal(scale=0.01, size=(n_series, n_samples)), axis=1)
+    return np.sin(2.0 * np.pi * 10.0 * t + phase) + drift + rng.normal(size=(n_series, n_samples))
+
+
+def run_metrics_benchmark(n_series, sizes):
+    results = []
+    for n_samples in sizes:
+        x = biosignal_windows(n_series, n_samples)
+        y = biosignal_windows(n_series, n_samples, seed=1) + 0.5 * x
+        for name, (scalar, batch, arity) in METRICS.items():
+            args = (x, y)[:arity]
+            start = time.perf_counter()
+            lists = [arg.tolist() for arg in args]
+            expected = np.array([scalar(*(rows[i] for rows in lists)) for i in range(n_series)])
+            scalar_s = time.perf_counter() - start
+            start = time.perf_counter()
+            result = batch(*args)
+            batch_s = time.perf_counter() - start
+            results.append(
+                {
+                    "metric": name,
+                    "samples": n_samples,
+                    "series": n_series,
+                    "scalar_s": round(scalar_s, 4),
+                    "batch_s": round(batch_s, 4),
+                    "speedup": round(scalar_s / max(batch_s, 1e-9), 1),
+                    "max_abs_diff": float(np.max(np.abs(result - expected))),
+                }
+            )
+    return results
+
+
+def test_batch_engine_matches_reference_at_benchmark_sizes():
+    for row in run_metrics_benchmark(2, [1_000, 10_000]):
+        assert row["max_abs_diff"] <= BATCH_ABS_TOLERANCE, row
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--series", type=int, default=4)
+    parser.add_argument("--max-samples", type=int, default=1_000_000)
+    args = parser.parse_args()
+    sizes = [10**exponent for exponent in range(3, 7) if 10**exponent <= args.max_samples]
+    print(json.dumps(run_metrics_benchmark(args.series, sizes), indent=2))
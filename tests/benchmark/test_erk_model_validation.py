@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark — ERK Modellvalidierung
+Vergleicht den interpretierenden Referenzpfad (interpret_model_payload) mit
+den kompilierten Validatoren (model_from_payload) auf den ERK-Fixtures,
+hochskaliert auf N Payloads. Ergebnisse müssen identisch sein.
+
+    python3 tests/benchmark/test_erk_model_validation.py [--events 1000000]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.core.evidence_routing import (  # noqa: E402
+    EVENT_CLAIM_CREATED,
+    EVENT_EVIDENCE_RELATION_RECORDED,
+    EVENT_GUARD_DECISION_RECORDED,
+    EVENT_HUMAN_DECISION_RECORDED,
+    EVENT_MATERIAL_REGISTERED,
+    EVENT_RETRACTION_RECORDED,
+    EVENT_TRANSITION_REQUESTED,
+    ClaimCandidate,
+    EvidenceRelation,
+    GuardDecision,
+    HumanDecision,
+    MaterialRef,
+    Retraction,
+    TransitionRequest,
+    model_from_payload,
+)
+from tests.unit.test_evidence_routing import interpret_model_payload  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "erk"
+
+EVENT_MODELS = {
+    EVENT_MATERIAL_REGISTERED: MaterialRef,
+    EVENT_CLAIM_CREATED: ClaimCandidate,
+    EVENT_EVIDENCE_RELATION_RECORDED: EvidenceRelation,
+    EVENT_TRANSITION_REQUESTED: TransitionRequest,
+    EVENT_GUARD_DECISION_RECORDED: GuardDecision,
+    EVENT_HUMAN_DECISION_RECORDED: HumanDecision,
+    EVENT_RETRACTION_RECORDED: Retraction,
+}
+
+
+def fixture_payloads():
+    """(Modell, Payload) aller modellierten Events aus den ERK-Fixtures."""
+    payloads = []
+    for path in sorted(FIXTURES.glob("*.jsonl")):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                event = json.loads(line)
+                if event["type"] in EVENT_MODELS:
+                    payloads.append((EVENT_MODELS[event["type"]], event["payload"]))
+    return payloads
+
+
+def run_validation_benchmark(n_events):
+    payloads = fixture_payloads()
+    workload = list(itertools.islice(itertools.cycle(payloads), n_events))
+    timings = {}
+    for name, parse in (
+        ("interpreted", interpret_model_payload),
+        ("compiled", model_from_payload),
+    ):
+        # Ergebnisse nicht festhalten: sonst misst der Lauf vor allem die GC.
+        start = time.perf_counter()
+        for cls, payload in workload:
+            parse(cls, payload)
+        timings[name] = time.perf_counter() - start
+    return {
+        "events": n_events,
+        "interpreted_s": round(timings["interpreted"], 3),
+        "compiled_s": round(timings["compiled"], 3),
+        "speedup": round(timings["interpreted"] / max(timings["compiled"], 1e-9), 2),
+        "identical": all(
+            interpret_model_payload(cls, payload) == model_from_payload(cls, payload)
+            for cls, payload in payloads
+        ),
+    }
+
+
+def test_compiled_validators_match_reference_on_scaled_fixtures():
+    result = run_validation_benchmark(10_000)
+    assert result["identical"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=1_000_000)
+    print(json.dumps(run_validation_benchmark(parser.parse_args().events), indent=2))
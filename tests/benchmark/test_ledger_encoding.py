@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark — Ledger-Eventkodierung
+Vergleicht den bisherigen Pfad von Ledger.event (Payload kanonisch kodieren,
+per json.loads kopieren, für den Hash und für die Zeile erneut kodieren) mit
+dem Einmal-Kodierungspfad (_encode_event). Hashes und Dateizeilen müssen
+byte-identisch sein.
+
+    python3 tests/benchmark/test_ledger_encoding.py [--events 200000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.core.ledger import LedgerEvent, _build_event, _encode_event  # noqa: E402
+
+
+def workload(n_events):
+    """Domain-Events in der Form, wie Intake-Tools sie anhängen."""
+    return [
+        (
+            "MATERIAL_REGISTERED",
+            {
+                "material_id": f"mat-{index:06d}",
+                "sha256": f"{index:064x}",
+                "source": {"kind": "upload", "path": f"inbox/doc_{index}.pdf", "bytes": index * 7},
+                "tags": ["intake", "pdf", "ä-ö-ü"],
+                "score": index / 3.0,
+            },
+            f"evt-{index}",
+            1_700_000_000.0 + index,
+        )
+        for index in range(n_events)
+    ]
+
+
+def legacy_encode(event_type, payload, event_id, timestamp, prev_hash):
+    """Bisheriger Pfad: drei Kodierungen und eine Rückkopie je Event."""
+    canonical = json.dumps(dict(payload), sort_keys=True, separators=(",", ":"), allow_nan=False)
+    event = LedgerEvent(
+        type=event_type,
+        payload=json.loads(canonical),
+        event_id=event_id,
+        timestamp=float(timestamp),
+        prev_hash=prev_hash,
+    )
+    event.hash = event.compute_hash()
+    return event, json.dumps(event.to_dict(), separators=(",", ":")) + "\n"
+
+
+def single_encode(event_type, payload, event_id, timestamp, prev_hash):
+    """Neuer Pfad: eine kanonische Payload-Kodierung für Hash und Zeile."""
+    event, payload_json = _build_event(event_type, payload, event_id, timestamp, None)
+    event.prev_hash = prev_hash
+    return event, _encode_event(event, payload_json)
+
+
+def run_encoding_benchmark(n_events):
+    events = workload(n_events)
+    timings, outputs = {}, {}
+    for name, encode in (("legacy", legacy_encode), ("single", single_encode)):
+        lines = []
+        prev_hash = None
+        start = time.perf_counter()
+        for event_type, payload, event_id, timestamp in events:
+            event, line = encode(event_type, payload, event_id, timestamp, prev_hash)
+            prev_hash = event.hash
+            lines.append(line)
+        timings[name] = time.perf_counter() - start
+        outputs[name] = lines
+    return {
+        "events": n_events,
+        "legacy_events_per_s": round(n_events / max(timings["legacy"], 1e-9)),
+        "single_events_per_s": round(n_events / max(timings["single"], 1e-9)),
+        "speedup": round(timings["legacy"] / max(timings["single"], 1e-9), 2),
+        "identical": outputs["legacy"] == outputs["single"],
+    }
+
+
+def test_single_encoding_matches_legacy_lines():
+    result = run_encoding_benchmark(2_000)
+    assert result["identical"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=200_000)
+    print(json.dumps(run_encoding_benchmark(parser.parse_args().events), indent=2))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark — geteilte Ledger-Appends
+N Produzenten-Prozesse hängen gleichzeitig an dieselbe Ledger-Datei an
+(Ledger(shared=True): Advisory-Lock, Tail-Re-Read, Append), einmal Event für
+Event und einmal in Batches über emit_many. Referenz ist ein einzelner
+Prozess ohne Lock. Die Hash-Kette der Datei muss danach intakt sein.
+
+    python3 tests/benchmark/test_ledger_shared_append.py [--producers 8] [--events 5000]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.core.ledger import Ledger, verify_chain_from_file  # noqa: E402
+
+
+def produce(path, producer, n_events, batch_size, shared, start_barrier):
+    """Ein Produzent: n_events Metriken, einzeln oder in Batches."""
+    with Ledger(path, shared=shared) as ledger:
+        if start_barrier is not None:
+            start_barrier.wait()
+        if batch_size == 1:
+            for index in range(n_events):
+                ledger.metric(f"producer{producer}", float(index))
+            return
+        for start in range(0, n_events, batch_size):
+            ledger.emit_many(
+                {"type": "metric", "payload": {"metric_id": f"producer{producer}", "value": i}}
+                for i in range(start, min(start + batch_size, n_events))
+            )
+
+
+def run_producers(path, producers, n_events, batch_size):
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(producers + 1)
+    workers = [
+        context.Process(target=produce, args=(path, p, n_events, batch_size, True, barrier))
+        for p in range(producers)
+    ]
+    for worker in workers:
+        worker.start()
+    barrier.wait()  # Prozessstart nicht mitmessen
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    if any(worker.exitcode != 0 for worker in workers):
+        raise RuntimeError("producer failed")
+    return elapsed
+
+
+def run_shared_append_benchmark(producers, n_events, batch_size=64):
+    total = producers * n_events
+    result = {"producers": producers, "events_per_producer": n_events, "batch_size": batch_size}
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = Path(tmp) / "single.jsonl"
+        start = time.perf_counter()
+        produce(str(baseline), 0, total, 1, False, None)
+        result["single_process_events_per_s"] = round(total / (time.perf_counter() - start))
+
+        valid = True
+        for name, size in (("shared_single", 1), ("shared_batched", batch_size)):
+            path = Path(tmp) / f"{name}.jsonl"
+            elapsed = run_producers(str(path), producers, n_events, size)
+            result[f"{name}_events_per_s"] = round(total / elapsed)
+            lines = sum(1 for line in path.read_text(encoding="utf-8").splitlines() if line)
+            valid = valid and lines == total and verify_chain_from_file(path)
+        result["chain_valid"] = valid
+    return result
+
+
+def test_eight_producers_keep_one_chain():
+    result = run_shared_append_benchmark(8, 50, batch_size=16)
+    assert result["chain_valid"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--producers", type=int, default=8)
+    parser.add_argument("--events", type=int, default=5_000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run_shared_append_benchmark(args.producers, args.events, args.batch_size), indent=2
+        )
+    )
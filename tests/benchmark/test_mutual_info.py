@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark — MI-Schätzer über viele Kanäle
+Paarweise MI aller Kanäle: frühere Dict-Schleife (Paar für Paar) gegen
+pairwise_mi (src/core/mutual_info.py) mit sqrt-, Freedman–Diaconis- und
+Knuth-Bins sowie KSG. Die sqrt-Ergebnisse müssen innerhalb von
+BATCH_ABS_TOLERANCE mit der Schleife übereinstimmen.
+
+    python3 tests/benchmark/test_mutual_info.py [--channels 16] [--samples 10000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.core.metrics_batch import BATCH_ABS_TOLERANCE  # noqa: E402
+from src.core.mutual_info import pairwise_mi  # noqa: E402
+from tests.unit.test_core5_mutual_info import loop_mi  # noqa: E402
+
+
+def channel_block(n_channels, n_samples, seed=0):
+    """Kanäle mit gemeinsamer Quelle und kanalweise wachsendem Rauschen."""
+    rng = np.random.default_rng(seed)
+    source = rng.normal(size=n_samples)
+    noise = rng.normal(size=(n_channels, n_samples))
+    return source + noise * np.linspace(0.2, 3.0, n_channels)[:, np.newaxis]
+
+
+def run_mutual_info_benchmark(n_channels, n_samples, ksg=True):
+    channels = channel_block(n_channels, n_samples)
+    lists = channels.tolist()
+    start = time.perf_counter()
+    expected = np.full((n_channels, n_channels), np.nan)
+    for i in range(n_channels):
+        for j in range(i + 1, n_channels):
+            expected[i, j] = expected[j, i] = loop_mi(lists[i], lists[j])
+    loop_s = time.perf_counter() - start
+
+    result = {"channels": n_channels, "samples": n_samples, "loop_sqrt_s": round(loop_s, 4)}
+    variants = [("sqrt", "histogram", "sqrt"), ("fd", "histogram", "fd")]
+    variants += [("knuth", "histogram", "knuth")] + ([("ksg", "ksg", "sqrt")] if ksg else [])
+    for name, estimator, bins in variants:
+        start = time.perf_counter()
+        matrix = pairwise_mi(channels, estimator=estimator, bins=bins)
+        result[f"{name}_s"] = round(time.perf_counter() - start, 4)
+        if name == "sqrt":
+            off_diagonal = ~np.eye(n_channels, dtype=bool)
+            diff = np.abs(matrix - expected)[off_diagonal]
+            result["sqrt_max_abs_diff"] = float(diff.max()) if diff.size else 0.0
+            result["sqrt_speedup"] = round(loop_s / max(result["sqrt_s"], 1e-9), 1)
+    return result
+
+
+def test_pairwise_histogram_matches_loop():
+    result = run_mutual_info_benchmark(6, 2_000, ksg=False)
+    assert result["sqrt_max_abs_diff"] <= BATCH_ABS_TOLERANCE, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, default=16)
+    parser.add_argument("--samples", type=int, default=10_000)
+    parser.add_argument("--no-ksg", action="store_true")
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run_mutual_info_benchmark(args.channels, args.samples, ksg=not args.no_ksg), indent=2
+        )
+    )
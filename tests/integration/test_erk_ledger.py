@@ -5,8 +5,8 @@ from pathlib import Path
 
 import pytest
 
-from src.core.evidence_routing import replay_events
-from src.core.ledger import Ledger, load_ledger, verify_chain_from_file
+from src.core.evidence_routing import replay_events, replay_jsonl
+from src.core.ledger import Ledger, iter_ledger, load_ledger, verify_chain_from_file
 
 FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "erk"
 
@@ -101,6 +101,9 @@ def test_ledger_file_roundtrip_replays_to_expected_state(tmp_path):
 
     # Derselbe persistierte Stream ergibt denselben State-Digest:
     assert replay_events(load_ledger(path)).state_digest == state.state_digest
+    # ... auch gestreamt, ohne die Eventliste zu materialisieren:
+    assert replay_events(iter_ledger(path)).state_digest == state.state_digest
+    assert replay_jsonl(path).state_digest == state.state_digest
 
 
 def test_ledger_hash_chain_and_state_digest_are_distinct_concepts(tmp_path):
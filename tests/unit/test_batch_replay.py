@@ -0,0 +1,100 @@
+"""Unit-Tests für den Batch-Replay (src/core/batch_replay.py)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core.batch_replay import (
+    STREAM_ERROR,
+    STREAM_OK,
+    STREAM_TIMEOUT,
+    replay_streams,
+)
+from src.core.evidence_routing import load_claim_policy, replay_jsonl
+from src.core.ledger import Ledger, load_segment_manifest
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "erk"
+STREAMS = sorted(FIXTURES.glob("*.jsonl"))
+
+
+def write_rejecting_stream(path):
+    lines = [
+        "not json",
+        json.dumps({"type": "UNKNOWN_EVENT", "event_id": "evt-x", "payload": {}}),
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+class TestReplayStreams:
+    def test_serial_report_matches_individual_replays(self):
+        report = replay_streams(STREAMS, workers=0)
+        assert report.ok
+        assert [summary.stream for summary in report.streams] == [str(s) for s in STREAMS]
+        for stream, summary in zip(STREAMS, report.streams):
+            assert summary.status == STREAM_OK
+            assert summary.state_digest == replay_jsonl(stream).state_digest
+        assert report.totals["streams"] == report.totals["ok"] == len(STREAMS)
+
+    def test_parallel_report_is_identical_to_serial(self):
+        policy = load_claim_policy()
+        serial = replay_streams(STREAMS, policy=policy, workers=1)
+        parallel = replay_streams(STREAMS, policy=policy, workers=2, chunksize=2)
+        assert parallel.to_dict() == serial.to_dict()
+        assert parallel.report_digest == serial.report_digest
+
+    def test_rejections_are_summarized_by_reason_code(self, tmp_path):
+        stream = write_rejecting_stream(tmp_path / "rejecting.jsonl")
+        (summary,) = replay_streams([stream], workers=0).streams
+        state = replay_jsonl(stream)
+        assert summary.rejected_events == len(state.rejected_events) == 2
+        assert sum(summary.rejection_reason_codes.values()) >= 2
+        assert list(summary.rejection_reason_codes) == sorted(summary.rejection_reason_codes)
+
+    def test_missing_stream_is_reported_not_skipped(self, tmp_path):
+        missing = tmp_path / "missing.jsonl"
+        report = replay_streams([STREAMS[0], missing], workers=0)
+        assert not report.ok
+        assert report.streams[1].status == STREAM_ERROR
+        assert report.streams[1].state_digest is None
+        assert report.totals["error"] == 1
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_stream_failure_is_reported_not_raised(self, tmp_path, workers):
+        # Zu tief verschachteltes JSON: RecursionError statt OSError/ValueError
+        broken = tmp_path / "nested.jsonl"
+        broken.write_text("[" * 200_000 + "\n", encoding="utf-8")
+        report = replay_streams([STREAMS[0], broken], workers=workers)
+        assert [summary.status for summary in report.streams] == [STREAM_OK, STREAM_ERROR]
+        assert report.streams[1].error.startswith("RecursionError")
+        assert report.streams[1].state_digest is None
+        assert report.totals["error"] == 1
+
+    def test_rotated_ledger_is_one_stream(self, tmp_path):
+        plain, rotated = tmp_path / "plain.jsonl", tmp_path / "rotated.jsonl"
+        for path, options in ((plain, {}), (rotated, {"segment_max_events": 2})):
+            with Ledger(path, **options) as ledger:
+                for line in STREAMS[0].read_text(encoding="utf-8").splitlines():
+                    event = json.loads(line)
+                    ledger.event(
+                        event["type"],
+                        event["payload"],
+                        event_id=event["event_id"],
+                        timestamp=event["timestamp"],
+                    )
+        assert load_segment_manifest(rotated)
+        first, second = replay_streams([plain, rotated], workers=0).streams
+        assert second.status == STREAM_OK
+        assert second.state_digest == first.state_digest == replay_jsonl(plain).state_digest
+
+    def test_exhausted_timeout_marks_remaining_streams(self):
+        report = replay_streams(STREAMS, workers=0, timeout=0)
+        assert {summary.status for summary in report.streams} == {STREAM_TIMEOUT}
+        assert report.totals["timeout"] == len(STREAMS)
+
+    def test_invalid_controls_fail(self):
+        with pytest.raises(ValueError):
+            replay_streams(STREAMS, chunksize=0)
+        with pytest.raises(ValueError):
+            replay_streams(STREAMS, workers=-1)
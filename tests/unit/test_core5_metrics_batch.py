@@ -0,0 +1,158 @@
+"""Unit-Tests für die vektorisierte Core-5 Engine (src/core/metrics_batch.py).
+
+Jede Batch-Funktion muss zeilenweise mit der skalaren Referenz aus
+src/core/metrics.py innerhalb von BATCH_ABS_TOLERANCE übereinstimmen. Für FD
+ist die frühere Schleifen-Implementierung (``loop_fd``) die Referenz, da
+``metrics.fd`` inzwischen selbst ``fd_batch`` aufruft.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.core.metrics import eci, fd, mi, pf, plv
+from src.core.metrics_batch import (
+    BATCH_ABS_TOLERANCE,
+    eci_batch,
+    fd_batch,
+    higuchi_curve,
+    mi_batch,
+    pf_batch,
+    plv_batch,
+)
+
+
+def loop_fd(series, k_max=4):
+    """Frühere Higuchi-Schleife aus metrics.fd, um ``k_max`` erweitert."""
+    n = len(series)
+    if n < 4:
+        return 1.0
+    log_k, log_l = [], []
+    for k in range(1, min(k_max, n // 2) + 1):
+        lengths = []
+        for m in range(1, k + 1):
+            idxs = list(range(m - 1, n, k))
+            if len(idxs) < 2:
+                continue
+            total = sum(abs(series[idxs[i]] - series[idxs[i - 1]]) for i in range(1, len(idxs)))
+            lengths.append(total * (n - 1) / (k * (len(idxs) - 1)))
+        avg = sum(lengths) / len(lengths)
+        if avg > 0:
+            log_k.append(math.log(1.0 / k))
+            log_l.append(math.log(avg))
+    if len(log_k) < 2:
+        return 1.5
+    n_pts = len(log_k)
+    sx, sy = sum(log_k), sum(log_l)
+    sxx = sum(v * v for v in log_k)
+    sxy = sum(a * b for a, b in zip(log_k, log_l))
+    denom = n_pts * sxx - sx * sx
+    if abs(denom) < 1e-10:
+        return 1.5
+    return min(max((n_pts * sxy - sx * sy) / denom, 1.0), 2.0)
+
+
+SINGLE = [(eci_batch, eci), (plv_batch, plv), (fd_batch, loop_fd), (pf_batch, pf)]
+
+
+def signals(n_samples, n_series=6, seed=0):
+    """Gemischte Zeilen: Rauschen, Random Walk, Phasen, Ganzzahlen, Konstante, Rampe."""
+    rng = np.random.default_rng(seed)
+    return np.stack(
+        [
+            rng.normal(size=n_samples),
+            np.cumsum(rng.normal(size=n_samples)),
+            rng.uniform(-20.0, 20.0, size=n_samples),
+            rng.integers(-3, 4, size=n_samples).astype(float),
+            np.full(n_samples, 0.5),
+            np.linspace(0.0, 1.0, n_samples),
+        ][:n_series]
+    )
+
+
+@pytest.mark.parametrize("n_samples", [0, 1, 3, 4, 5, 9, 64, 2500])
+@pytest.mark.parametrize("batch, scalar", SINGLE)
+def test_single_series_metrics_match_reference(batch, scalar, n_samples):
+    rows = signals(n_samples)
+    expected = np.array([scalar(list(row)) for row in rows])
+    result = batch(rows)
+    assert result.shape == (rows.shape[0],)
+    np.testing.assert_allclose(result, expected, rtol=0, atol=BATCH_ABS_TOLERANCE)
+
+
+@pytest.mark.parametrize("n_samples", [0, 1, 2, 9, 100, 2500])
+def test_mi_matches_reference(n_samples):
+    x = signals(n_samples, seed=1)
+    y = x + np.random.default_rng(2).normal(scale=0.5, size=x.shape)
+    expected = np.array([mi(list(a), list(b)) for a, b in zip(x, y)])
+    np.testing.assert_allclose(mi_batch(x, y), expected, rtol=0, atol=BATCH_ABS_TOLERANCE)
+
+
+def test_mi_truncates_to_shorter_series_and_checks_rows():
+    x = signals(50, n_series=2)
+    y = signals(40, n_series=2, seed=3)
+    expected = [mi(list(a), list(b)) for a, b in zip(x, y)]
+    np.testing.assert_allclose(mi_batch(x, y), expected, rtol=0, atol=BATCH_ABS_TOLERANCE)
+    with pytest.raises(ValueError):
+        mi_batch(x, y[:1])
+
+
+def test_one_dimensional_input_is_one_series():
+    series = [3, 1, 4, 1, 5, 9, 2, 6]
+    assert fd_batch(series).tolist() == pytest.approx([loop_fd(series)])
+    assert plv_batch([0.5] * 5).tolist() == pytest.approx([1.0])
+
+
+def test_rejects_higher_dimensional_input():
+    with pytest.raises(ValueError):
+        pf_batch(np.zeros((2, 2, 2)))
+
+
+class TestHiguchi:
+    def test_scalar_fd_keeps_previous_results(self):
+        for series in signals(257).tolist() + [[3, 1, 4, 1, 5, 9, 2, 6], list(range(1, 17))]:
+            assert fd(series) == pytest.approx(loop_fd(series), abs=BATCH_ABS_TOLERANCE)
+
+    @pytest.mark.parametrize("k_max", [2, 7, 16])
+    def test_larger_k_max_matches_loop(self, k_max):
+        rows = signals(301, seed=4)
+        expected = [loop_fd(list(row), k_max) for row in rows]
+        np.testing.assert_allclose(
+            fd_batch(rows, k_max), expected, rtol=0, atol=BATCH_ABS_TOLERANCE
+        )
+
+    def test_curve_has_one_column_per_k(self):
+        ks, curve = higuchi_curve(signals(100, n_series=3), k_max=8)
+        assert ks.tolist() == list(range(1, 9)) and curve.shape == (3, 8)
+        with pytest.raises(ValueError):
+            higuchi_curve([1.0, 2.0, 3.0])
+
+    def test_auto_k_max_recovers_known_dimensions(self):
+        rng = np.random.default_rng(5)
+        noise = rng.normal(size=(4, 5000))
+        walk = np.cumsum(noise, axis=1)
+        assert np.all(np.abs(fd_batch(noise, "auto", standard=True) - 2.0) < 0.05)
+        assert np.all(np.abs(fd_batch(walk, "auto", standard=True) - 1.5) < 0.05)
+
+    def test_default_scale_is_one_below_higuchi(self):
+        walk = np.cumsum(np.random.default_rng(6).normal(size=(3, 2000)), axis=1)
+        np.testing.assert_allclose(
+            fd_batch(walk, 12, clamp=False) + 1.0,
+            fd_batch(walk, 12, clamp=False, standard=True),
+            rtol=0,
+            atol=BATCH_ABS_TOLERANCE,
+        )
+
+    def test_unclamped_slope_can_leave_interval(self):
+        ramp = list(range(1, 101))  # Gerade: bisherige Skala liefert 0.0
+        assert fd(ramp, clamp=False) == pytest.approx(0.0, abs=1e-9)
+        assert fd(ramp) == 1.0
+        assert fd(ramp, standard=True) == pytest.approx(1.0)
+
+    @pytest.mark.parametrize("k_max", [1, 0, "max"])
+    def test_invalid_k_max_fails(self, k_max):
+        with pytest.raises(ValueError):
+            fd_batch(signals(50), k_max)
+        with pytest.raises(ValueError):
+            fd([1.0, 2.0], k_max)
@@ -0,0 +1,89 @@
+"""Unit-Tests für die gleitenden Core-5 Metriken (src/core/metrics_stream.py).
+
+Replay: nach jedem push muss value() mit der Batch-Funktion auf dem aktuellen
+Fenster übereinstimmen — beim Auffüllen wie nach jeder Verdrängung.
+"""
+
+import numpy as np
+import pytest
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.core.metrics_batch import BATCH_ABS_TOLERANCE, eci_batch, mi_batch, pf_batch, plv_batch
+from src.core.metrics_stream import StreamingECI, StreamingMI, StreamingPF, StreamingPLV
+
+WINDOW = 40
+STEPS = 5 * WINDOW + 7  # mehrere Resyncs, Ende mitten im Fenster
+
+
+def windows(samples):
+    """Fenster nach jedem Schritt: erst wachsend, dann gleitend."""
+    growing = [samples[: step + 1] for step in range(min(WINDOW, len(samples)) - 1)]
+    return growing, sliding_window_view(samples, WINDOW)
+
+
+def batch_per_step(batch, *series, **options):
+    expected = []
+    growing = [windows(values)[0] for values in series]
+    for parts in zip(*growing):
+        expected.append(batch(*parts, **options)[0])
+    full = [windows(values)[1] for values in series]
+    expected.extend(batch(*full, **options))
+    return np.array(expected)
+
+
+@pytest.mark.parametrize(
+    "stream_cls, batch, scale",
+    [(StreamingECI, eci_batch, 0.4), (StreamingPLV, plv_batch, 40.0), (StreamingPF, pf_batch, 3.0)],
+)
+def test_replay_matches_batch_at_every_step(stream_cls, batch, scale):
+    samples = np.random.default_rng(0).normal(loc=0.5, scale=scale, size=STEPS)
+    stream = stream_cls(WINDOW)
+    values = []
+    for sample in samples:
+        stream.push(sample)
+        values.append(stream.value())
+    assert len(stream) == WINDOW
+    np.testing.assert_allclose(
+        values, batch_per_step(batch, samples), rtol=0, atol=BATCH_ABS_TOLERANCE
+    )
+
+
+def test_mi_replay_matches_fixed_range_batch_at_every_step():
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=STEPS)
+    y = 0.7 * x + rng.normal(scale=0.5, size=STEPS)
+    options = {"bins": 6, "x_range": (-2.0, 2.0), "y_range": (-2.5, 2.5)}  # Ausreißer → Randbins
+    stream = StreamingMI(WINDOW, **options)
+    values = []
+    for a, b in zip(x, y):
+        stream.push(a, b)
+        values.append(stream.value())
+    np.testing.assert_allclose(
+        values, batch_per_step(mi_batch, x, y, **options), rtol=0, atol=BATCH_ABS_TOLERANCE
+    )
+    assert len(stream._joint) <= WINDOW
+
+
+def test_empty_and_short_windows():
+    assert StreamingPLV(3).value() == 0.0
+    assert StreamingPF(3).value() == 0.0
+    assert StreamingECI(3).value() == 0.0
+    stream = StreamingMI(3, x_range=(0.0, 1.0), y_range=(0.0, 1.0))
+    stream.push(0.2, 0.3)
+    assert stream.value() == 0.0
+
+
+def test_long_session_does_not_drift():
+    stream = StreamingPF(8)
+    for index in range(100_000):
+        stream.push(1e6 if index % 2 else 1e-6)
+    assert abs(stream.value() - np.mean([1e6, 1e-6])) < 1e-9
+
+
+def test_invalid_settings_fail():
+    with pytest.raises(ValueError):
+        StreamingPLV(0)
+    with pytest.raises(ValueError):
+        StreamingMI(10, x_range=(1.0, 1.0), y_range=(0.0, 1.0))
+    with pytest.raises(ValueError):
+        StreamingMI(10, x_range=(0.0, 1.0), y_range=(0.0, 1.0), bins=1)
@@ -0,0 +1,124 @@
+"""Unit-Tests für die MI-Schätzer (src/core/mutual_info.py).
+
+``loop_mi`` ist die frühere Dict-Implementierung aus metrics.mi; der Wrapper
+muss mit ihr innerhalb von BATCH_ABS_TOLERANCE übereinstimmen.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.core.metrics import mi
+from src.core.metrics_batch import BATCH_ABS_TOLERANCE
+from src.core.mutual_info import (
+    KNUTH_MAX_BINS,
+    freedman_diaconis_bins,
+    knuth_bins,
+    ksg_mi,
+    mutual_information,
+    pairwise_mi,
+)
+
+
+def loop_mi(x, y):
+    """Frühere Histogramm-MI aus metrics.mi (sqrt(n) Bins, Python-Dicts)."""
+    n = min(len(x), len(y))
+    if n < 2:
+        return 0.0
+    xs, ys = list(x[:n]), list(y[:n])
+    x_min, x_max, y_min, y_max = min(xs), max(xs), min(ys), max(ys)
+    if x_min == x_max or y_min == y_max:
+        return 0.0
+    bins = max(2, int(math.sqrt(n)))
+
+    def _bin(val, vmin, vmax):
+        return min(int((val - vmin) / (vmax - vmin) * bins), bins - 1)
+
+    joint, x_counts, y_counts = {}, {}, {}
+    for xi, yi in zip(xs, ys):
+        bx, by = _bin(float(xi), x_min, x_max), _bin(float(yi), y_min, y_max)
+        joint[(bx, by)] = joint.get((bx, by), 0) + 1
+        x_counts[bx] = x_counts.get(bx, 0) + 1
+        y_counts[by] = y_counts.get(by, 0) + 1
+    result = sum(
+        c / n * math.log((c / n) / (x_counts[bx] / n * (y_counts[by] / n)))
+        for (bx, by), c in joint.items()
+    )
+    return max(0.0, result)
+
+
+def correlated(n, rho, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=n)
+    return x, rho * x + math.sqrt(1.0 - rho * rho) * rng.normal(size=n)
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 9, 100, 2500])
+def test_mi_wrapper_keeps_previous_results(n):
+    rng = np.random.default_rng(n)
+    cases = [
+        (rng.normal(size=n), rng.normal(size=n)),
+        correlated(n, 0.8, seed=n),
+        (rng.integers(-3, 4, size=n).astype(float), rng.integers(0, 2, size=n).astype(float)),
+        (np.linspace(0.0, 1.0, n), np.full(n, 0.5)),
+    ]
+    for x, y in cases:
+        assert mi(list(x), list(y)) == pytest.approx(
+            loop_mi(list(x), list(y)), abs=BATCH_ABS_TOLERANCE
+        )
+    assert mi([1, 2, 3, 4, 5], [5, 3, 4]) == pytest.approx(loop_mi([1, 2, 3, 4, 5], [5, 3, 4]))
+
+
+@pytest.mark.parametrize("bins", ["sqrt", "fd", "knuth", 7])
+def test_pairwise_matrix_matches_pairs(bins):
+    rng = np.random.default_rng(1)
+    base = rng.normal(size=600)
+    channels = np.stack([base, base + rng.normal(size=600), rng.normal(size=600), np.ones(600)])
+    matrix = pairwise_mi(channels, bins=bins)
+    assert np.all(np.isnan(np.diag(matrix)))
+    for i in range(4):
+        for j in range(4):
+            if i != j:
+                assert matrix[i, j] == matrix[j, i]
+                assert matrix[i, j] == pytest.approx(
+                    mutual_information(channels[i], channels[j], bins=bins),
+                    abs=BATCH_ABS_TOLERANCE,
+                )
+    assert matrix[0, 1] > matrix[0, 2] and matrix[0, 3] == 0.0
+
+
+@pytest.mark.parametrize("rho", [0.0, 0.5, 0.9])
+def test_ksg_recovers_gaussian_mi(rho):
+    x, y = correlated(3000, rho, seed=2)
+    expected = -0.5 * math.log(1.0 - rho * rho)
+    assert ksg_mi(x, y) == pytest.approx(expected, abs=0.03)
+    assert mutual_information(x, y, estimator="ksg", k=5) == pytest.approx(expected, abs=0.03)
+
+
+def test_ksg_pairwise_and_degenerate_inputs():
+    x, y = correlated(500, 0.7, seed=3)
+    matrix = pairwise_mi(np.stack([x, y, np.zeros(500)]), estimator="ksg")
+    assert matrix[0, 1] == pytest.approx(ksg_mi(x, y)) and matrix[0, 2] == 0.0
+    assert ksg_mi([1.0, 2.0, 3.0], [3.0, 1.0, 2.0]) == 0.0  # n <= k
+
+
+def test_bin_rules():
+    data = np.random.default_rng(4).normal(size=5000)
+    assert freedman_diaconis_bins(data) == len(np.histogram_bin_edges(data, bins="fd")) - 1
+    assert freedman_diaconis_bins(np.ones(50)) == 7  # ohne Streuung: sqrt-Regel
+    uniform = np.random.default_rng(5).uniform(size=5000)
+    peaks = np.concatenate([uniform * 0.01, 1.0 + uniform * 0.01])
+    assert knuth_bins(uniform) < knuth_bins(peaks) <= KNUTH_MAX_BINS
+
+
+def test_invalid_settings_fail():
+    x, y = correlated(50, 0.5)
+    with pytest.raises(ValueError):
+        mutual_information(x, y, estimator="kde")
+    with pytest.raises(ValueError):
+        mutual_information(x, y, bins="scott")
+    with pytest.raises(ValueError):
+        mutual_information(x, y, bins=1)
+    with pytest.raises(ValueError):
+        mutual_information(x, y, estimator="ksg", k=0)
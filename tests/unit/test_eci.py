@@ -3,7 +3,16 @@ Unit tests for src/core/eci.py
 Requires: pytest, numpy
 """
 
-from src.core.eci import bootstrap_ci, compute_eci
+import numpy as np
+import pytest
+
+from src.core.eci import (
+    bootstrap_ci,
+    compute_eci,
+    permutation_test,
+    resample_statistics,
+    resample_summary,
+)
 
 
 def test_compute_eci_basic():
@@ -23,3 +32,62 @@ def test_bootstrap_ci():
     data = [0.1 * i for i in range(1, 11)]
     lower, upper = bootstrap_ci(data, n_bootstrap=200, ci=0.8)
     assert 0.0 <= lower <= upper <= 1.0
+
+
+def test_bootstrap_ci_is_reproducible_with_seed():
+    data = [0.1 * i for i in range(1, 11)]
+    first = bootstrap_ci(data, n_bootstrap=500, ci=0.9, seed=7)
+    assert bootstrap_ci(data, n_bootstrap=500, ci=0.9, seed=7) == first
+    assert bootstrap_ci(data, n_bootstrap=500, ci=0.9, seed=8) != first
+    assert bootstrap_ci([], seed=7) == (0.0, 0.0)
+
+
+def test_chunking_and_workers_do_not_change_results():
+    data = np.random.default_rng(0).uniform(size=50)
+    serial = resample_statistics(data, 1000, seed=3, chunk_cells=50 * 64)
+    assert serial.shape == (1000,)
+    parallel = resample_statistics(data, 1000, seed=3, chunk_cells=50 * 64, workers=2)
+    np.testing.assert_array_equal(serial, parallel)
+
+
+def test_bootstrap_means_match_explicit_resamples():
+    data = np.arange(20, dtype=float)
+    means = resample_statistics(data, 4, seed=np.random.SeedSequence(11))
+    (child,) = np.random.SeedSequence(11).spawn(1)
+    index = np.random.default_rng(child).integers(0, 20, size=(4, 20))
+    np.testing.assert_allclose(means, data[index].mean(axis=1))
+
+
+def test_permutation_test_two_sample_split():
+    rng = np.random.default_rng(1)
+    a, b = rng.normal(1.0, 1.0, size=40), rng.normal(0.0, 1.0, size=40)
+    pooled = np.concatenate([a, b]).tolist()
+    shifted = permutation_test(a.mean() - b.mean(), pooled, 2000, split=40, seed=2)
+    same = permutation_test(0.0, pooled, 2000, split=40, seed=2)
+    assert shifted < 0.01 < same
+    # Without split every permutation has the same mean
+    assert permutation_test(np.mean(pooled) + 1.0, pooled, 99, seed=2) == 0.01
+    with pytest.raises(ValueError):
+        permutation_test(0.0, pooled, 10, split=80)
+
+
+def test_resample_summary_reduces_ci_and_p_value_from_one_draw():
+    data = [0.2, 0.4, 0.5, 0.7, 0.9] * 4
+    summary = resample_summary(data, null_mean=0.3, n_resamples=2000, ci=0.9, seed=5)
+    assert summary.ci == bootstrap_ci(data, 2000, 0.9, seed=5)
+    assert summary.null_mean < summary.ci[0] < summary.mean < summary.ci[1]
+    assert summary.p_value < 0.01
+    assert resample_summary(data, null_mean=0.9, seed=5).p_value == 1.0
+
+
+def test_resample_summary_p_value_is_null_centred():
+    # The p-value comes from the values shifted to the H0 mean, not from the
+    # bootstrap distribution of the estimate itself.
+    data = np.random.default_rng(3).normal(0.5, 1.0, size=30)
+    summary = resample_summary(data.tolist(), null_mean=0.2, n_resamples=4000, seed=7)
+    shifted = resample_statistics(data - data.mean() + 0.2, 4000, seed=7)
+    expected = (np.count_nonzero(shifted >= data.mean() - 1e-12) + 1) / 4001
+    assert summary.p_value == pytest.approx(expected, abs=2 / 4001)
+    # Under H0 (null_mean at the sample mean) about half the null-centred means reach it
+    at_mean = resample_summary(data.tolist(), null_mean=float(data.mean()), seed=7)
+    assert 0.4 < at_mean.p_value < 0.6
@@ -6,9 +6,17 @@ from pathlib import Path
 
 import pytest
 
-from src.core.evidence_routing import replay_events
-from src.core.ledger import verify_chain_from_file
-from tools import erk_drill, erk_intake_adapter, erk_verify_emit, erk_void_resonance
+from src.core.batch_replay import replay_streams
+from src.core.evidence_routing import replay_events, replay_jsonl
+from src.core.ledger import Ledger, verify_chain_from_file
+from tools import (
+    erk_batch_replay,
+    erk_drill,
+    erk_intake_adapter,
+    erk_replay_checkpoint,
+    erk_verify_emit,
+    erk_void_resonance,
+)
 from tools.erk_paths import ensure_erk_write_path
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -152,6 +160,66 @@ class TestDrill:
         assert "FEHLT" in capsys.readouterr().out
 
 
+class TestBatchReplayTool:
+    def test_directory_expands_to_sorted_streams(self):
+        streams = erk_batch_replay.collect_streams([str(FIXTURES)])
+        assert streams == sorted(FIXTURES.glob("*.jsonl"))
+
+    def test_rotated_ledger_is_listed_once(self, tmp_path):
+        with Ledger(tmp_path / "events.jsonl", segment_max_events=1) as ledger:
+            ledger.metric("mzm.phi", 1.0)
+        (tmp_path / "other.jsonl").write_text("", encoding="utf-8")
+        # Aktive Datei fehlt nach der Rotation; Segmente laufen über den Ledger-Pfad.
+        assert erk_batch_replay.collect_streams([str(tmp_path)]) == [
+            tmp_path / "events.jsonl",
+            tmp_path / "other.jsonl",
+        ]
+
+    def test_report_written_as_canonical_json(self, tmp_path):
+        report = replay_streams(erk_batch_replay.collect_streams([str(FIXTURES)]), workers=0)
+        target = erk_batch_replay.write_report(report, tmp_path / "batch_report.json")
+        data = json.loads(target.read_text(encoding="utf-8"))
+        assert data["report_digest"] == report.report_digest
+        assert data["totals"]["ok"] == 5
+
+
+class TestReplayCheckpointTool:
+    def _append(self, ledger_path, events):
+        ledger = Ledger(ledger_path)
+        for event in events:
+            ledger.event(
+                event["type"],
+                event["payload"],
+                event_id=event["event_id"],
+                timestamp=event["timestamp"],
+            )
+
+    def test_second_run_resumes_from_written_checkpoint(self, tmp_path):
+        with (FIXTURES / "human_approved_retag.jsonl").open(encoding="utf-8") as handle:
+            events = [json.loads(line) for line in handle if line.strip()]
+        stream = tmp_path / "erk_events.jsonl"
+        checkpoints = tmp_path / "checkpoints"
+        self._append(stream, events[:5])
+
+        first, written = erk_replay_checkpoint.replay_with_checkpoints(stream, checkpoints)
+        assert first.resumed_from is None
+        assert written is not None and written.is_file()
+
+        self._append(stream, events[5:])
+        second, _ = erk_replay_checkpoint.replay_with_checkpoints(stream, checkpoints)
+        assert second.resumed_from is not None
+        assert second.events_applied == 2
+        assert second.state.state_digest == replay_jsonl(stream).state_digest
+        assert len(list(checkpoints.glob("*.json"))) == 2
+
+    def test_unreadable_checkpoint_is_skipped(self, tmp_path, capsys):
+        checkpoints = tmp_path / "checkpoints"
+        checkpoints.mkdir()
+        (checkpoints / "broken.json").write_text("{", encoding="utf-8")
+        assert erk_replay_checkpoint.load_checkpoints(checkpoints) == []
+        assert "übersprungen broken.json" in capsys.readouterr().out
+
+
 class TestWriteBoundary:
     @pytest.mark.parametrize(
         "path",
@@ -2,27 +2,43 @@
 
 import hashlib
 import json
+import os
+import pickle
+import time
+from collections.abc import Mapping
+from dataclasses import fields
 from pathlib import Path
 
 import pytest
 
 from src.core.evidence_routing import (
+    _KNOWN_REASON_CODES,
+    _MODEL_SPECS,
+    _NUM,
+    _STR,
+    _STR_LIST,
     DEFAULT_CLAIM_POLICY_PATH,
+    DIGEST_MODE_MERKLE,
     GUARD_HOLD,
     GUARD_PROPOSE,
     GUARD_STOP,
     ClaimCandidate,
     EvidenceRelation,
     EvidenceRoutingError,
+    GuardDecision,
     HumanDecision,
     MaterialRef,
     ReasonCode,
     Retraction,
     TransitionRequest,
+    _canonical_state,
+    _replay_event,
     apply_approved_transition,
+    compute_collection_digests,
     compute_permitted_transitions,
     compute_state_digest,
     evaluate_transition_request,
+    iter_public_export_ndjson,
     load_claim_policy,
     model_from_payload,
     normalize_claim_tag,
@@ -30,6 +46,7 @@ from src.core.evidence_routing import (
     record_retraction,
     reduce_public_export,
     replay_events,
+    replay_jsonl,
     validate_evidence_relations,
 )
 
@@ -160,6 +177,64 @@ class TestPolicyLoading:
             load_claim_policy(bad)
 
 
+class TestPolicyCache:
+    def test_repeated_loads_share_one_instance(self):
+        assert load_claim_policy() is load_claim_policy()
+        assert load_claim_policy(str(DEFAULT_CLAIM_POLICY_PATH)) is load_claim_policy()
+
+    def test_identical_bytes_at_other_path_share_instance(self, tmp_path):
+        copy_path = tmp_path / "claim_tags_copy.yaml"
+        copy_path.write_bytes(DEFAULT_CLAIM_POLICY_PATH.read_bytes())
+        assert load_claim_policy(copy_path) is load_claim_policy()
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        path = tmp_path / "claim_tags.yaml"
+        raw = DEFAULT_CLAIM_POLICY_PATH.read_bytes()
+        path.write_bytes(raw)
+        first = load_claim_policy(path)
+
+        path.write_bytes(raw + b"\n# drift\n")
+        second = load_claim_policy(path)
+        assert second is not first
+        assert second.digest == hashlib.sha256(path.read_bytes()).hexdigest()
+
+        # Nur mtime geändert, Inhalt gleich: derselbe Digest, dieselbe Instanz.
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_claim_policy(path) is second
+
+    def test_shared_policy_is_read_only(self):
+        policy = load_claim_policy()
+        with pytest.raises(TypeError):
+            policy.tags["[NEW]"] = ()
+        with pytest.raises(TypeError):
+            policy.aliases["[NEU]"] = "[NEW]"
+
+    def test_policy_survives_pickle(self):
+        policy = load_claim_policy()
+        restored = pickle.loads(pickle.dumps(policy))
+        assert restored == policy
+        assert restored.transitions == policy.transitions
+
+    def test_transition_table_matches_allowed_next(self):
+        policy = load_claim_policy()
+        for tag, allowed in policy.tags.items():
+            assert policy.transitions[tag] == frozenset(allowed)
+            for other in policy.tags:
+                assert policy.permits(tag, other) == (other in allowed)
+        assert not policy.permits("[TOTALLY-NEW]", "[MODEL]")
+
+    def test_precomputed_normalization_matches_alias_rules(self):
+        policy = load_claim_policy()
+        for alias, target in policy.aliases.items():
+            result = normalize_claim_tag(f"  {alias} ", policy)
+            assert (result.tag, result.alias_applied) == (target, True)
+            assert result.known == (target in policy.tags)
+        for tag in policy.tags:
+            if tag not in policy.aliases:
+                assert normalize_claim_tag(tag, policy).alias_applied is False
+
+
 class TestNormalization:
     def test_alias_normalization(self):
         policy = load_claim_policy()
@@ -349,6 +424,139 @@ class TestRetraction:
         assert state.rejected_events == []
 
 
+def interpret_model_payload(cls, payload):
+    """Referenzpfad: Feldschema zur Laufzeit interpretieren (frühere model_from_payload).
+
+    Maßstab für die kompilierten Validatoren: gleiche Fehler, gleiche
+    Reihenfolge der Prüfungen.
+    """
+    spec = _MODEL_SPECS.get(cls)
+    if spec is None:
+        raise EvidenceRoutingError(
+            f"unknown model class: {cls!r}", [ReasonCode.EVENT_SCHEMA_INVALID]
+        )
+    if not isinstance(payload, Mapping):
+        raise EvidenceRoutingError(
+            f"{cls.__name__} payload must be a mapping", [ReasonCode.EVENT_SCHEMA_INVALID]
+        )
+
+    unknown = set(payload) - set(spec)
+    if unknown:
+        raise EvidenceRoutingError(
+            f"{cls.__name__} payload has unknown fields: {sorted(unknown)}",
+            [ReasonCode.EVENT_SCHEMA_INVALID],
+        )
+
+    data = {}
+    for name, kind in spec.items():
+        if name not in payload:
+            raise EvidenceRoutingError(
+                f"{cls.__name__} payload missing required field: {name}",
+                [ReasonCode.EVENT_SCHEMA_INVALID],
+            )
+        value = payload[name]
+        if kind == _STR:
+            if not isinstance(value, str):
+                raise EvidenceRoutingError(
+                    f"{cls.__name__}.{name} must be a string",
+                    [ReasonCode.EVENT_SCHEMA_INVALID],
+                )
+        elif kind == _NUM:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise EvidenceRoutingError(
+                    f"{cls.__name__}.{name} must be a number",
+                    [ReasonCode.EVENT_SCHEMA_INVALID],
+                )
+            value = float(value)
+        elif kind == _STR_LIST:
+            if not isinstance(value, (list, tuple)) or not all(
+                isinstance(item, str) for item in value
+            ):
+                raise EvidenceRoutingError(
+                    f"{cls.__name__}.{name} must be a list of strings",
+                    [ReasonCode.EVENT_SCHEMA_INVALID],
+                )
+            value = list(value)
+        data[name] = value
+
+    reason_codes = data.get("reason_codes")
+    if reason_codes is not None:
+        invalid = [code for code in reason_codes if code not in _KNOWN_REASON_CODES]
+        if invalid:
+            raise EvidenceRoutingError(
+                f"{cls.__name__}.reason_codes contains unknown codes: {invalid}",
+                [ReasonCode.EVENT_SCHEMA_INVALID],
+            )
+
+    return cls(**data)
+
+
+def _outcome(parse, cls, payload):
+    try:
+        return ("ok", parse(cls, payload))
+    except EvidenceRoutingError as exc:
+        return ("error", str(exc), exc.reason_codes)
+
+
+class TestCompiledValidators:
+    """Kompilierte Validatoren verhalten sich exakt wie der Referenzpfad."""
+
+    @staticmethod
+    def _variants(payload):
+        yield payload
+        yield "not a mapping"
+        yield {**payload, "unexpected": 1}
+        yield {**payload, "zz_extra": 1, "aa_extra": 2}
+        for name in payload:
+            yield {key: value for key, value in payload.items() if key != name}
+            for wrong in (None, 7, True, 1.5, "x", ["x"], ("x",), [1], {"k": "v"}):
+                yield {**payload, name: wrong}
+        if "reason_codes" in payload:
+            yield {**payload, "reason_codes": ["NOT_A_CODE", ReasonCode.HUMAN_APPROVED.value]}
+            # Späterer Feldfehler hat Vorrang vor unbekannten Reason-Codes:
+            last = list(payload)[-1]
+            yield {**payload, "reason_codes": ["NOT_A_CODE"], last: None}
+
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            "allowed_proposal.jsonl",
+            "human_approved_retag.jsonl",
+            "retraction_non_destructive.jsonl",
+        ],
+    )
+    def test_same_results_and_errors_as_interpreter(self, fixture):
+        models = {
+            "MATERIAL_REGISTERED": MaterialRef,
+            "CLAIM_CREATED": ClaimCandidate,
+            "EVIDENCE_RELATION_RECORDED": EvidenceRelation,
+            "TRANSITION_REQUESTED": TransitionRequest,
+            "GUARD_DECISION_RECORDED": GuardDecision,
+            "HUMAN_DECISION_RECORDED": HumanDecision,
+            "RETRACTION_RECORDED": Retraction,
+        }
+        checked = 0
+        for event in load_fixture(fixture):
+            cls = models.get(event["type"])
+            if cls is None:
+                continue
+            for payload in self._variants(event["payload"]):
+                assert _outcome(model_from_payload, cls, payload) == _outcome(
+                    interpret_model_payload, cls, payload
+                )
+                checked += 1
+        assert checked > 100
+
+    def test_every_spec_has_a_validator(self):
+        for cls in _MODEL_SPECS:
+            with pytest.raises(EvidenceRoutingError, match="must be a mapping"):
+                model_from_payload(cls, [])
+
+    def test_unknown_model_class_fails_closed(self):
+        with pytest.raises(EvidenceRoutingError, match="unknown model class"):
+            model_from_payload(dict, {})
+
+
 class TestStateDigest:
     def test_state_digest_stable_for_identical_stream(self):
         events = load_fixture("human_approved_retag.jsonl")
@@ -362,6 +570,230 @@ class TestStateDigest:
         extended = replay_events(load_fixture("human_approved_retag.jsonl"))
         assert base.state_digest != extended.state_digest
 
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            "allowed_proposal.jsonl",
+            "human_approved_retag.jsonl",
+            "retraction_non_destructive.jsonl",
+            "private_reduced_export.jsonl",
+        ],
+    )
+    def test_compat_digest_is_sha256_of_full_canonical_state(self, fixture):
+        state = replay_events(load_fixture(fixture))
+        serialized = json.dumps(
+            _canonical_state(state), sort_keys=True, separators=(",", ":"), allow_nan=False
+        )
+        assert state.state_digest == hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def test_cached_digest_follows_incremental_replay(self):
+        events = load_fixture("retraction_non_destructive.jsonl")
+        policy = load_claim_policy()
+        state = replay_events([], policy=policy)
+        seen = set()
+        for event in events:
+            seen.add((state.state_digest, state.merkle_digest))  # Cache je Event füllen
+            _replay_event(state, event, policy)
+        fresh = replay_events(events, policy=policy)
+        assert state.state_digest == fresh.state_digest
+        assert state.merkle_digest == fresh.merkle_digest
+        assert compute_collection_digests(state) == compute_collection_digests(fresh)
+        assert len(seen) == len(events)
+
+    def test_merkle_digest_localises_changed_collections(self):
+        events = load_fixture("retraction_non_destructive.jsonl")
+        policy = load_claim_policy()
+        state = replay_events(events[:-1], policy=policy)
+        before = compute_collection_digests(state)
+        merkle_before = compute_state_digest(state, mode=DIGEST_MODE_MERKLE)
+        _replay_event(state, events[-1], policy)  # RETRACTION_RECORDED
+        after = compute_collection_digests(state)
+        assert {name for name in after if after[name] != before[name]} == {
+            "claims",
+            "retractions",
+        }
+        assert state.merkle_digest != merkle_before
+        assert state.merkle_digest != state.state_digest
+
+    def test_compat_digest_sees_in_place_record_changes(self):
+        state = replay_events(load_fixture("human_approved_retag.jsonl"))
+        before = state.state_digest
+        state.claims["clm-001"]["current_tag"] = "[FAKT]"
+        serialized = json.dumps(
+            _canonical_state(state), sort_keys=True, separators=(",", ":"), allow_nan=False
+        )
+        assert state.state_digest == hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        assert state.state_digest != before
+
+    def test_merkle_cache_is_invalidated_explicitly_after_in_place_changes(self):
+        state = replay_events(load_fixture("human_approved_retag.jsonl"))
+        before = state.merkle_digest
+        state.claims["clm-001"]["current_tag"] = "[FAKT]"
+        assert state.merkle_digest == before  # ungemeldete Änderung: Cache bleibt
+        state.invalidate_digests()
+        fresh = replay_events(load_fixture("human_approved_retag.jsonl"))
+        fresh.claims["clm-001"]["current_tag"] = "[FAKT]"
+        assert state.merkle_digest == fresh.merkle_digest != before
+
+    @staticmethod
+    def _scaled_state(count):
+        state = replay_events(load_fixture("human_approved_retag.jsonl"))
+        template = state.claims["clm-001"]
+        for index in range(count):
+            claim_id = f"clm-x{index:07d}"
+            state.claims[claim_id] = dict(template, claim_id=claim_id)
+        state.invalidate_digests()
+        return state
+
+    def test_merged_dirty_records_match_a_fresh_digest(self):
+        state = self._scaled_state(1000)
+        before = state.merkle_digest  # Cache füllen
+        for index in range(0, 1000, 97):
+            claim_id = f"clm-x{index:07d}"
+            state.claims[claim_id]["current_tag"] = "[FAKT]"
+            state._digest.touch("claims", claim_id)
+        merged = state.merkle_digest
+        state.invalidate_digests()
+        assert state.merkle_digest == merged != before
+
+    def test_first_merkle_read_scales_like_compat(self):
+        # Kalter Cache: einmal sortieren statt je Record einfügen (vorher O(n²)).
+        state = self._scaled_state(100_000)
+        start = time.perf_counter()
+        compute_state_digest(state)
+        compat_s = time.perf_counter() - start
+        start = time.perf_counter()
+        compute_state_digest(state, mode=DIGEST_MODE_MERKLE)
+        merkle_s = time.perf_counter() - start
+        assert merkle_s < 3.0 * compat_s + 0.1
+
+    def test_unknown_digest_mode_raises(self):
+        with pytest.raises(ValueError):
+            compute_state_digest(replay_events([]), mode="sha1")
+
+
+class TestStreamingReplay:
+    def test_path_replay_matches_materialised_replay(self):
+        path = FIXTURES / "human_approved_retag.jsonl"
+        streamed = replay_jsonl(path)
+        assert streamed == replay_events(load_fixture("human_approved_retag.jsonl"))
+        assert replay_jsonl(str(path)).state_digest == streamed.state_digest
+
+    def test_iterable_of_lines_is_consumed_lazily(self):
+        lines = (FIXTURES / "retraction_non_destructive.jsonl").read_text(encoding="utf-8")
+        consumed = []
+
+        def line_source():
+            for line in ["", *lines.splitlines(), "   "]:
+                consumed.append(line)
+                yield line
+
+        state = replay_jsonl(line_source())
+        assert state == replay_events(load_fixture("retraction_non_destructive.jsonl"))
+        assert len(consumed) == len(lines.splitlines()) + 2
+
+    def test_unparsable_line_is_quarantined_not_skipped(self, tmp_path):
+        path = tmp_path / "stream.jsonl"
+        fixture_text = (FIXTURES / "allowed_proposal.jsonl").read_text(encoding="utf-8")
+        path.write_bytes(fixture_text.encode("utf-8") + b'{"truncated":\n\xff\xfe\n')
+        state = replay_jsonl(path)
+        assert len(state.requests) == 1
+        assert [entry["note"] for entry in state.rejected_events] == [
+            "event line 6 is not valid JSON",
+            "event line 7 is not valid JSON",
+        ]
+        assert all(
+            entry["reason_codes"] == [ReasonCode.EVENT_SCHEMA_INVALID.value]
+            for entry in state.rejected_events
+        )
+
+
+class TestGuardViews:
+    """Inkrementell gepflegte Modellsichten bleiben synchron zu den Records."""
+
+    @staticmethod
+    def _from_record(cls, record):
+        return model_from_payload(cls, {f.name: record[f.name] for f in fields(cls)})
+
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            "allowed_proposal.jsonl",
+            "human_approved_retag.jsonl",
+            "metaphor_no_promotion.jsonl",
+            "retraction_non_destructive.jsonl",
+            "private_reduced_export.jsonl",
+        ],
+    )
+    def test_views_match_rebuilt_records(self, fixture):
+        state = replay_events(load_fixture(fixture))
+        views = state._views
+        assert views.claims == {
+            claim_id: self._from_record(ClaimCandidate, record)
+            for claim_id, record in state.claims.items()
+        }
+        assert views.materials == {
+            material_id: self._from_record(MaterialRef, record)
+            for material_id, record in state.materials.items()
+        }
+        assert views.relations == {
+            relation_id: self._from_record(EvidenceRelation, record)
+            for relation_id, record in state.relations.items()
+        }
+        assert views.current_tags == {
+            claim_id: record["current_tag"] for claim_id, record in state.claims.items()
+        }
+        assert views.claim_statuses == {
+            claim_id: record["status"] for claim_id, record in state.claims.items()
+        }
+
+    def test_views_do_not_enter_digest_or_equality(self):
+        first = replay_events(load_fixture("human_approved_retag.jsonl"))
+        second = replay_events(load_fixture("human_approved_retag.jsonl"))
+        digest = first.state_digest
+        first._views.current_tags.clear()
+        assert first.state_digest == digest
+        assert first == second
+
+
+class TestReplayIndexes:
+    """Rückwärtsindizes liefern dasselbe wie ein vollständiger Scan."""
+
+    LOOKUPS = [
+        ("human_decisions_for_request", "human_decisions", "request_id", "requests"),
+        ("guard_decisions_for_request", "guard_decisions", "request_id", "requests"),
+        ("relations_for_claim", "relations", "claim_id", "claims"),
+        ("requests_for_claim", "requests", "claim_id", "claims"),
+        ("retractions_for_claim", "retractions", "claim_id", "claims"),
+    ]
+
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            "human_approved_retag.jsonl",
+            "retraction_non_destructive.jsonl",
+            "private_reduced_export.jsonl",
+        ],
+    )
+    def test_index_lookups_match_full_scan(self, fixture):
+        state = replay_events(load_fixture(fixture))
+        for method, collection, key, owners in self.LOOKUPS:
+            for owner_id in [*getattr(state, owners), "unknown-id"]:
+                expected = [
+                    record
+                    for record in getattr(state, collection).values()
+                    if record.get(key) == owner_id
+                ]
+                assert getattr(state, method)(owner_id) == expected, (method, owner_id)
+
+    def test_indexes_do_not_enter_digest_or_equality(self):
+        first = replay_events(load_fixture("retraction_non_destructive.jsonl"))
+        second = replay_events(load_fixture("retraction_non_destructive.jsonl"))
+        digest = first.state_digest
+        first._index.human_by_request.clear()
+        assert first.state_digest == digest
+        assert first == second
+
 
 class TestReducedExport:
     def test_export_contains_only_allowlisted_fields(self):
@@ -453,6 +885,41 @@ class TestReducedExport:
         assert first["retractions"][0]["claim_ref"] == first["claims"][0]["claim_ref"]
 
 
+class TestStreamedExport:
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            "allowed_proposal.jsonl",
+            "human_approved_retag.jsonl",
+            "retraction_non_destructive.jsonl",
+            "private_reduced_export.jsonl",
+        ],
+    )
+    def test_ndjson_sections_and_digest_match_reduced_export(self, fixture):
+        state = replay_events(load_fixture(fixture))
+        export = reduce_public_export(state).to_dict()
+        lines = [json.loads(line) for line in iter_public_export_ndjson(state)]
+
+        header, *entries, trailer = lines
+        assert header == {
+            "section": "header",
+            "export_schema_version": export["export_schema_version"],
+            "policy_version": export["policy_version"],
+            "policy_digest": export["policy_digest"],
+        }
+        assert trailer == {"section": "digest", "export_digest": export["export_digest"]}
+        for section in ("claims", "materials", "guard_decisions", "retractions"):
+            assert [line["entry"] for line in entries if line["section"] == section] == (
+                export[section]
+            )
+
+    def test_every_streamed_line_is_newline_terminated_json(self):
+        state = replay_events(load_fixture("retraction_non_destructive.jsonl"))
+        for line in iter_public_export_ndjson(state):
+            assert line.endswith("\n") and "\n" not in line[:-1]
+            json.loads(line)
+
+
 class TestReferentialIntegrity:
     """Korrekturdelta: Evidence-Claim-Bindung und exakte Guard-/Human-Referenzen."""
 
@@ -0,0 +1,143 @@
+"""Unit-Tests für den inkrementellen Public Export (src/core/incremental_export.py)."""
+
+import copy
+import json
+from pathlib import Path
+
+from src.core.evidence_routing import (
+    _replay_event,
+    load_claim_policy,
+    reduce_public_export,
+    replay_events,
+)
+from src.core.incremental_export import (
+    EXPORT_UPDATE_FULL,
+    EXPORT_UPDATE_INCREMENTAL,
+    EXPORT_UPDATE_UNCHANGED,
+    IncrementalPublicExporter,
+)
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "erk"
+
+
+def load_fixture(name):
+    with open(FIXTURES / name, encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def apply(state, events):
+    policy = load_claim_policy()
+    for event in events:
+        _replay_event(state, event, policy)
+
+
+def claim_event(claim_id):
+    """CLAIM_CREATED aus der Fixture mit anderer claim_id."""
+    event = copy.deepcopy(load_fixture("allowed_proposal.jsonl")[1])
+    event["payload"]["claim_id"] = claim_id
+    event["event_id"] = f"evt-{claim_id}"
+    return event
+
+
+class TestIncrementalExport:
+    def test_first_export_is_full_then_unchanged(self):
+        state = replay_events(load_fixture("human_approved_retag.jsonl"))
+        exporter = IncrementalPublicExporter()
+
+        first = exporter.update(state)
+        assert first.mode == EXPORT_UPDATE_FULL
+        assert first.reason == "no previous export"
+        assert first.export == reduce_public_export(state)
+
+        second = exporter.update(state)
+        assert second.mode == EXPORT_UPDATE_UNCHANGED
+        assert second.reprojected == 0
+        assert second.export == first.export
+
+    def test_appended_events_reproject_only_touched_records(self):
+        events = load_fixture("retraction_non_destructive.jsonl")
+        state = replay_events(events[:5])
+        exporter = IncrementalPublicExporter()
+        exporter.update(state)
+
+        apply(state, events[5:])  # HUMAN_DECISION, CLAIM_RETAGGED, RETRACTION_RECORDED
+        update = exporter.update(state)
+        assert update.mode == EXPORT_UPDATE_INCREMENTAL
+        assert update.reason is None
+        # Nur der retaggte/zurückgezogene Claim und die neue Retraction:
+        assert update.reprojected == 2
+        expected = reduce_public_export(state)
+        assert update.export == expected
+        assert update.export.export_digest == expected.export_digest
+
+    def test_new_id_sorting_last_keeps_numbering(self):
+        state = replay_events(load_fixture("human_approved_retag.jsonl"))
+        exporter = IncrementalPublicExporter()
+        exporter.update(state)
+
+        apply(state, [claim_event("clm-002")])
+        update = exporter.update(state)
+        assert update.mode == EXPORT_UPDATE_INCREMENTAL
+        assert [entry["claim_ref"] for entry in update.export.claims] == [
+            "claim:c001",
+            "claim:c002",
+        ]
+        assert update.export == reduce_public_export(state)
+
+    def test_ref_shift_falls_back_to_full_rebuild(self):
+        state = replay_events(load_fixture("human_approved_retag.jsonl"))
+        exporter = IncrementalPublicExporter()
+        exporter.update(state)
+
+        apply(state, [claim_event("clm-000")])
+        update = exporter.update(state)
+        assert update.mode == EXPORT_UPDATE_FULL
+        assert update.reason == "ref numbering shift in claims"
+        assert update.export == reduce_public_export(state)
+
+    def test_private_records_do_not_trigger_reprojection(self):
+        state = replay_events(load_fixture("human_approved_retag.jsonl"))
+        exporter = IncrementalPublicExporter()
+        exporter.update(state)
+
+        private = claim_event("clm-000")
+        private["payload"]["visibility"] = "private"
+        apply(state, [private])
+        update = exporter.update(state)
+        assert update.mode == EXPORT_UPDATE_INCREMENTAL
+        assert update.reprojected == 0
+        assert update.export == reduce_public_export(state)
+
+    def test_other_state_forces_full_rebuild(self):
+        exporter = IncrementalPublicExporter()
+        exporter.update(replay_events(load_fixture("human_approved_retag.jsonl")))
+        other = replay_events(load_fixture("metaphor_no_promotion.jsonl"))
+        update = exporter.update(other)
+        assert update.mode == EXPORT_UPDATE_FULL
+        assert update.reason == "different replay state"
+        assert update.export == reduce_public_export(other)
+
+    def test_journal_is_only_kept_while_an_exporter_consumes_it(self):
+        events = load_fixture("retraction_non_destructive.jsonl")
+        state = replay_events(events[:5])
+        assert state._changes is None  # ohne Exporter wächst nichts mit dem Stream
+        exporter = IncrementalPublicExporter()
+        exporter.update(state)
+        apply(state, events[5:])
+        assert state._changes
+        update = exporter.update(state)
+        assert update.mode == EXPORT_UPDATE_INCREMENTAL
+        assert state._changes == []
+        assert update.export == reduce_public_export(state)
+
+    def test_second_exporter_takes_over_the_journal(self):
+        state = replay_events(load_fixture("allowed_proposal.jsonl"))
+        first, second = IncrementalPublicExporter(), IncrementalPublicExporter()
+        first.update(state)
+        second.update(state)
+        apply(state, [claim_event("clm-900")])
+        assert second.update(state).mode == EXPORT_UPDATE_INCREMENTAL
+        update = first.update(state)
+        assert update.mode == EXPORT_UPDATE_FULL
+        assert update.reason == "change journal taken over"
+        assert update.export == reduce_public_export(state)
@@ -0,0 +1,158 @@
+"""Unit-Tests für den asynchronen Ledger-Writer (src/core/ledger_async.py)."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.core.ledger import DURABILITY_GROUP, Ledger, load_ledger, verify_chain_from_file
+from src.core.ledger_async import AsyncLedger
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestAsyncLedger:
+    def test_events_are_chained_in_call_order_and_written(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+
+        async def produce():
+            async with AsyncLedger(path, batch_size=8) as ledger:
+                for index in range(100):
+                    ledger.metric("m", float(index))
+                await ledger.flush()
+                assert ledger.pending == 0
+                return [event["hash"] for event in ledger.get_events()]
+
+        hashes = run(produce())
+        stored = load_ledger(path)
+        assert [event["hash"] for event in stored] == hashes
+        assert [event["payload"]["value"] for event in stored] == [float(i) for i in range(100)]
+        assert verify_chain_from_file(path) is True
+
+    def test_file_matches_synchronous_ledger(self, tmp_path):
+        sync = Ledger(tmp_path / "sync.jsonl")
+        for index in range(20):
+            sync.event("ROW", {"n": index}, event_id=f"e{index}", timestamp=1.0)
+        sync.close()
+
+        async def produce():
+            async with AsyncLedger(tmp_path / "async.jsonl", durability=DURABILITY_GROUP) as ledger:
+                for index in range(20):
+                    ledger.event("ROW", {"n": index}, event_id=f"e{index}", timestamp=1.0)
+
+        run(produce())
+        assert (tmp_path / "async.jsonl").read_bytes() == (tmp_path / "sync.jsonl").read_bytes()
+
+    def test_spans_follow_each_task(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+
+        async def worker(ledger, name):
+            with ledger.span(name) as span_id:
+                for _ in range(5):
+                    ledger.metric(name, 1.0)
+                    await asyncio.sleep(0)
+            return span_id
+
+        async def produce():
+            async with AsyncLedger(path) as ledger:
+                return await asyncio.gather(*(worker(ledger, f"task{i}") for i in range(3)))
+
+        span_ids = run(produce())
+        metrics = [event for event in load_ledger(path) if event["type"] == "metric"]
+        for name, span_id in zip(("task0", "task1", "task2"), span_ids):
+            assert {e["span_id"] for e in metrics if e["payload"]["metric_id"] == name} == {span_id}
+        assert verify_chain_from_file(path) is True
+
+    def test_full_queue_blocks_producer_thread(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = AsyncLedger(path, max_pending=2, batch_size=1)
+        inner = ledger._ledger
+        inner._io_lock.acquire()  # Writer hängt: die Queue läuft voll
+        produced = []
+
+        def producer():
+            for index in range(6):
+                ledger.metric("m", float(index))
+                produced.append(index)
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        thread.join(timeout=0.3)
+        assert thread.is_alive() and len(produced) < 6
+        inner._io_lock.release()
+        thread.join(timeout=5)
+        run(ledger.close())
+        assert produced == list(range(6))
+        assert len(load_ledger(path)) == 6
+
+    def test_drain_lets_other_tasks_run_while_queue_is_full(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0.005)
+
+        async def producer(ledger, produced):
+            for index in range(6):
+                ledger.metric("m", float(index))  # blockiert die Schleife nie
+                produced.append(index)
+                await ledger.drain()
+
+        async def produce():
+            ledger = AsyncLedger(path, max_pending=2, batch_size=1)
+            ledger._ledger._io_lock.acquire()  # Writer hängt: die Queue läuft voll
+            produced = []
+            ticking = asyncio.create_task(ticker())
+            producing = asyncio.create_task(producer(ledger, produced))
+            await asyncio.sleep(0.2)
+            assert not producing.done() and len(produced) < 6
+            stalled_ticks = len(ticks)
+            assert stalled_ticks > 5
+            # Auch ein Burst ohne drain() blockiert die Schleife nicht:
+            ledger.gate("burst", passed=True)
+            ledger.gate("burst", passed=True)
+            ledger._ledger._io_lock.release()
+            await asyncio.wait_for(producing, timeout=5)
+            ticking.cancel()
+            await ledger.close()
+            return produced
+
+        assert run(produce()) == list(range(6))
+        assert len(load_ledger(path)) == 8
+        assert verify_chain_from_file(path) is True
+
+    def test_write_error_fails_closed(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = AsyncLedger(path)
+        ledger.metric("m", 1.0)
+        run(ledger.flush())
+        ledger._ledger._release_file()
+        path.unlink()
+        path.mkdir()  # Öffnen zum Anhängen schlägt fehl
+        ledger.metric("m", 2.0)
+        with pytest.raises(RuntimeError, match="writer failed"):
+            run(ledger.flush())
+        with pytest.raises(RuntimeError):
+            ledger.metric("m", 3.0)
+
+    def test_checkpoint_and_memory_only_ledger(self):
+        async def produce():
+            ledger = AsyncLedger(retention="checkpoint")
+            ledger.gate("g", passed=True)
+            head = await ledger.checkpoint()
+            assert ledger.get_events() == [] and ledger.anchor_hash == head
+            ledger.gate("g", passed=False)
+            assert ledger.verify_chain() is True
+            await ledger.close()
+
+        run(produce())
+
+    def test_invalid_settings_fail(self, tmp_path):
+        with pytest.raises(ValueError):
+            AsyncLedger(tmp_path / "events.jsonl", max_pending=0)
+        with pytest.raises(ValueError):
+            AsyncLedger(tmp_path / "events.jsonl", batch_size=0)
@@ -1,6 +1,13 @@
 import json
 
-from src.core.ledger import Ledger, verify_chain_from_file
+import pytest
+
+from src.core.ledger import (
+    Ledger,
+    verification_watermark_from_dict,
+    verify_chain_from_file,
+    verify_ledger,
+)
 
 
 def _write_single_event(tmp_path):
@@ -56,3 +63,94 @@ def test_non_object_json_record_is_rejected(tmp_path):
     path.write_text("[]\n", encoding="utf-8")
 
     assert verify_chain_from_file(path) is False
+
+
+def _append_metrics(path, count, start=0, **options):
+    with Ledger(path, **options) as ledger:
+        for index in range(start, start + count):
+            ledger.metric("mzm.phi", float(index))
+
+
+def test_watermark_resumes_with_appended_tail_only(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _append_metrics(path, 5)
+    first = verify_ledger(path)
+    assert first.ok and not first.resumed and first.events_verified == 5
+
+    _append_metrics(path, 3, start=5)
+    second = verify_ledger(path, first.watermark)
+    assert second.ok and second.resumed
+    assert second.events_verified == 3
+    assert second.watermark.events == 8
+    assert second.watermark.offset == path.stat().st_size
+
+
+def test_watermark_does_not_hide_broken_tail(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _append_metrics(path, 3)
+    watermark = verify_ledger(path).watermark
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"truncated":\n')
+
+    assert verify_ledger(path, watermark).ok is False
+
+
+def test_rewritten_prefix_invalidates_watermark(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _append_metrics(path, 3)
+    watermark = verify_ledger(path).watermark
+    path.unlink()
+    _append_metrics(path, 4, start=10)
+
+    result = verify_ledger(path, watermark)
+    assert result.ok and not result.resumed
+    assert result.events_verified == 4
+
+
+def test_watermark_survives_rotation(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _append_metrics(path, 3, segment_max_events=4)
+    watermark = verify_ledger(path).watermark
+    _append_metrics(path, 3, start=3, segment_max_events=4)
+
+    result = verify_ledger(path, watermark)
+    assert result.ok and result.resumed
+    assert result.watermark.sealed_segments == 1
+    assert result.events_verified == 2
+
+
+def test_watermark_roundtrip_and_keyed_tag(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _append_metrics(path, 2)
+    watermark = verify_ledger(path, key=b"audit-key").watermark
+    data = json.loads(json.dumps(watermark.to_dict()))
+    assert verification_watermark_from_dict(data, key=b"audit-key") == watermark
+    with pytest.raises(ValueError):
+        verification_watermark_from_dict(data)
+    data["offset"] = 0
+    with pytest.raises(ValueError):
+        verification_watermark_from_dict(data, key=b"audit-key")
+
+
+def test_forged_watermark_is_ignored(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _append_metrics(path, 3)
+    watermark = verify_ledger(path, key=b"audit-key").watermark
+
+    result = verify_ledger(path, watermark, key=b"other-key")
+    assert result.ok and not result.resumed
+    assert result.events_verified == 3
+
+
+def test_parallel_chunks_match_sequential_verdict(tmp_path):
+    path = tmp_path / "events.jsonl"
+    _append_metrics(path, 40)
+    parallel = verify_ledger(path, workers=2, chunk_bytes=512)
+    assert parallel.ok
+    assert parallel.watermark == verify_ledger(path).watermark
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    del lines[20]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    assert verify_ledger(path, workers=2, chunk_bytes=512).ok is False
+    assert verify_chain_from_file(path, workers=2) is False
@@ -0,0 +1,104 @@
+"""Unit-Tests für den Byte-Offset-Index (src/core/ledger_index.py)."""
+
+import json
+
+from src.core.ledger import Ledger, load_ledger
+from src.core.ledger_index import LedgerIndex, index_path, query_ledger
+
+
+def write_spans(path, **options):
+    with Ledger(path, index=True, **options) as ledger:
+        ledger.metric("mzm.phi", 0.5)
+        with ledger.span("stability.map_taxonomy_to_gate") as outer:
+            ledger.gate("stability_taxonomy_v1", passed=False, reason="BLOCK_NEED_CONSENT")
+            with ledger.span("stability.inner"):
+                ledger.metric("inner", 1.0)
+        with ledger.span("stability.map_taxonomy_to_gate"):
+            ledger.gate("stability_taxonomy_v1", passed=True)
+        ledger.event("CLAIM_CREATED", {"claim_id": "clm-1"}, event_id="evt-fixed")
+    return outer
+
+
+class TestLedgerIndex:
+    def test_ledger_writes_index_entries_on_append(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_spans(path)
+        entries = [json.loads(line) for line in index_path(path).read_text().splitlines()]
+        raw = path.read_bytes()
+        assert len(entries) == len(load_ledger(path))
+        for entry in entries:
+            line = raw[entry["o"] : entry["o"] + entry["l"]]
+            assert json.loads(line)["event_id"] == entry["e"]
+
+    def test_lookup_by_event_id_type_and_span(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        outer = write_spans(path)
+        index = LedgerIndex(path)
+        assert [e["payload"] for e in index.iter_events(event_id="evt-fixed")] == [
+            {"claim_id": "clm-1"}
+        ]
+        assert len(list(index.iter_events(event_type="gate"))) == 2
+        in_outer = [e["type"] for e in index.iter_events(span_id=outer)]
+        assert in_outer == ["span_start", "gate", "span_start", "span_end", "span_end"]
+        assert [e["type"] for e in index.iter_events(span_id=outer, event_type="gate")] == ["gate"]
+        assert list(index.iter_events(event_id="missing")) == []
+
+    def test_foreign_appends_are_indexed_on_open(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_spans(path)
+        with Ledger(path) as plain:
+            plain.event("CLAIM_CREATED", {"claim_id": "clm-2"}, event_id="evt-late")
+        index = LedgerIndex(path)
+        assert len(index) == len(load_ledger(path))
+        assert [e["event_id"] for e in index.iter_events(event_id="evt-late")] == ["evt-late"]
+
+    def test_stale_index_is_rebuilt(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_spans(path)
+        path.unlink()
+        with Ledger(path) as ledger:
+            ledger.event("CLAIM_CREATED", {"claim_id": "clm-3"}, event_id="evt-new")
+        index = LedgerIndex(path)
+        assert len(index) == 1
+        assert list(index.iter_events(event_id="evt-fixed")) == []
+
+    def test_in_memory_index_leaves_no_sidecar(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        with Ledger(path) as ledger:
+            ledger.metric("a", 1.0)
+        assert len(LedgerIndex(path, persist=False)) == 1
+        assert not index_path(path).exists()
+
+
+class TestQueryLedger:
+    def test_span_name_selects_all_spans_with_that_name(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_spans(path)
+        events = list(query_ledger(path, span_name="stability.map_taxonomy_to_gate"))
+        assert [e["type"] for e in events].count("span_start") == 3
+        gates = query_ledger(path, span_name="stability.map_taxonomy_to_gate", event_type="gate")
+        assert [e["payload"]["passed"] for e in gates] == [False, True]
+
+    def test_query_spans_sealed_segments(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_spans(path, segment_max_events=3)
+        assert (tmp_path / "events.000001.jsonl.idx").exists()
+        everything = list(query_ledger(path))
+        assert everything == load_ledger(path)
+        assert [e["event_id"] for e in query_ledger(path, event_id="evt-fixed")] == ["evt-fixed"]
+
+    def test_query_is_lazy(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_spans(path)
+        iterator = query_ledger(path, event_type="gate")
+        assert next(iterator)["type"] == "gate"
+        iterator.close()
+
+
+class TestGetEvents:
+    def test_get_events_filters_before_converting(self):
+        ledger = Ledger()
+        ledger.metric("a", 1.0)
+        ledger.gate("g", passed=True)
+        assert [e["type"] for e in ledger.get_events("gate")] == ["gate"]
+        assert len(ledger.get_events()) == 2
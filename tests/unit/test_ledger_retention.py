@@ -0,0 +1,96 @@
+"""Unit-Tests für die In-Memory-Retention des Ledgers (src/core/ledger.py)."""
+
+import tracemalloc
+
+import pytest
+
+from src.core.ledger import (
+    RETAIN_LAST,
+    RETAIN_NONE,
+    RETAIN_SINCE_CHECKPOINT,
+    Ledger,
+    load_ledger,
+    verify_chain_from_file,
+)
+
+
+class TestRetention:
+    def test_default_keeps_everything(self):
+        ledger = Ledger()
+        for index in range(5):
+            ledger.metric("m", float(index))
+        assert len(ledger.get_events()) == 5
+        assert ledger.anchor_hash is None
+        assert ledger.verify_chain() is True
+
+    def test_ring_buffer_keeps_last_n_and_anchors_window(self):
+        ledger = Ledger(retention=RETAIN_LAST, retain_last=3)
+        emitted = []
+        for index in range(10):
+            ledger.metric("m", float(index))
+            emitted.append(ledger._prev_hash)
+        retained = ledger.get_events()
+        assert [event["payload"]["value"] for event in retained] == [7.0, 8.0, 9.0]
+        assert ledger.anchor_hash == emitted[6]
+        assert ledger.verify_chain() is True
+        assert ledger.verify_window(emitted[6]) is True
+        assert ledger.verify_window(emitted[5]) is False
+
+    def test_keep_none_still_chains_file(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        with Ledger(path, retention=RETAIN_NONE) as ledger:
+            for index in range(4):
+                ledger.metric("m", float(index))
+            assert ledger.get_events() == []
+            assert ledger.anchor_hash == load_ledger(path)[-1]["hash"]
+            assert ledger.verify_chain() is True
+        assert verify_chain_from_file(path) is True
+
+    def test_checkpoint_releases_retained_events(self):
+        ledger = Ledger(retention=RETAIN_SINCE_CHECKPOINT)
+        ledger.metric("a", 1.0)
+        ledger.metric("b", 2.0)
+        head = ledger.checkpoint()
+        assert ledger.get_events() == []
+        ledger.metric("c", 3.0)
+        assert [event["prev_hash"] for event in ledger.get_events()] == [head]
+        assert ledger.anchor_hash == head
+        assert ledger.verify_chain() is True
+
+    def test_tampered_window_fails(self):
+        ledger = Ledger(retention=RETAIN_LAST, retain_last=2)
+        for index in range(4):
+            ledger.metric("m", float(index))
+        ledger._events[-1].payload["value"] = 99.0
+        assert ledger.verify_chain() is False
+
+    def test_reopened_ledger_anchors_at_file_tail(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        with Ledger(path) as first:
+            first.metric("a", 1.0)
+        with Ledger(path) as second:
+            assert second.anchor_hash == first._prev_hash
+            second.metric("b", 2.0)
+            assert second.verify_chain() is True
+
+    def test_ring_buffer_memory_stays_flat(self):
+        ledger = Ledger(retention=RETAIN_LAST, retain_last=100)
+        for index in range(1000):
+            ledger.metric("m", float(index))
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            for index in range(20000):
+                ledger.metric("m", float(index))
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert after - before < 200_000
+
+    def test_invalid_settings_fail(self):
+        with pytest.raises(ValueError):
+            Ledger(retention="forever")
+        with pytest.raises(ValueError):
+            Ledger(retention=RETAIN_LAST)
+        with pytest.raises(ValueError):
+            Ledger(retain_last=3)
@@ -0,0 +1,539 @@
+"""Unit-Tests für den Ledger-Writer (src/core/ledger.py): Handle, Durability, Tail, Segmente,
+Batches, geteilte Appends."""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+from src.core.ledger import (
+    DURABILITY_FSYNC,
+    DURABILITY_GROUP,
+    DURABILITY_OS,
+    Ledger,
+    create_ledger_from_env,
+    load_ledger,
+    load_segment_manifest,
+    read_ledger_tail,
+    segment_manifest_path,
+    verify_chain_from_file,
+)
+from src.core.ledger_index import LedgerIndex
+
+
+def line_count(path):
+    if not path.exists():
+        return 0
+    return len([line for line in path.read_text(encoding="utf-8").splitlines() if line])
+
+
+class TestDurability:
+    @pytest.mark.parametrize("mode", [DURABILITY_OS, DURABILITY_FSYNC])
+    def test_eager_modes_make_each_event_visible(self, tmp_path, mode):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(path, durability=mode)
+        for index in range(3):
+            ledger.metric("mzm.phi", 0.1 * index)
+            assert line_count(path) == index + 1
+        ledger.close()
+        assert verify_chain_from_file(path) is True
+
+    def test_group_commit_after_n_events(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(path, durability=DURABILITY_GROUP, commit_every=3, commit_interval_ms=1e9)
+        ledger.metric("a", 1.0)
+        ledger.metric("b", 2.0)
+        assert line_count(path) == 0
+        ledger.metric("c", 3.0)
+        assert line_count(path) == 3
+        ledger.metric("d", 4.0)
+        assert line_count(path) == 3
+        ledger.close()
+        assert line_count(path) == 4
+        assert verify_chain_from_file(path) is True
+
+    def test_group_commit_after_interval(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(path, durability=DURABILITY_GROUP, commit_every=1000, commit_interval_ms=0)
+        ledger.metric("a", 1.0)
+        assert line_count(path) == 1
+        ledger.close()
+
+    def test_idle_group_is_committed_by_the_timer(self, tmp_path, monkeypatch):
+        # Kein weiteres Event nach dem ersten: der Timer muss den Commit auslösen.
+        path = tmp_path / "events.jsonl"
+        synced = threading.Event()
+        fsync = os.fsync
+
+        def counting_fsync(fd):
+            fsync(fd)
+            synced.set()
+
+        monkeypatch.setattr("src.core.ledger.os.fsync", counting_fsync)
+        ledger = Ledger(path, durability=DURABILITY_GROUP, commit_every=1000, commit_interval_ms=20)
+        ledger.metric("a", 1.0)
+        assert synced.wait(timeout=5.0)
+        assert line_count(path) == 1
+        assert ledger._pending == 0
+        ledger.close()
+
+    def test_commit_cancels_the_timer(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(
+            path, durability=DURABILITY_GROUP, commit_every=1000, commit_interval_ms=1e9
+        )
+        ledger.metric("a", 1.0)
+        timer = ledger._commit_timer
+        assert timer is not None and timer.is_alive()
+        ledger.close()
+        timer.join(timeout=5.0)
+        assert not timer.is_alive()
+        assert ledger._commit_timer is None
+
+    def test_context_manager_flushes_pending_events(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        with Ledger(path, durability=DURABILITY_GROUP, commit_every=100) as ledger:
+            ledger.gate("mzm_gate_v1", passed=True, reason="PASS_ALL_CONSTRAINTS")
+            ledger.metric("mzm.phi", 0.85)
+        assert [event["type"] for event in load_ledger(path)] == ["gate", "metric"]
+
+    def test_flush_without_close_exposes_pending_events(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(path, durability=DURABILITY_GROUP, commit_every=100)
+        ledger.metric("a", 1.0)
+        ledger.flush()
+        assert line_count(path) == 1
+        ledger.close()
+
+    def test_closed_ledger_reopens_and_continues_chain(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(path)
+        ledger.metric("a", 1.0)
+        ledger.close()
+        ledger.metric("b", 2.0)
+        ledger.close()
+        assert line_count(path) == 2
+        assert verify_chain_from_file(path) is True
+
+    def test_no_file_is_created_before_first_event(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        Ledger(path).close()
+        assert not path.exists()
+
+    def test_invalid_settings_fail(self, tmp_path):
+        with pytest.raises(ValueError):
+            Ledger(tmp_path / "events.jsonl", durability="eventually")
+        with pytest.raises(ValueError):
+            Ledger(tmp_path / "events.jsonl", commit_every=0)
+
+
+def write_metrics(path, count, **options):
+    with Ledger(path, **options) as ledger:
+        for index in range(count):
+            ledger.metric("mzm.phi", float(index))
+    return ledger
+
+
+class TestTailRecovery:
+    def test_tail_matches_last_event(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = write_metrics(path, 5)
+        tail = read_ledger_tail(path)
+        raw = path.read_bytes()
+        assert tail.last_hash == ledger.get_events()[-1]["hash"]
+        assert tail.end == len(raw)
+        assert json.loads(raw[tail.offset : tail.end])["hash"] == tail.last_hash
+
+    def test_tail_skips_trailing_blank_lines_and_long_lines(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        with Ledger(path) as ledger:
+            last = ledger.event("NOTE", {"text": "x" * 20000})
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write("\n   \n\n")
+        assert read_ledger_tail(path).last_hash == last.hash
+
+    def test_reopened_ledger_continues_chain(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_metrics(path, 3)
+        write_metrics(path, 2)
+        assert len(load_ledger(path)) == 5
+        assert verify_chain_from_file(path) is True
+
+    def test_malformed_tail_starts_new_chain(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"truncated":\n', encoding="utf-8")
+        assert read_ledger_tail(path).last_hash is None
+        assert Ledger(path)._prev_hash is None
+
+    def test_missing_or_blank_file_has_no_tail(self, tmp_path):
+        assert read_ledger_tail(tmp_path / "missing.jsonl") is None
+        (tmp_path / "blank.jsonl").write_text("\n\n", encoding="utf-8")
+        assert read_ledger_tail(tmp_path / "blank.jsonl") is None
+
+
+class TestTailSidecar:
+    def test_sidecar_records_tail_and_count(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = write_metrics(path, 4, tail_sidecar=True)
+        recorded = json.loads(ledger.sidecar_path.read_text(encoding="utf-8"))
+        tail = read_ledger_tail(path)
+        assert recorded == {
+            "hash": tail.last_hash,
+            "offset": tail.offset,
+            "end": tail.end,
+            "events": 4,
+        }
+        assert Ledger(path, tail_sidecar=True).persisted_events == 4
+
+    def test_appends_after_sidecar_are_counted(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_metrics(path, 3, tail_sidecar=True)
+        write_metrics(path, 2)  # schreibt ohne Sidecar weiter
+        reopened = Ledger(path, tail_sidecar=True)
+        assert reopened.persisted_events == 5
+        assert reopened._prev_hash == read_ledger_tail(path).last_hash
+
+    def test_inconsistent_sidecar_falls_back_to_full_count(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = write_metrics(path, 3, tail_sidecar=True)
+        recorded = json.loads(ledger.sidecar_path.read_text(encoding="utf-8"))
+        recorded["events"] = 99
+        recorded["hash"] = "0" * 64
+        ledger.sidecar_path.write_text(json.dumps(recorded), encoding="utf-8")
+        assert Ledger(path, tail_sidecar=True).persisted_events == 3
+
+    def test_rewritten_file_invalidates_sidecar(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_metrics(path, 3, tail_sidecar=True)
+        lines = path.read_text(encoding="utf-8").splitlines()
+        path.write_text(lines[0] + "\n", encoding="utf-8")
+        reopened = Ledger(path, tail_sidecar=True)
+        assert reopened.persisted_events == 1
+        assert reopened._prev_hash == json.loads(lines[0])["hash"]
+
+
+class TestSegments:
+    def test_rotation_by_event_count_chains_segments(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = write_metrics(path, 10, segment_max_events=4)
+        segments = load_segment_manifest(path)
+        assert [segment.name for segment in segments] == [
+            "events.000001.jsonl",
+            "events.000002.jsonl",
+        ]
+        assert [segment.events for segment in segments] == [4, 4]
+        assert segments[0].first_prev_hash is None
+        assert segments[1].first_prev_hash == segments[0].last_hash
+        hashes = [event["hash"] for event in ledger.get_events()]
+        assert [event["hash"] for event in load_ledger(path)] == hashes
+        assert verify_chain_from_file(path) is True
+        assert verify_chain_from_file(path, full=True) is True
+
+    def test_rotation_by_size(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_metrics(path, 6, segment_max_bytes=1)
+        segments = load_segment_manifest(path)
+        assert len(segments) == 6
+        assert not path.exists()
+        assert all(
+            segment.sha256 == hashlib.sha256((tmp_path / segment.name).read_bytes()).hexdigest()
+            for segment in segments
+        )
+        assert verify_chain_from_file(path, workers=2) is True
+
+    def test_reopened_ledger_chains_from_last_sealed_segment(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_metrics(path, 4, segment_max_events=4)
+        assert not path.exists()
+        write_metrics(path, 2)
+        assert len(load_ledger(path)) == 6
+        assert verify_chain_from_file(path) is True
+
+    def test_tampered_sealed_segment_fails(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_metrics(path, 6, segment_max_events=3)
+        sealed = tmp_path / "events.000001.jsonl"
+        sealed.write_bytes(sealed.read_bytes().replace(b'"value":1.0', b'"value":9.0'))
+        assert verify_chain_from_file(path) is False
+
+    def test_full_audit_rehashes_sealed_lines(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_metrics(path, 6, segment_max_events=3)
+        sealed = tmp_path / "events.000001.jsonl"
+        sealed.write_bytes(sealed.read_bytes().replace(b'"value":1.0', b'"value":9.0'))
+        manifest = segment_manifest_path(path)
+        data = json.loads(manifest.read_text(encoding="utf-8"))
+        data["segments"][0]["sha256"] = hashlib.sha256(sealed.read_bytes()).hexdigest()
+        manifest.write_text(json.dumps(data), encoding="utf-8")
+        # Nur die Manifest-Prüfsumme passt — die Zeilenhashes nicht:
+        assert verify_chain_from_file(path) is True
+        assert verify_chain_from_file(path, full=True) is False
+
+    def test_broken_manifest_link_fails(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_metrics(path, 6, segment_max_events=3)
+        manifest = segment_manifest_path(path)
+        data = json.loads(manifest.read_text(encoding="utf-8"))
+        data["segments"][1]["first_prev_hash"] = "0" * 64
+        manifest.write_text(json.dumps(data), encoding="utf-8")
+        assert verify_chain_from_file(path) is False
+        manifest.write_text("{", encoding="utf-8")
+        assert verify_chain_from_file(path) is False
+
+    def test_interrupted_seal_is_completed_on_open(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_metrics(path, 3)
+        # Absturz nach dem Umbenennen, vor dem Manifest-Update:
+        path.rename(tmp_path / "events.000001.jsonl")
+        ledger = Ledger(path, segment_max_events=3)
+        ledger.metric("after", 1.0)
+        ledger.close()
+        assert [segment.events for segment in load_segment_manifest(path)] == [3]
+        assert verify_chain_from_file(path) is True
+
+    def test_tampered_active_file_is_not_sealed(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_metrics(path, 2)
+        path.write_bytes(path.read_bytes().replace(b'"value":1.0', b'"value":9.0'))
+        ledger = Ledger(path, segment_max_events=3)
+        with pytest.raises(ValueError, match="broken hash chain"):
+            ledger.metric("mzm.phi", 2.0)
+        ledger.close()
+        # Nicht versiegelt: das Manifest bürgt nicht für die manipulierte Zeile.
+        assert load_segment_manifest(path) == []
+        assert not (tmp_path / "events.000001.jsonl").exists()
+        assert verify_chain_from_file(path) is False
+
+    def test_tampered_interrupted_seal_is_not_registered(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_metrics(path, 3)
+        orphan = tmp_path / "events.000001.jsonl"
+        path.rename(orphan)
+        orphan.write_bytes(orphan.read_bytes().replace(b'"value":1.0', b'"value":9.0'))
+        with pytest.raises(ValueError, match="broken hash chain"):
+            Ledger(path, segment_max_events=3)
+        assert load_segment_manifest(path) == []
+
+
+def batch(count, start=0):
+    return [{"type": "ROW", "payload": {"n": start + index}} for index in range(count)]
+
+
+class TestBatchEmission:
+    def test_batch_chains_like_single_events(self, tmp_path):
+        single = Ledger(tmp_path / "single.jsonl")
+        for index in range(4):
+            single.event("ROW", {"n": index}, event_id=f"e{index}", timestamp=1.0)
+        single.close()
+        batched = Ledger(tmp_path / "batched.jsonl")
+        specs = [dict(spec, event_id=f"e{n}", timestamp=1.0) for n, spec in enumerate(batch(4))]
+        events = batched.emit_many(specs)
+        batched.close()
+        assert [event.hash for event in events] == [e["hash"] for e in single.get_events()]
+        assert (tmp_path / "batched.jsonl").read_bytes() == (tmp_path / "single.jsonl").read_bytes()
+
+    def test_event_line_and_hash_match_reference_encoding(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(path)
+        with ledger.span("import"):
+            event = ledger.event("ROW", {"z": [1.5, None], "ä": "\u20ac", "a": {"y": 1, "b": 2}})
+        ledger.close()
+        stored = load_ledger(path)[1]
+        assert path.read_text(encoding="utf-8").splitlines()[1] == json.dumps(
+            stored, separators=(",", ":")
+        )
+        assert event.hash == stored["hash"] == event.compute_hash()
+
+    def test_invalid_item_appends_nothing(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(path)
+        ledger.emit_many(batch(2))
+        head = ledger._prev_hash
+        bad = batch(3, start=2) + [{"type": "ROW", "payload": {"x": float("nan")}}]
+        with pytest.raises(ValueError, match="batch item 3"):
+            ledger.emit_many(bad)
+        with pytest.raises(ValueError, match="unknown keys"):
+            ledger.emit_many([{"type": "ROW", "payload": {}, "hash": "x"}])
+        with pytest.raises(ValueError, match=r"batch item 1 is missing keys: \['payload'\]"):
+            ledger.emit_many([batch(1)[0], {"type": "ROW"}])
+        ledger.close()
+        assert ledger._prev_hash == head
+        assert line_count(path) == 2
+        assert len(ledger.get_events()) == 2
+        assert verify_chain_from_file(path) is True
+
+    def test_failed_write_leaves_chain_head_unchanged(self, tmp_path, monkeypatch):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(path)
+        ledger.emit_many(batch(2))
+        head, events = ledger._prev_hash, ledger.get_events()
+
+        def failing_write(lines, events):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(ledger, "_write_lines", failing_write)
+        with pytest.raises(OSError):
+            ledger.emit_many(batch(2, start=2))
+        with pytest.raises(OSError):
+            with ledger.transaction() as tx:
+                tx.event("ROW", {"n": 9})
+        assert ledger._prev_hash == head
+        assert ledger.get_events() == events
+        monkeypatch.undo()
+        ledger.metric("after", 1.0)
+        ledger.close()
+        assert line_count(path) == 3
+        assert verify_chain_from_file(path) is True
+
+    def test_failed_commit_cuts_the_unit_from_the_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(path, durability=DURABILITY_FSYNC, index=True)
+        ledger.emit_many(batch(2))
+        head = ledger._prev_hash
+
+        def failing_commit():
+            raise OSError("fsync failed")
+
+        monkeypatch.setattr(ledger, "_commit", failing_commit)
+        with pytest.raises(OSError, match="fsync failed"):
+            ledger.emit_many(batch(3, start=2))
+        monkeypatch.undo()
+        assert ledger._prev_hash == head
+        assert line_count(path) == 2
+        ledger.emit_many(batch(1, start=5))
+        ledger.close()
+        assert [event["payload"]["n"] for event in load_ledger(path)] == [0, 1, 5]
+        assert len(LedgerIndex(path)) == 3
+        assert verify_chain_from_file(path) is True
+
+    def test_batch_is_one_write_and_one_commit(self, tmp_path, monkeypatch):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(path, durability=DURABILITY_FSYNC)
+        ledger.metric("warmup", 0.0)
+        writes, commits = [], []
+        original_commit = ledger._commit
+        monkeypatch.setattr(ledger._file, "write", writes.append)
+        monkeypatch.setattr(ledger, "_commit", lambda: commits.append(original_commit()))
+        ledger.emit_many(batch(50))
+        assert len(writes) == 1 and writes[0].count("\n") == 50
+        assert len(commits) == 1
+
+    def test_transaction_commits_on_success_only(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(path)
+        with pytest.raises(RuntimeError):
+            with ledger.transaction() as tx:
+                tx.event("ROW", {"n": 0})
+                raise RuntimeError("abort")
+        assert line_count(path) == 0
+        with ledger.span("import") as span_id:
+            with ledger.transaction() as tx:
+                first = tx.event("ROW", {"n": 1})
+                tx.event("ROW", {"n": 2})
+                assert first.hash is None and len(tx) == 2
+        ledger.close()
+        assert first.hash is not None and first.span_id == span_id
+        assert [event["type"] for event in load_ledger(path)] == [
+            "span_start",
+            "ROW",
+            "ROW",
+            "span_end",
+        ]
+        assert verify_chain_from_file(path) is True
+
+    def test_batch_rotates_after_last_line(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        ledger = Ledger(path, segment_max_events=3)
+        ledger.emit_many(batch(5))
+        ledger.emit_many(batch(2, start=5))
+        ledger.close()
+        assert [segment.events for segment in load_segment_manifest(path)] == [5]
+        assert line_count(path) == 2
+        assert verify_chain_from_file(path, full=True) is True
+
+
+def append_shared(path, producer, count):
+    with Ledger(path, shared=True) as ledger:
+        for index in range(count):
+            ledger.metric(f"producer{producer}", float(index))
+
+
+class TestSharedAppends:
+    def test_interleaved_writers_keep_one_chain(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        first = Ledger(path, shared=True)
+        second = Ledger(path, shared=True, durability=DURABILITY_GROUP, commit_interval_ms=1e9)
+        for index in range(5):
+            first.metric("first", float(index))
+            second.emit_many(batch(2, start=index * 2))
+        first.close()
+        second.close()
+        assert line_count(path) == 15
+        assert verify_chain_from_file(path) is True
+
+    def test_unshared_writers_fork_the_chain(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        first, second = Ledger(path), Ledger(path)
+        first.metric("first", 1.0)
+        second.metric("second", 1.0)
+        first.close()
+        second.close()
+        assert verify_chain_from_file(path) is False
+
+    def test_window_restarts_after_foreign_append(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        mine = Ledger(path, shared=True)
+        mine.metric("mine", 1.0)
+        other = Ledger(path, shared=True)
+        other.metric("other", 1.0)
+        mine.metric("mine", 2.0)
+        assert [event["payload"]["value"] for event in mine.get_events()] == [2.0]
+        assert mine.anchor_hash == other._prev_hash
+        assert mine.verify_chain() is True
+        mine.close()
+        other.close()
+
+    def test_rotation_by_another_writer_is_followed(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        first = Ledger(path, shared=True, segment_max_bytes=400)
+        second = Ledger(path, shared=True, segment_max_bytes=400)
+        for index in range(12):
+            (first if index % 3 else second).metric("m", float(index))
+        first.close()
+        second.close()
+        assert len(load_segment_manifest(path)) >= 2
+        assert verify_chain_from_file(path, full=True) is True
+
+    def test_concurrent_processes(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=append_shared, args=(str(path), producer, 40))
+            for producer in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            assert worker.exitcode == 0
+        assert line_count(path) == 160
+        assert verify_chain_from_file(path) is True
+
+    def test_env_enables_shared_mode(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ENTA_LEDGER_PATH", str(tmp_path / "events.jsonl"))
+        monkeypatch.setenv("ENTA_LEDGER_SHARED", "1")
+        ledger = create_ledger_from_env()
+        assert ledger is not None and ledger.shared
+        assert ledger.lock_path == tmp_path / "events.jsonl.lock"
+
+    @pytest.mark.parametrize(
+        "options",
+        [{}, {"tail_sidecar": True}, {"index": True}, {"segment_max_events": 10}],
+    )
+    def test_unsupported_combinations_fail(self, tmp_path, options):
+        path = None if not options else tmp_path / "events.jsonl"
+        with pytest.raises(ValueError):
+            Ledger(path, shared=True, **options)
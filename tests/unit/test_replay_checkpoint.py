@@ -0,0 +1,188 @@
+"""Unit-Tests für Replay-Checkpoints (src/core/replay_checkpoint.py)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core.evidence_routing import (
+    DEFAULT_CLAIM_POLICY_PATH,
+    EvidenceRoutingError,
+    ReasonCode,
+    load_claim_policy,
+    replay_jsonl,
+)
+from src.core.ledger import Ledger, load_segment_manifest
+from src.core.replay_checkpoint import (
+    replay_checkpoint_from_dict,
+    restore_replay_state,
+    resume_replay_jsonl,
+)
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "erk"
+
+
+def fixture_events(name):
+    with open(FIXTURES / name, encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def append_events(path, events, **options):
+    ledger = Ledger(path, **options)
+    for event in events:
+        ledger.event(
+            event["type"],
+            event["payload"],
+            event_id=event["event_id"],
+            timestamp=event["timestamp"],
+        )
+    ledger.close()
+
+
+def split_ledger(tmp_path, name="retraction_non_destructive.jsonl", head=4):
+    """Ledger mit den ersten ``head`` Events schreiben; Rest zum Anhängen zurückgeben."""
+    events = fixture_events(name)
+    path = tmp_path / "erk_events.jsonl"
+    append_events(path, events[:head])
+    return path, events[head:]
+
+
+class TestResume:
+    def test_without_checkpoints_replays_everything(self, tmp_path):
+        path, rest = split_ledger(tmp_path)
+        append_events(path, rest)
+        result = resume_replay_jsonl(path)
+        assert result.resumed_from is None
+        assert result.events_applied == 8
+        assert result.state == replay_jsonl(path)
+
+    def test_resume_applies_only_appended_events(self, tmp_path):
+        path, rest = split_ledger(tmp_path)
+        checkpoint = resume_replay_jsonl(path).to_checkpoint()
+        append_events(path, rest)
+
+        result = resume_replay_jsonl(path, [checkpoint])
+        assert result.resumed_from == checkpoint
+        assert result.events_applied == len(rest)
+        full = replay_jsonl(path)
+        assert result.state == full
+        assert result.state.state_digest == full.state_digest
+        # Guard-Sichten und Indizes wurden beim Restore neu aufgebaut; Retag griff:
+        assert result.state.current_tag("clm-001") == "[MODEL]"
+        assert result.state.human_decisions_for_request("req-001") == (
+            full.human_decisions_for_request("req-001")
+        )
+        assert result.state.relations_for_claim("clm-001") == full.relations_for_claim("clm-001")
+
+    def test_newest_valid_checkpoint_wins(self, tmp_path):
+        path, rest = split_ledger(tmp_path, head=2)
+        older = resume_replay_jsonl(path).to_checkpoint()
+        append_events(path, rest[:3])
+        newer = resume_replay_jsonl(path, [older]).to_checkpoint()
+        append_events(path, rest[3:])
+
+        result = resume_replay_jsonl(path, [older, newer])
+        assert result.resumed_from == newer
+        assert result.events_applied == len(rest) - 3
+        assert result.state == replay_jsonl(path)
+
+    def test_checkpoint_from_foreign_chain_is_ignored(self, tmp_path):
+        path, rest = split_ledger(tmp_path)
+        other, _ = split_ledger(tmp_path / "other", name="allowed_proposal.jsonl")
+        foreign = resume_replay_jsonl(other).to_checkpoint()
+        append_events(path, rest)
+
+        result = resume_replay_jsonl(path, [foreign])
+        assert result.resumed_from is None
+        assert result.state == replay_jsonl(path)
+
+    def test_checkpoint_under_other_policy_is_ignored(self, tmp_path):
+        path, rest = split_ledger(tmp_path)
+        drifted_path = tmp_path / "claim_tags_drift.yaml"
+        drifted_path.write_bytes(DEFAULT_CLAIM_POLICY_PATH.read_bytes() + b"\n# drift\n")
+        drifted = resume_replay_jsonl(path, policy=load_claim_policy(drifted_path))
+        append_events(path, rest)
+
+        result = resume_replay_jsonl(path, [drifted.to_checkpoint()])
+        assert result.resumed_from is None
+
+    def test_tampered_checkpoint_state_is_discarded(self, tmp_path):
+        path, rest = split_ledger(tmp_path)
+        data = resume_replay_jsonl(path).to_checkpoint().to_dict()
+        data["state"]["claims"]["clm-001"]["current_tag"] = "[CANON]"
+        append_events(path, rest)
+
+        result = resume_replay_jsonl(path, [replay_checkpoint_from_dict(data)])
+        assert result.resumed_from is None
+        assert result.state == replay_jsonl(path)
+
+    def test_rewritten_file_relocates_checkpoint_by_hash(self, tmp_path):
+        path, rest = split_ledger(tmp_path)
+        checkpoint = resume_replay_jsonl(path).to_checkpoint()
+        append_events(path, rest)
+        # Gleiche Kette, andere Byte-Positionen (z.B. nach Re-Serialisierung):
+        lines = path.read_text(encoding="utf-8").splitlines()
+        path.write_text("".join(f"{line}   \n" for line in lines), encoding="utf-8")
+
+        result = resume_replay_jsonl(path, [checkpoint])
+        assert result.resumed_from == checkpoint
+        assert result.events_applied == len(rest)
+        assert result.state == replay_jsonl(path)
+
+    def test_rotated_ledger_replays_sealed_segments_first(self, tmp_path):
+        events = fixture_events("retraction_non_destructive.jsonl")
+        plain, rotated = tmp_path / "plain.jsonl", tmp_path / "rotated.jsonl"
+        append_events(plain, events)
+        append_events(rotated, events, segment_max_events=3)
+        assert len(load_segment_manifest(rotated)) == 2
+        full = replay_jsonl(plain)
+        assert replay_jsonl(rotated) == full
+        assert replay_jsonl(str(rotated)).state_digest == full.state_digest
+        result = resume_replay_jsonl(rotated)
+        assert result.events_applied == len(events)
+        assert result.state == full
+
+    def test_checkpoint_survives_rotation(self, tmp_path):
+        path, rest = split_ledger(tmp_path)
+        checkpoint = resume_replay_jsonl(path).to_checkpoint()
+        # Die aktive Datei mit dem Checkpoint-Event wird zum ersten Segment:
+        append_events(path, rest, segment_max_events=3)
+        assert load_segment_manifest(path)
+
+        result = resume_replay_jsonl(path, [checkpoint])
+        assert result.resumed_from == checkpoint
+        assert result.events_applied == len(rest)
+        assert result.state == replay_jsonl(path)
+
+    def test_tail_without_hash_cannot_be_checkpointed(self, tmp_path):
+        path = tmp_path / "fixture.jsonl"
+        path.write_bytes((FIXTURES / "allowed_proposal.jsonl").read_bytes())
+        result = resume_replay_jsonl(path)
+        assert result.last_event_hash is None
+        with pytest.raises(EvidenceRoutingError):
+            result.to_checkpoint()
+
+
+class TestCheckpointSchema:
+    def test_roundtrip_through_json(self, tmp_path):
+        path, _ = split_ledger(tmp_path)
+        checkpoint = resume_replay_jsonl(path).to_checkpoint()
+        restored = replay_checkpoint_from_dict(json.loads(json.dumps(checkpoint.to_dict())))
+        assert restored == checkpoint
+
+    def test_unknown_field_fails_closed(self, tmp_path):
+        path, _ = split_ledger(tmp_path)
+        data = resume_replay_jsonl(path).to_checkpoint().to_dict()
+        data["note"] = "not part of the schema"
+        with pytest.raises(EvidenceRoutingError) as excinfo:
+            replay_checkpoint_from_dict(data)
+        assert ReasonCode.EVENT_SCHEMA_INVALID in excinfo.value.reason_codes
+
+    def test_restore_rejects_policy_drift(self, tmp_path):
+        path, _ = split_ledger(tmp_path)
+        checkpoint = resume_replay_jsonl(path).to_checkpoint()
+        drifted_path = tmp_path / "claim_tags_drift.yaml"
+        drifted_path.write_bytes(DEFAULT_CLAIM_POLICY_PATH.read_bytes() + b"\n# drift\n")
+        with pytest.raises(EvidenceRoutingError) as excinfo:
+            restore_replay_state(checkpoint, policy=load_claim_policy(drifted_path))
+        assert ReasonCode.POLICY_DIGEST_MISMATCH in excinfo.value.reason_codes
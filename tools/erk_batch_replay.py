@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""ERK Batch-Replay — viele unabhängige Eventstreams parallel replayen.
+
+Nimmt JSONL-Streams oder Verzeichnisse (alle ``*.jsonl`` darin, sortiert),
+replayt sie über einen Prozess-Pool gegen eine einmal geladene Claim-Policy
+und berichtet je Stream ``state_digest`` und Ablehnungen in Eingabereihenfolge.
+
+Grenzen:
+  - Streams werden nur gelesen; geschrieben wird höchstens der Report
+    (geschützte Repo-Pfade sind ausgeschlossen).
+  - Der Report ist unabhängig von ``--workers``/``--chunksize``; nur
+    Zeitüberschreitungen (``--timeout``) können ihn verändern und stehen
+    dann als TIMEOUT darin.
+  - Exit-Code 1, sobald ein Stream nicht lesbar war oder nicht fertig wurde.
+
+Usage:
+    python tools/erk_batch_replay.py tests/fixtures/erk
+        [--workers 4] [--chunksize 8] [--timeout 600] [--out out/erk/batch_report.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+try:
+    from src.core.batch_replay import STREAM_OK, BatchReplayReport, replay_streams
+    from src.core.evidence_routing import DEFAULT_CLAIM_POLICY_PATH, load_claim_policy
+    from src.core.ledger import load_segment_manifest
+    from tools.erk_paths import ensure_erk_write_path
+except ModuleNotFoundError:  # Standalone-Aufruf ohne editable Install
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from src.core.batch_replay import STREAM_OK, BatchReplayReport, replay_streams
+    from src.core.evidence_routing import DEFAULT_CLAIM_POLICY_PATH, load_claim_policy
+    from src.core.ledger import load_segment_manifest
+    from tools.erk_paths import ensure_erk_write_path
+
+_MANIFEST_SUFFIX = ".manifest.json"
+
+
+def collect_streams(inputs: list[str]) -> list[Path]:
+    """Eingaben zu Stream-Pfaden auflösen; Verzeichnisse liefern ihre ``*.jsonl``.
+
+    Ein rotierter Ledger ist ein Stream: seine versiegelten Segmente werden
+    nicht einzeln gelistet, sondern über den Ledger-Pfad mitgelesen.
+    """
+    streams: list[Path] = []
+    for raw in inputs:
+        path = Path(raw)
+        if path.is_dir():
+            streams.extend(_directory_streams(path))
+        else:
+            streams.append(path)
+    return streams
+
+
+def _directory_streams(directory: Path) -> list[Path]:
+    files = set(directory.glob("*.jsonl"))
+    for manifest in directory.glob(f"*{_MANIFEST_SUFFIX}"):
+        ledger = manifest.with_name(manifest.name[: -len(_MANIFEST_SUFFIX)] + ".jsonl")
+        try:
+            segments = load_segment_manifest(ledger)
+        except (OSError, ValueError):
+            segments = []  # Replay des Ledgers meldet das Manifest dann als ERROR
+        files -= {directory / segment.name for segment in segments}
+        files.add(ledger)
+    return sorted(files)
+
+
+def write_report(report: BatchReplayReport, target: Path) -> Path:
+    """Report als kanonisches JSON ablegen."""
+    target = ensure_erk_write_path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(
+        json.dumps(report.to_dict(), sort_keys=True, separators=(",", ":")) + "\n",
+        encoding="utf-8",
+    )
+    return target
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ERK-Streams parallel replayen")
+    parser.add_argument("inputs", nargs="+", help="JSONL-Streams oder Verzeichnisse")
+    parser.add_argument("--policy", default=str(DEFAULT_CLAIM_POLICY_PATH), help="Claim-Policy")
+    parser.add_argument("--workers", type=int, default=None, help="Worker (0/1 = seriell)")
+    parser.add_argument("--chunksize", type=int, default=1, help="Streams pro Aufgabe")
+    parser.add_argument("--timeout", type=float, default=None, help="Zeitbudget in Sekunden")
+    parser.add_argument("--out", default=None, help="Report als JSON schreiben")
+    args = parser.parse_args()
+
+    streams = collect_streams(args.inputs)
+    if not streams:
+        raise SystemExit("[erk-batch] keine Streams gefunden")
+
+    report = replay_streams(
+        streams,
+        policy=load_claim_policy(Path(args.policy)),
+        workers=args.workers,
+        chunksize=args.chunksize,
+        timeout=args.timeout,
+    )
+    for summary in report.streams:
+        if summary.status == STREAM_OK and summary.state_digest is not None:
+            print(
+                f"[erk-batch] {summary.status:<7} {summary.stream} "
+                f"digest={summary.state_digest[:16]} rejected={summary.rejected_events}"
+            )
+        else:
+            print(f"[erk-batch] {summary.status:<7} {summary.stream} {summary.error}")
+    totals = report.totals
+    print(
+        f"[erk-batch] streams={totals['streams']} ok={totals['ok']} "
+        f"error={totals['error']} timeout={totals['timeout']} "
+        f"rejected_events={totals['rejected_events']}"
+    )
+    print(f"[erk-batch] report_digest={report.report_digest}")
+    if args.out is not None:
+        print(f"[erk-batch] report -> {write_report(report, Path(args.out))}")
+    if not report.ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
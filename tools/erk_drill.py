@@ -20,29 +20,18 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Any
 
 try:
-    from src.core.evidence_routing import ReplayState, replay_events
+    from src.core.evidence_routing import ReplayState, replay_jsonl
 except ModuleNotFoundError:  # Standalone-Aufruf ohne editable Install
     import sys
 
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-    from src.core.evidence_routing import ReplayState, replay_events
+    from src.core.evidence_routing import ReplayState, replay_jsonl
 
 DEFAULT_FIXTURES = Path("tests") / "fixtures" / "erk"
 
 
-def _load_fixture(path: Path) -> list[dict[str, Any]]:
-    events: list[dict[str, Any]] = []
-    with path.open(encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if line:
-                events.append(json.loads(line))
-    return events
-
-
 def _check_allowed_proposal(state: ReplayState) -> list[str]:
     problems = []
     if state.current_tag("clm-001") != "[HYPOTHESE]":
@@ -133,7 +122,7 @@ def run_drills(fixtures_dir: Path) -> bool:
             print(f"[erk-drill] FEHLT   {name} — Fixture nicht gefunden")
             all_ok = False
             continue
-        state = replay_events(_load_fixture(path))
+        state = replay_jsonl(path)
         problems = check(state)
         if problems:
             all_ok = False
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""ERK Replay-Checkpoint — Ledger ab dem letzten gültigen Snapshot replayen.
+
+Liest einen ERK-JSONL-Eventstream und ein Checkpoint-Verzeichnis, setzt den
+Replay beim neuesten Checkpoint fort, dessen Ledger-Hash noch in der Kette
+steht, und legt für den erreichten Zustand einen neuen Checkpoint ab.
+
+Grenzen:
+  - Der Eventstream wird nur gelesen; geschrieben wird ausschließlich in das
+    Checkpoint-Verzeichnis (geschützte Repo-Pfade sind ausgeschlossen).
+  - Ein Checkpoint ist Cache, keine Quelle: unlesbare oder driftende
+    Checkpoints werden übersprungen, nie repariert.
+  - Die Integrität der Kette prüft ``verify_chain_from_file``, nicht dieses Tool.
+
+Usage:
+    python tools/erk_replay_checkpoint.py --stream out/erk/erk_events.jsonl
+        [--checkpoints out/erk/checkpoints]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+try:
+    from src.core.evidence_routing import EvidenceRoutingError
+    from src.core.replay_checkpoint import (
+        ReplayCheckpoint,
+        ResumedReplay,
+        replay_checkpoint_from_dict,
+        resume_replay_jsonl,
+    )
+    from tools.erk_paths import ensure_erk_write_path
+except ModuleNotFoundError:  # Standalone-Aufruf ohne editable Install
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from src.core.evidence_routing import EvidenceRoutingError
+    from src.core.replay_checkpoint import (
+        ReplayCheckpoint,
+        ResumedReplay,
+        replay_checkpoint_from_dict,
+        resume_replay_jsonl,
+    )
+    from tools.erk_paths import ensure_erk_write_path
+
+DEFAULT_CHECKPOINT_DIR = Path("out") / "erk" / "checkpoints"
+
+
+def load_checkpoints(directory: Path) -> list[ReplayCheckpoint]:
+    """Alle lesbaren Checkpoints eines Verzeichnisses laden; Rest überspringen."""
+    checkpoints: list[ReplayCheckpoint] = []
+    if not directory.is_dir():
+        return checkpoints
+    for path in sorted(directory.glob("*.json")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            checkpoints.append(replay_checkpoint_from_dict(data))
+        except (OSError, ValueError) as exc:  # EvidenceRoutingError ist ein ValueError
+            print(f"[erk-checkpoint] übersprungen {path.name}: {exc}")
+    return checkpoints
+
+
+def write_checkpoint(checkpoint: ReplayCheckpoint, directory: Path) -> Path:
+    """Checkpoint unter einem positions- und hashbasierten Namen ablegen."""
+    name = f"checkpoint-{checkpoint.line_number:09d}-{checkpoint.last_event_hash[:16]}.json"
+    target = ensure_erk_write_path(directory / name)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(
+        json.dumps(checkpoint.to_dict(), sort_keys=True, separators=(",", ":")) + "\n",
+        encoding="utf-8",
+    )
+    return target
+
+
+def replay_with_checkpoints(stream: Path, directory: Path) -> tuple[ResumedReplay, Path | None]:
+    """Replay fortsetzen und, falls möglich, einen neuen Checkpoint schreiben."""
+    result = resume_replay_jsonl(stream, load_checkpoints(directory))
+    if result.events_applied == 0 and result.resumed_from is not None:
+        return result, None
+    try:
+        checkpoint = result.to_checkpoint()
+    except EvidenceRoutingError:
+        return result, None
+    return result, write_checkpoint(checkpoint, directory)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ERK-Stream mit Replay-Checkpoints replayen")
+    parser.add_argument("--stream", required=True, help="Pfad zum ERK-JSONL-Eventstream")
+    parser.add_argument(
+        "--checkpoints", default=str(DEFAULT_CHECKPOINT_DIR), help="Checkpoint-Verzeichnis"
+    )
+    args = parser.parse_args()
+
+    stream = Path(args.stream)
+    if not stream.is_file():
+        raise SystemExit(f"[erk-checkpoint] stream not found: {stream}")
+
+    result, written = replay_with_checkpoints(stream, Path(args.checkpoints))
+    if result.resumed_from is None:
+        print("[erk-checkpoint] kein gültiger Checkpoint — vollständiger Replay")
+    else:
+        print(f"[erk-checkpoint] fortgesetzt ab Zeile {result.resumed_from.line_number}")
+    print(f"[erk-checkpoint] events_applied={result.events_applied}")
+    print(f"[erk-checkpoint] state_digest={result.state.state_digest}")
+    if written is not None:
+        print(f"[erk-checkpoint] checkpoint -> {written}")
+
+
+if __name__ == "__main__":
+    main()
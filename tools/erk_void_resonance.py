@@ -24,7 +24,6 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 from collections import Counter
 from pathlib import Path
 from typing import Any
@@ -33,12 +32,14 @@ import yaml
 
 try:
     from src.core.evidence_routing import ReplayState, replay_events
+    from src.core.ledger import iter_ledger
     from tools.erk_paths import ensure_erk_write_path
 except ModuleNotFoundError:  # Standalone-Aufruf ohne editable Install
     import sys
 
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
     from src.core.evidence_routing import ReplayState, replay_events
+    from src.core.ledger import iter_ledger
     from tools.erk_paths import ensure_erk_write_path
 
 OPENISH_STATUSES = ("OPEN", "IN_PROGRESS", "SUSPENDED")
@@ -46,19 +47,7 @@ OPENISH_STATUSES = ("OPEN", "IN_PROGRESS", "SUSPENDED")
 
 def load_stream(path: Path) -> list[dict[str, Any]]:
     """JSONL-Eventstream tolerant einlesen (Integritätsfragen klärt der Ledger)."""
-    events: list[dict[str, Any]] = []
-    if not path.exists():
-        return events
-    with path.open(encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                events.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return events
+    return list(iter_ledger(path))
 
 
 def load_voidmap_summary(path: Path) -> dict[str, Any]:
@@ -155,7 +144,8 @@ def main() -> None:
     if not voidmap_path.is_file():
         raise SystemExit(f"[erk-void] VOIDMAP not found: {voidmap_path}")
 
-    state = replay_events(load_stream(Path(args.stream)))
+    # Lazy streamen: Speicher wächst mit dem Zustand, nicht mit dem Stream.
+    state = replay_events(iter_ledger(Path(args.stream)))
     report = render_report(load_voidmap_summary(voidmap_path), void_claim_resonance(state))
 
     if args.out:
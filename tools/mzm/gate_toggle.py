@@ -152,6 +152,7 @@ def main(argv: list[str]) -> int:
         ENTA_LEDGER_PATH: Path to ledger file
         ENTA_RUN_ID: Run identifier
         ENTA_STATIC_MANIFEST_SHA256: Manifest hash
+        ENTA_LEDGER_SHARED: Set to "1" or "true" when several processes share the ledger
         ENTA_GATE_STRICT: Set to "1" or "true" for strict mode
 
     Args:
@@ -188,16 +189,9 @@ def main(argv: list[str]) -> int:
     policy = load_policy()
 
     # Setup ledger from environment
-    ledger = None
-    ledger_path = os.environ.get("ENTA_LEDGER_PATH")
-    if ledger_path:
-        from src.core.ledger import Ledger
-
-        ledger = Ledger(
-            path=ledger_path,
-            run_id=os.environ.get("ENTA_RUN_ID"),
-            manifest_sha256=os.environ.get("ENTA_STATIC_MANIFEST_SHA256"),
-        )
+    from src.core.ledger import create_ledger_from_env
+
+    ledger = create_ledger_from_env()
 
     # Check strict mode from environment
     strict = os.environ.get("ENTA_GATE_STRICT", "").lower() in {"1", "true", "yes", "on"}